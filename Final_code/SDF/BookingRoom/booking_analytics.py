@@ -0,0 +1,179 @@
+import calendar
+from datetime import date, datetime, timedelta
+import json
+import os
+
+from BookingRoom.booking_index import to_minutes
+from BookingRoom.file_lock import FileLock
+from BookingRoom.slot_bitmap import SLOT_COUNT, SLOT_LABELS, interval_mask, slot_indexes
+
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+LATE_CANCEL_HOURS = 24  # Cancelling closer to the start than this counts as late
+
+
+def month_span(first_month, last_month):
+    """'YYYY-MM' keys from first_month to last_month inclusive"""
+    year, month = int(first_month[:4]), int(first_month[5:7])
+    months = []
+    while f"{year}-{month:02d}" <= last_month:
+        months.append(f"{year}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def weekdays_in_month(month_key):
+    """How many Mondays, Tuesdays, ... a 'YYYY-MM' month has"""
+    year, month = int(month_key[:4]), int(month_key[5:7])
+    counts = [0] * 7
+    first_weekday, days = calendar.monthrange(year, month)
+    for day in range(days):
+        counts[(first_weekday + day) % 7] += 1
+    return counts
+
+
+class UtilizationRollups:
+    """Booked half-hour slots rolled up per month, room, weekday and slot.
+
+    Each month keeps, per room, a 7 x SLOT_COUNT grid of booked-slot counts
+    plus a booking count. add() and remove() touch only the cells a booking
+    covers, so reports over years of history sum a few grids per month
+    instead of rescanning every booking.
+    """
+
+    def __init__(self, bookings=()):
+        self.grids = {}     # 'YYYY-MM' -> room -> [weekday * SLOT_COUNT + slot] -> booked count
+        self.bookings = {}  # 'YYYY-MM' -> room -> number of bookings
+        for booking in bookings:
+            self.add(booking)
+
+    def _apply(self, booking, delta):
+        month = booking['date'][:7]
+        room = booking['room']
+        offset = date.fromisoformat(booking['date']).weekday() * SLOT_COUNT
+        grid = self.grids.setdefault(month, {}).setdefault(room, [0] * (7 * SLOT_COUNT))
+        for slot in slot_indexes(interval_mask(to_minutes(booking['start_time']),
+                                               to_minutes(booking['end_time']))):
+            grid[offset + slot] += delta
+
+        counts = self.bookings.setdefault(month, {})
+        counts[room] = counts.get(room, 0) + delta
+
+    def add(self, booking):
+        self._apply(booking, 1)
+
+    def remove(self, booking):
+        self._apply(booking, -1)
+
+    # ---------------------- Reports ----------------------
+    def _grids(self, months, room_names=None):
+        for month in months:
+            for room, grid in self.grids.get(month, {}).items():
+                if room_names is None or room in room_names:
+                    yield month, room, grid
+
+    def heatmap(self, first_month, last_month, room_names=None):
+        """7 x SLOT_COUNT booked-slot totals (weekday rows, slot columns)"""
+        totals = [0] * (7 * SLOT_COUNT)
+        for month, room, grid in self._grids(month_span(first_month, last_month), room_names):
+            for i, count in enumerate(grid):
+                totals[i] += count
+        return [totals[day * SLOT_COUNT:(day + 1) * SLOT_COUNT] for day in range(7)]
+
+    def occupancy_by_room(self, first_month, last_month, room_names):
+        """Share of each room's bookable slots that were booked, 0.0 - 1.0"""
+        months = month_span(first_month, last_month)
+        capacity = sum(sum(weekdays_in_month(month)) for month in months) * SLOT_COUNT
+        booked = {room: 0 for room in room_names}
+        for month, room, grid in self._grids(months, booked):
+            booked[room] += sum(grid)
+        return {room: count / capacity if capacity else 0.0 for room, count in booked.items()}
+
+    def occupancy_by_weekday(self, first_month, last_month, room_names):
+        """Share of booked slots per weekday, across the given rooms"""
+        months = month_span(first_month, last_month)
+        day_counts = [0] * 7
+        for month in months:
+            for day, count in enumerate(weekdays_in_month(month)):
+                day_counts[day] += count
+        heat = self.heatmap(first_month, last_month, set(room_names))
+        result = {}
+        for day, name in enumerate(WEEKDAYS):
+            capacity = day_counts[day] * SLOT_COUNT * len(room_names)
+            result[name] = sum(heat[day]) / capacity if capacity else 0.0
+        return result
+
+    def occupancy_by_slot(self, first_month, last_month, room_names):
+        """Share of booked room-days per half-hour slot, keyed by 'HH:MM-HH:MM'"""
+        months = month_span(first_month, last_month)
+        capacity = sum(sum(weekdays_in_month(month)) for month in months) * len(room_names)
+        heat = self.heatmap(first_month, last_month, set(room_names))
+        result = {}
+        for slot, (start, end) in enumerate(SLOT_LABELS):
+            booked = sum(heat[day][slot] for day in range(7))
+            result[f"{start}-{end}"] = booked / capacity if capacity else 0.0
+        return result
+
+    def peak_slots(self, first_month, last_month, room_names=None, top=5):
+        """The busiest (weekday, slot label, booked count) cells, busiest first"""
+        heat = self.heatmap(first_month, last_month, room_names)
+        cells = [(heat[day][slot], day, slot) for day in range(7) for slot in range(SLOT_COUNT) if heat[day][slot]]
+        cells.sort(key=lambda cell: (-cell[0], cell[1], cell[2]))
+        return [(WEEKDAYS[day], f"{SLOT_LABELS[slot][0]}-{SLOT_LABELS[slot][1]}", count)
+                for count, day, slot in cells[:top]]
+
+    def booking_counts(self, first_month, last_month):
+        totals = {}
+        for month in month_span(first_month, last_month):
+            for room, count in self.bookings.get(month, {}).items():
+                totals[room] = totals.get(room, 0) + count
+        return totals
+
+
+class LateCancellations:
+    """Per-student count of last-minute cancellations, kept in a small JSON file.
+
+    The booking files forget cancelled bookings, so this is the only record
+    of who tends to book and then not turn up.
+    """
+
+    def __init__(self, counts_file):
+        self.counts_file = counts_file
+        self.lock = FileLock(counts_file + ".lock")
+        self.counts = self._read()
+
+    def _read(self):
+        if not os.path.exists(self.counts_file):
+            return {}
+        try:
+            with open(self.counts_file, 'r') as f:
+                return json.load(f)
+        except ValueError:
+            return {}
+
+    def is_late(self, booking, now=None):
+        now = now or datetime.now()
+        start = datetime.strptime(f"{booking['date']} {booking['start_time']}", "%Y-%m-%d %H:%M")
+        return start - now < timedelta(hours=LATE_CANCEL_HOURS)
+
+    def record(self, booking, now=None):
+        if not booking.get('student_id') or not self.is_late(booking, now):
+            return
+        student_id = booking['student_id']
+        with self.lock:
+            # Another app instance may have recorded cancellations since we loaded
+            self.counts = self._read()
+            self.counts[student_id] = self.counts.get(student_id, 0) + 1
+            tmp_file = self.counts_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(self.counts, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.counts_file)
+
+    def no_show_candidates(self, upcoming, min_late=2):
+        """Upcoming bookings held by students with at least `min_late` late cancellations"""
+        candidates = [dict(booking, late_cancellations=self.counts[booking['student_id']])
+                      for booking in upcoming
+                      if self.counts.get(booking.get('student_id'), 0) >= min_late]
+        candidates.sort(key=lambda b: (-b['late_cancellations'], b['date'], b['start_time']))
+        return candidates
@@ -0,0 +1,94 @@
+import gzip
+import json
+import os
+import stat
+
+
+class BookingArchive:
+    """Past months of bookings, one compressed read-only file per month.
+
+    archive/bookings-YYYY-MM.json.gz holds a month's bookings and
+    archive/index.json keeps per-month date counts and the highest id, so the
+    calendar can show archived months without opening the archive files.
+    A month's bookings are only decompressed when someone asks for them.
+    """
+
+    def __init__(self, archive_dir):
+        self.archive_dir = archive_dir
+        self.index_file = os.path.join(archive_dir, "index.json")
+        self.cache = {}  # 'YYYY-MM' -> bookings, filled on demand
+        self.index = {}
+        if os.path.exists(self.index_file):
+            with open(self.index_file, 'r') as f:
+                self.index = json.load(f)
+
+    def _month_file(self, month_key):
+        return os.path.join(self.archive_dir, f"bookings-{month_key}.json.gz")
+
+    def months(self):
+        return sorted(self.index)
+
+    def __contains__(self, month_key):
+        return month_key in self.index
+
+    def month_counts(self, month_key):
+        return dict(self.index.get(month_key, {}).get("counts", {}))
+
+    def max_id(self):
+        return max((entry["max_id"] for entry in self.index.values()), default=0)
+
+    def load(self, month_key):
+        """Bookings of one archived month, sorted by (date, start_time)"""
+        if month_key not in self.index:
+            return []
+        if month_key not in self.cache:
+            with gzip.open(self._month_file(month_key), 'rt', encoding='utf-8') as f:
+                self.cache[month_key] = json.load(f)
+        return self.cache[month_key]
+
+    def _write_atomic(self, path, write, opener=open):
+        tmp_file = path + ".tmp"
+        with opener(tmp_file, 'wt') as f:
+            write(f)
+        # Archive files are read-only; make room for the replacement first
+        if os.path.exists(path):
+            os.chmod(path, stat.S_IREAD | stat.S_IWRITE)
+        os.replace(tmp_file, path)
+
+    def add(self, bookings):
+        """Move bookings into their month files, merging with what is already archived.
+
+        Merging by id makes this safe to repeat after a crash halfway through.
+        """
+        os.makedirs(self.archive_dir, exist_ok=True)
+        by_month = {}
+        for booking in bookings:
+            by_month.setdefault(booking['date'][:7], []).append(booking)
+
+        for month_key, new_bookings in by_month.items():
+            merged = {booking['id']: booking for booking in self.load(month_key)}
+            merged.update((booking['id'], booking) for booking in new_bookings)
+            month_bookings = sorted(merged.values(), key=lambda x: (x['date'], x['start_time']))
+
+            path = self._month_file(month_key)
+            self._write_atomic(path, lambda f: json.dump(month_bookings, f), gzip.open)
+            os.chmod(path, stat.S_IREAD)
+
+            counts = {}
+            for booking in month_bookings:
+                counts[booking['date']] = counts.get(booking['date'], 0) + 1
+            self.index[month_key] = {"counts": counts, "max_id": max(merged)}
+            self.cache.pop(month_key, None)  # Loaded again only if someone looks
+
+        # The index goes last: a month only counts as archived once its file exists
+        self._write_atomic(self.index_file, lambda f: json.dump(self.index, f, indent=4))
+
+    def reload_index(self):
+        """Pick up months archived by another process"""
+        if not os.path.exists(self.index_file):
+            return
+        with open(self.index_file, 'r') as f:
+            index = json.load(f)
+        if index != self.index:
+            self.index = index
+            self.cache = {}
@@ -0,0 +1,84 @@
+from bisect import bisect_left
+
+
+def to_minutes(time_str):
+    """Convert an 'HH:MM' string to minutes after midnight"""
+    hours, minutes = time_str.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+class BookingIndex:
+    """In-memory index of bookings keyed by (room, date).
+
+    Each key holds a sorted list of (start_minute, end_minute, booking_id)
+    tuples, so an overlap check is a single bisect instead of a scan over
+    every booking. Keys whose bookings already overlap each other (older or
+    imported data) are remembered and checked with a full scan instead.
+    """
+
+    def __init__(self, bookings=()):
+        self.intervals = {}
+        self.overlapping = set()
+        self.rebuild(bookings)
+
+    def rebuild(self, bookings):
+        self.intervals = {}
+        self.overlapping = set()
+        for booking in bookings:
+            key = (booking['room'], booking['date'])
+            self.intervals.setdefault(key, []).append(self._interval(booking))
+        for key, intervals in self.intervals.items():
+            intervals.sort()
+            latest_end = 0
+            for start, end, _ in intervals:
+                if start < latest_end:
+                    self.overlapping.add(key)
+                    break
+                latest_end = end
+
+    def _interval(self, booking):
+        return (to_minutes(booking['start_time']), to_minutes(booking['end_time']), booking['id'])
+
+    def add(self, booking):
+        key = (booking['room'], booking['date'])
+        intervals = self.intervals.setdefault(key, [])
+        interval = self._interval(booking)
+        pos = bisect_left(intervals, interval)
+        if (pos > 0 and intervals[pos - 1][1] > interval[0]) or \
+                (pos < len(intervals) and intervals[pos][0] < interval[1]):
+            self.overlapping.add(key)
+        intervals.insert(pos, interval)
+
+    def remove(self, booking):
+        key = (booking['room'], booking['date'])
+        intervals = self.intervals.get(key)
+        if not intervals:
+            return
+        interval = self._interval(booking)
+        pos = bisect_left(intervals, interval)
+        if pos < len(intervals) and intervals[pos] == interval:
+            del intervals[pos]
+        if not intervals:
+            del self.intervals[key]
+            self.overlapping.discard(key)
+
+    def get_intervals(self, room_name, date):
+        return self.intervals.get((room_name, date), [])
+
+    def is_free(self, room_name, date, start_time, end_time):
+        intervals = self.intervals.get((room_name, date))
+        if not intervals:
+            return True
+
+        start = to_minutes(start_time)
+        end = to_minutes(end_time)
+
+        # Only bookings starting before our end can overlap
+        pos = bisect_left(intervals, (end,))
+        if pos == 0:
+            return True
+        if (room_name, date) in self.overlapping:
+            return all(interval_end <= start for _, interval_end, _ in intervals[:pos])
+        # Bookings here never overlap each other, so end minutes are sorted
+        # too and only the last booking starting before our end can overlap.
+        return intervals[pos - 1][1] <= start
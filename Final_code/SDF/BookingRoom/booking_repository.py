@@ -0,0 +1,470 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+import os
+import sqlite3
+
+from BookingRoom.booking_archive import BookingArchive
+from BookingRoom.booking_index import BookingIndex
+from BookingRoom.booking_storage import JournaledBookingStore
+from BookingRoom.file_lock import FileLock
+from BookingRoom.id_sequence import BookingIdSequence
+
+BOOKING_FIELDS = ("id", "room", "date", "start_time", "end_time", "purpose",
+                  "participants", "student_id", "created_at")
+
+
+class BookingRepository(ABC):
+    """Storage interface used by BookingSystem.
+
+    Bookings are plain dicts with the keys in BOOKING_FIELDS. Times are
+    zero-padded 'HH:MM' strings and dates are 'YYYY-MM-DD', so both sort
+    correctly as strings.
+    """
+
+    @abstractmethod
+    def all_bookings(self):
+        """All bookings sorted by (date, start_time)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def count(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def max_id(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def next_id(self):
+        """Allocate a new booking id; ids are never reused"""
+        raise NotImplementedError
+
+    def next_ids(self, count):
+        """Allocate `count` consecutive booking ids at once"""
+        return [self.next_id() for _ in range(count)]
+
+    @abstractmethod
+    def get(self, booking_id):
+        raise NotImplementedError
+
+    @abstractmethod
+    def bookings_for(self, room_name, date):
+        """Bookings of one room on one date, sorted by start time"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def bookings_on(self, date, room_names):
+        """Bookings of several rooms on one date, in a single call"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_available(self, room_name, date, start_time, end_time):
+        raise NotImplementedError
+
+    @abstractmethod
+    def month_counts(self, year, month):
+        """Map of 'YYYY-MM-DD' -> number of bookings for one calendar month"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def month_bookings(self, year, month):
+        """Every booking of one calendar month, archived or not, sorted by (date, start_time)"""
+        raise NotImplementedError
+
+    def archived_months(self):
+        """'YYYY-MM' keys of months moved out of the live data; empty for backends that never archive"""
+        return []
+
+    @abstractmethod
+    def add(self, booking):
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, booking):
+        raise NotImplementedError
+
+    def refresh(self):
+        """Pick up changes committed by other processes.
+
+        Returns True if any arrived since the last call.
+        """
+        return False
+
+    @contextmanager
+    def batch(self):
+        """Commit every change made inside the block with a single write.
+
+        The block is atomic across processes: an availability check made
+        inside it still holds when its changes are written.
+        """
+        yield
+
+    def close(self):
+        pass
+
+
+class JsonBookingRepository(BookingRepository):
+    """bookings.json snapshot + operation log, held in memory with an interval index.
+
+    Only the current and future months are live. At load, bookings of past
+    months move into the compressed archive, which is read only when one of
+    those months is looked at.
+
+    Other processes may write the same files. A batch takes the file lock,
+    replays whatever they appended since our last read, and only then runs
+    its checks and writes, so two processes can never book the same slot.
+    Nothing is locked between batches.
+    """
+
+    def __init__(self, snapshot_file, log_file, seq_file, lock_file=None, archive_dir=None):
+        self.store = JournaledBookingStore(snapshot_file, log_file)
+        self.archive = BookingArchive(archive_dir or os.path.join(os.path.dirname(snapshot_file), "archive"))
+        self.ids = BookingIdSequence(seq_file)
+        self.lock = FileLock(lock_file or snapshot_file + ".lock")
+        self.in_batch = False
+        self.changed_elsewhere = False
+        with self.lock:
+            self._load()
+
+    def _load(self):
+        loaded = self.store.load()
+        self.archive.reload_index()
+
+        # Booking id -> record; older files may repeat ids, which get fresh ones
+        self.bookings = {}
+        self.last_id = max(max((b['id'] for b in loaded), default=0), self.archive.max_id())
+        repaired = False
+        for booking in loaded:
+            if booking['id'] in self.bookings:
+                self.last_id += 1
+                booking['id'] = self.last_id
+                repaired = True
+            self.bookings[booking['id']] = booking
+
+        # Past months are never booked again: archive them, then drop them
+        # from the live snapshot
+        current_month = datetime.now().strftime("%Y-%m")
+        past = [booking for booking in self.bookings.values() if booking['date'][:7] < current_month]
+        if past:
+            self.archive.add(past)
+            for booking in past:
+                del self.bookings[booking['id']]
+        if repaired or past:
+            self.store.compact(list(self.bookings.values()))
+
+        self.index = BookingIndex(self.bookings.values())
+
+        # Per-month histograms of bookings per date, kept up to date on add/remove
+        self.daily_counts = {}
+        for booking in self.bookings.values():
+            self._count(booking['date'], 1)
+
+    def _insert(self, booking):
+        self.bookings[booking['id']] = booking
+        self.last_id = max(self.last_id, booking['id'])
+        self.index.add(booking)
+        self._count(booking['date'], 1)
+
+    def _delete(self, booking):
+        del self.bookings[booking['id']]
+        self.index.remove(booking)
+        self._count(booking['date'], -1)
+
+    def _catch_up(self):
+        # Caller holds the lock
+        entries = self.store.read_new_entries()
+        if entries is None:
+            # Another process compacted: start over from its snapshot
+            self._load()
+            self.changed_elsewhere = True
+            return
+        for entry in entries:
+            if entry['op'] == 'add':
+                if entry['booking']['id'] not in self.bookings:
+                    self._insert(entry['booking'])
+            elif entry['op'] == 'cancel':
+                booking = self.bookings.get(entry['id'])
+                if booking is not None:
+                    self._delete(booking)
+            self.changed_elsewhere = True
+
+    def refresh(self):
+        # Only take the lock when the files have actually changed
+        if self.store.changed_on_disk():
+            with self.lock:
+                self._catch_up()
+        changed, self.changed_elsewhere = self.changed_elsewhere, False
+        return changed
+
+    def _count(self, date, delta):
+        counts = self.daily_counts.setdefault(date[:7], {})
+        counts[date] = counts.get(date, 0) + delta
+        if counts[date] <= 0:
+            del counts[date]
+
+    def all_bookings(self):
+        return sorted(self.bookings.values(), key=lambda x: (x['date'], x['start_time']))
+
+    def count(self):
+        return len(self.bookings)
+
+    def max_id(self):
+        return self.last_id
+
+    def next_id(self):
+        return self.ids.next_id(floor=self.last_id)
+
+    def next_ids(self, count):
+        first_id = self.ids.next_id(floor=self.last_id, count=count)
+        return list(range(first_id, first_id + count))
+
+    def get(self, booking_id):
+        return self.bookings.get(booking_id)
+
+    def bookings_for(self, room_name, date):
+        return [self.bookings[booking_id]
+                for start, end, booking_id in self.index.get_intervals(room_name, date)]
+
+    def bookings_on(self, date, room_names):
+        bookings = []
+        for room_name in room_names:
+            bookings.extend(self.bookings_for(room_name, date))
+        return bookings
+
+    def is_available(self, room_name, date, start_time, end_time):
+        return self.index.is_free(room_name, date, start_time, end_time)
+
+    def month_counts(self, year, month):
+        month_key = f"{year}-{month:02d}"
+        counts = self.archive.month_counts(month_key)
+        for date, count in self.daily_counts.get(month_key, {}).items():
+            counts[date] = counts.get(date, 0) + count
+        return counts
+
+    def month_bookings(self, year, month):
+        month_key = f"{year}-{month:02d}"
+        live = []
+        if month_key in self.daily_counts:
+            live = [b for b in self.bookings.values() if b['date'][:7] == month_key]
+        return sorted(self.archive.load(month_key) + live, key=lambda x: (x['date'], x['start_time']))
+
+    def archived_months(self):
+        return self.archive.months()
+
+    def add(self, booking):
+        with self.batch():
+            self._insert(booking)
+            self.store.append_add(booking)
+
+    def remove(self, booking):
+        with self.batch():
+            self._delete(booking)
+            self.store.append_cancel(booking)
+
+    @contextmanager
+    def batch(self):
+        if self.in_batch:
+            yield
+            return
+        # The lock is held only while the batch runs, never across UI waits
+        with self.lock:
+            self.in_batch = True
+            try:
+                self._catch_up()
+                with self.store.batch():
+                    yield
+                self.compact_if_needed()
+            finally:
+                self.in_batch = False
+
+    def compact_if_needed(self):
+        # Never compact halfway through a batch; the batch does it at the end
+        if self.store.buffer is None and self.store.needs_compaction():
+            self.store.compact(list(self.bookings.values()))
+
+
+class SqliteBookingRepository(BookingRepository):
+    """SQLite backend with (room, date, start_time) and (date) indexes, in WAL mode.
+
+    Never archives: past months stay in the table, where the date index
+    already keeps month lookups cheap, so archived_months() is always empty.
+    On first run it imports the JSON backend's live and archived bookings.
+    """
+
+    def __init__(self, db_file, import_file=None):
+        # The booking server calls in from its single service thread
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.in_batch = False
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS bookings (
+                    pk INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER NOT NULL,
+                    room TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    start_time TEXT NOT NULL,
+                    end_time TEXT NOT NULL,
+                    purpose TEXT,
+                    participants INTEGER,
+                    student_id TEXT,
+                    created_at TEXT
+                )""")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_bookings_room_date_start "
+                              "ON bookings (room, date, start_time)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_bookings_date ON bookings (date)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS booking_sequence (last_id INTEGER NOT NULL)")
+            if not self.conn.execute("SELECT 1 FROM booking_sequence").fetchone():
+                self.conn.execute("INSERT INTO booking_sequence (last_id) VALUES (0)")
+
+        # First run: bring over whatever the JSON backend already holds
+        if import_file and self.count() == 0:
+            log_file = os.path.splitext(import_file)[0] + ".log"
+            existing = JournaledBookingStore(import_file, log_file).load()
+            archive = BookingArchive(os.path.join(os.path.dirname(import_file), "archive"))
+            for month_key in archive.months():
+                existing.extend(archive.load(month_key))
+            with self.conn:
+                self.conn.executemany(self._insert_sql(), [self._row(b) for b in existing])
+
+        # Older data may repeat booking ids; give duplicates fresh ones
+        # before enforcing uniqueness
+        if not self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_bookings_id'").fetchone():
+            next_id = self.max_id()
+            seen = set()
+            with self.conn:
+                for pk, booking_id in self.conn.execute("SELECT pk, id FROM bookings ORDER BY pk").fetchall():
+                    if booking_id in seen:
+                        next_id += 1
+                        self.conn.execute("UPDATE bookings SET id = ? WHERE pk = ?", (next_id, pk))
+                    seen.add(booking_id)
+                self.conn.execute("CREATE UNIQUE INDEX idx_bookings_id ON bookings (id)")
+
+        self.data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _transaction(self):
+        # Inside batch() the outer transaction commits everything at once
+        return nullcontext() if self.in_batch else self.conn
+
+    @contextmanager
+    def batch(self):
+        if self.in_batch:
+            yield
+            return
+        # IMMEDIATE takes the write lock up front, so no other process can
+        # commit between our availability check and our insert
+        self.conn.execute("BEGIN IMMEDIATE")
+        self.in_batch = True
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self.in_batch = False
+
+    def refresh(self):
+        # data_version changes only when another connection commits
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        changed = version != self.data_version
+        self.data_version = version
+        return changed
+
+    def _insert_sql(self):
+        columns = ", ".join(BOOKING_FIELDS)
+        placeholders = ", ".join("?" for _ in BOOKING_FIELDS)
+        return f"INSERT INTO bookings ({columns}) VALUES ({placeholders})"
+
+    def _row(self, booking):
+        return tuple(booking.get(field) for field in BOOKING_FIELDS)
+
+    def _to_booking(self, row):
+        return {field: row[field] for field in BOOKING_FIELDS}
+
+    def all_bookings(self):
+        rows = self.conn.execute("SELECT * FROM bookings ORDER BY date, start_time")
+        return [self._to_booking(row) for row in rows]
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM bookings").fetchone()[0]
+
+    def max_id(self):
+        return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM bookings").fetchone()[0]
+
+    def next_id(self):
+        return self.next_ids(1)[0]
+
+    def next_ids(self, count):
+        # The UPDATE takes SQLite's write lock, so concurrent writers serialize here
+        with self._transaction():
+            self.conn.execute(
+                "UPDATE booking_sequence SET last_id = "
+                "MAX(last_id, (SELECT COALESCE(MAX(id), 0) FROM bookings)) + ?", (count,))
+            last_id = self.conn.execute("SELECT last_id FROM booking_sequence").fetchone()[0]
+        return list(range(last_id - count + 1, last_id + 1))
+
+    def get(self, booking_id):
+        row = self.conn.execute("SELECT * FROM bookings WHERE id = ?", (booking_id,)).fetchone()
+        return self._to_booking(row) if row else None
+
+    def bookings_for(self, room_name, date):
+        rows = self.conn.execute(
+            "SELECT * FROM bookings WHERE room = ? AND date = ? ORDER BY start_time",
+            (room_name, date))
+        return [self._to_booking(row) for row in rows]
+
+    def bookings_on(self, date, room_names):
+        room_names = set(room_names)
+        rows = self.conn.execute("SELECT * FROM bookings WHERE date = ? ORDER BY start_time", (date,))
+        return [self._to_booking(row) for row in rows if row['room'] in room_names]
+
+    def is_available(self, room_name, date, start_time, end_time):
+        # Zero-padded 'HH:MM' strings compare in time order
+        row = self.conn.execute(
+            "SELECT 1 FROM bookings WHERE room = ? AND date = ? "
+            "AND start_time < ? AND end_time > ? LIMIT 1",
+            (room_name, date, end_time, start_time)).fetchone()
+        return row is None
+
+    def month_counts(self, year, month):
+        month_prefix = f"{year}-{month:02d}"
+        rows = self.conn.execute(
+            "SELECT date, COUNT(*) FROM bookings WHERE date BETWEEN ? AND ? GROUP BY date",
+            (f"{month_prefix}-01", f"{month_prefix}-31"))
+        return {date: count for date, count in rows}
+
+    def month_bookings(self, year, month):
+        # The date index already confines this to one month's rows
+        month_prefix = f"{year}-{month:02d}"
+        rows = self.conn.execute(
+            "SELECT * FROM bookings WHERE date BETWEEN ? AND ? ORDER BY date, start_time",
+            (f"{month_prefix}-01", f"{month_prefix}-31"))
+        return [self._to_booking(row) for row in rows]
+
+    def add(self, booking):
+        with self._transaction():
+            self.conn.execute(self._insert_sql(), self._row(booking))
+
+    def remove(self, booking):
+        with self._transaction():
+            self.conn.execute("DELETE FROM bookings WHERE id = ?", (booking['id'],))
+
+    def close(self):
+        self.conn.close()
+
+
+def create_repository(storage, app_data_dir):
+    """Build the booking repository for the given storage name ('json' or 'sqlite')"""
+    bookings_file = os.path.join(app_data_dir, "bookings.json")
+    if storage == "sqlite":
+        return SqliteBookingRepository(os.path.join(app_data_dir, "bookings.db"),
+                                       import_file=bookings_file)
+    if storage == "json":
+        return JsonBookingRepository(bookings_file, os.path.join(app_data_dir, "bookings.log"),
+                                     os.path.join(app_data_dir, "booking_id_seq.json"))
+    raise ValueError(f"Unknown booking storage: {storage}")
@@ -0,0 +1,344 @@
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import sys
+from urllib.parse import urlsplit, parse_qs
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from BookingRoom.booking_service import BookingService, BookingError, BookingConflictError, BulkBookingError
+
+KEEP_ALIVE_TIMEOUT = 15  # seconds an idle connection stays open
+MAX_BATCH = 256          # most writes committed together
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class BookingServer:
+    """Local HTTP/JSON API over a single BookingService.
+
+    One process owns the bookings and answers many clients. Writes are
+    queued and committed in batches, so a burst of bookings costs one
+    journal write. Every service call, read or write, runs on one service
+    thread: file locks and fsyncs never stall the event loop, and the
+    in-memory index is never touched by two threads at once. Reads first
+    pick up whatever other processes (e.g. the desktop app) committed.
+
+    Endpoints:
+        GET    /rooms
+        GET    /bookings                  GET /bookings/<id>
+        POST   /bookings                  DELETE /bookings/<id>
+        POST   /bookings/bulk             {"bookings": [{room, date, ...}, ...]}
+        POST   /bookings/recurring        {room, date, weeks, start_time, end_time, ...}
+        GET    /availability?room=&date=&start_time=&end_time=
+        GET    /slots?date=[&room=]
+        GET    /search?date=&start_time=&end_time=&participants=[&days=][&equipment=...]
+        GET    /calendar?year=&month=
+        GET    /utilization?from=YYYY-MM&to=YYYY-MM
+    """
+
+    def __init__(self, service, host="127.0.0.1", port=8765):
+        self.service = service
+        self.host = host
+        self.port = port
+        self.server = None
+        self.write_queue = None
+        self.writer_task = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="booking-service")
+        self.clients = set()  # handler tasks of open connections
+
+    async def start(self):
+        self.write_queue = asyncio.Queue()
+        self.writer_task = asyncio.create_task(self.write_loop())
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        return self.server
+
+    async def serve_forever(self):
+        server = await self.start()
+        async with server:
+            await server.serve_forever()
+
+    async def stop(self):
+        if self.server:
+            self.server.close()
+        # Idle keep-alive connections would otherwise hold wait_closed() open
+        for task in list(self.clients):
+            task.cancel()
+        await asyncio.gather(*self.clients, return_exceptions=True)
+        if self.server:
+            await self.server.wait_closed()
+        if self.writer_task:
+            self.writer_task.cancel()
+            await asyncio.gather(self.writer_task, return_exceptions=True)
+        self.executor.shutdown(wait=True)
+
+    # ---------------------- Service thread ----------------------
+    async def call(self, func, *args):
+        """Run a service call on the service thread"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    def fresh(self, func, *args):
+        # On the service thread: catch up with other processes, then answer
+        self.service.refresh()
+        return func(*args)
+
+    # ---------------------- Batched writes ----------------------
+    async def submit_write(self, func, *args):
+        future = asyncio.get_running_loop().create_future()
+        await self.write_queue.put((func, args, future))
+        return await future
+
+    async def write_loop(self):
+        while True:
+            batch = [await self.write_queue.get()]
+            # Give concurrent requests one loop turn to join this batch
+            await asyncio.sleep(0)
+            while not self.write_queue.empty() and len(batch) < MAX_BATCH:
+                batch.append(self.write_queue.get_nowait())
+
+            results = await self.call(self.commit, batch)
+
+            # Answer only once the batch is on disk
+            for future, result, error in results:
+                if future.cancelled():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+
+    def commit(self, batch):
+        # On the service thread: the batch holds the file lock and fsyncs
+        results = []
+        try:
+            with self.service.repo.batch():
+                for func, args, future in batch:
+                    try:
+                        results.append((future, func(*args), None))
+                    except Exception as e:
+                        # Fails this request only; the others still commit
+                        results.append((future, None, e))
+        except Exception as e:
+            # Writing the batch out failed, so none of it can be confirmed
+            results = [(future, None, e) for func, args, future in batch]
+        return results
+
+    # ---------------------- HTTP ----------------------
+    async def handle_client(self, reader, writer):
+        task = asyncio.current_task()
+        self.clients.add(task)
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self.send(writer, 400, {"error": "Malformed request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                    if length < 0:
+                        raise ValueError
+                except ValueError:
+                    await self.send(writer, 400, {"error": "Invalid Content-Length"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                connection = headers.get("connection", "").lower()
+                if version == "HTTP/1.1":
+                    keep_alive = connection != "close"
+                else:
+                    keep_alive = connection == "keep-alive"
+
+                try:
+                    status, payload = await self.dispatch(method, target, body)
+                except HttpError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except BulkBookingError as e:
+                    problems = [{"position": position, "request": request, "error": message}
+                                for position, request, message in e.problems]
+                    status, payload = 409, {"error": str(e), "problems": problems}
+                except BookingConflictError as e:
+                    status, payload = 409, {"error": str(e)}
+                except BookingError as e:
+                    status, payload = 400, {"error": str(e)}
+                except Exception as e:
+                    status, payload = 500, {"error": f"Internal error: {e}"}
+
+                await self.send(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self.clients.discard(task)
+            writer.close()
+
+    async def send(self, writer, status, payload, keep_alive):
+        reasons = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+                   405: "Method Not Allowed", 409: "Conflict", 500: "Internal Server Error"}
+        body = json.dumps(payload).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {reasons.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        parts = [p for p in url.path.split("/") if p]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        service = self.service
+
+        if parts == ["rooms"] and method == "GET":
+            return 200, service.rooms
+
+        if parts == ["bookings"]:
+            if method == "GET":
+                return 200, await self.call(self.fresh, service.list_bookings)
+            if method == "POST":
+                data = self.parse_json(body)
+                booking = await self.submit_write(
+                    service.book, data.get("room"), data.get("date"), data.get("start_time"),
+                    data.get("end_time"), data.get("purpose"), data.get("participants", 2),
+                    data.get("student_id"))
+                return 201, booking
+            raise HttpError(405, f"{method} not allowed on /bookings")
+
+        if parts == ["bookings", "bulk"] and method == "POST":
+            requests = self.parse_json(body).get("bookings")
+            if not isinstance(requests, list) or not all(isinstance(r, dict) for r in requests):
+                raise HttpError(400, '"bookings" must be a list of objects')
+            for request in requests:
+                request.setdefault("participants", 2)
+            return 201, await self.submit_write(service.book_many, requests)
+
+        if parts == ["bookings", "recurring"] and method == "POST":
+            data = self.parse_json(body)
+            return 201, await self.submit_write(
+                service.book_recurring, data.get("room"), data.get("date"), data.get("weeks"),
+                data.get("start_time"), data.get("end_time"), data.get("purpose"),
+                data.get("participants", 2), data.get("student_id"), data.get("every", 1))
+
+        if len(parts) == 2 and parts[0] == "bookings":
+            booking_id = self.parse_int(parts[1], "booking id")
+            if method == "GET":
+                booking = await self.call(self.fresh, service.get_booking, booking_id)
+                if booking is None:
+                    raise HttpError(404, f"Booking {booking_id} does not exist")
+                return 200, booking
+            if method == "DELETE":
+                if await self.call(self.fresh, service.get_booking, booking_id) is None:
+                    raise HttpError(404, f"Booking {booking_id} does not exist")
+                return 200, await self.submit_write(service.cancel, booking_id)
+            raise HttpError(405, f"{method} not allowed on /bookings/<id>")
+
+        if method != "GET":
+            raise HttpError(405, f"{method} not allowed")
+
+        if parts == ["availability"]:
+            self.require(query, "room", "date", "start_time", "end_time")
+            self.require_room(query["room"])
+            service.check_date(query["date"])
+            service.check_time_window(query["start_time"], query["end_time"])
+            available = await self.call(self.fresh, service.is_room_available, query["room"], query["date"],
+                                        query["start_time"], query["end_time"])
+            return 200, {"available": available}
+
+        if parts == ["slots"]:
+            self.require(query, "date")
+            service.check_date(query["date"])
+            if "room" in query:
+                self.require_room(query["room"])
+                day = await self.call(self.fresh, service.day_occupancy, query["room"], query["date"])
+                return 200, {query["room"]: day.free_slots()}
+            return 200, await self.call(self.fresh, service.free_slots_all_rooms, query["date"])
+
+        if parts == ["search"]:
+            self.require(query, "date", "start_time", "end_time", "participants")
+            equipment = parse_qs(url.query).get("equipment", [])
+            return 200, await self.call(self.fresh, service.search_rooms, query["date"],
+                                        self.parse_int(query.get("days", "1"), "days"),
+                                        query["start_time"], query["end_time"],
+                                        self.parse_int(query["participants"], "participants"), equipment)
+
+        if parts == ["calendar"]:
+            self.require(query, "year", "month")
+            return 200, await self.call(self.fresh, service.month_counts, self.parse_int(query["year"], "year"),
+                                        self.parse_int(query["month"], "month"))
+
+        if parts == ["utilization"]:
+            self.require(query, "from", "to")
+            # Rollups must include other processes' bookings
+            report = await self.call(self.fresh, service.utilization_report, query["from"], query["to"])
+            report["no_show_candidates"] = await self.call(service.no_show_candidates)
+            return 200, report
+
+        raise HttpError(404, f"No such endpoint: {url.path}")
+
+    def parse_json(self, body):
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise HttpError(400, "Request body is not valid JSON")
+        if not isinstance(data, dict):
+            raise HttpError(400, "Request body must be a JSON object")
+        return data
+
+    def parse_int(self, value, name):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise HttpError(400, f"Invalid {name}: {value}")
+
+    def require_room(self, room_name):
+        if self.service.get_room(room_name) is None:
+            raise HttpError(404, f"No such room: {room_name}")
+
+    def require(self, query, *names):
+        missing = [name for name in names if not query.get(name)]
+        if missing:
+            raise HttpError(400, f"Missing query parameter(s): {', '.join(missing)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Discussion room booking server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--data-dir", default=None, help="defaults to the desktop app's BookingAppData folder")
+    parser.add_argument("--storage", choices=["json", "sqlite"], default="json")
+    args = parser.parse_args()
+
+    server = BookingServer(BookingService(args.data_dir, args.storage), args.host, args.port)
+    print(f"Booking server listening on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
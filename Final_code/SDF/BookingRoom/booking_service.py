@@ -0,0 +1,337 @@
+from datetime import datetime
+import json
+import os
+
+from BookingRoom.booking_analytics import UtilizationRollups, LateCancellations
+from BookingRoom.booking_index import BookingIndex
+from BookingRoom.booking_repository import create_repository
+from BookingRoom.bulk_booking import recurring_requests
+from BookingRoom.room_search import RoomCatalog, search_rooms, date_range
+from BookingRoom.slot_bitmap import DAY_END, DAY_START, DayOccupancy, free_slots_by_room
+
+DEFAULT_ROOMS = [
+    {"id": 1, "name": "A mall Meeting Room", "capacity": 4, "equipment": ["Monitor", "Whiteboard"]},
+    {"id": 2, "name": "Medium Conference Room", "capacity": 8, "equipment": ["Projector", "Whiteboard", "TV"]},
+    {"id": 3, "name": "Large Conference Room", "capacity": 12, "equipment": ["Projector", "Video Conferencing", "Smart Board", "Sound System"]},
+    {"id": 4, "name": "Executive Boardroom", "capacity": 6, "equipment": [ "Premium Sound", "Video Conferencing", "Smart Table"]},
+    {"id": 5, "name": "Training Room", "capacity": 15, "equipment": ["Projector", "Whiteboard", "Sound System", "Multiple Monitors"]}
+]
+
+
+MAX_RECURRING_WEEKS = 26  # longest recurring booking, one semester
+MAX_SEARCH_DAYS = 31     # longest date range one room search covers
+
+
+def default_app_data_dir():
+    # USERPROFILE on Windows, the home directory elsewhere
+    return os.path.join(os.environ.get('USERPROFILE') or os.path.expanduser('~'), 'BookingAppData')
+
+
+class BookingError(Exception):
+    """A booking request was rejected; the message is meant for the user"""
+
+
+class BookingConflictError(BookingError):
+    """The requested time overlaps an existing booking"""
+
+
+class BulkBookingError(BookingError):
+    """Some requests of a bulk booking were rejected, so none were booked"""
+
+    def __init__(self, problems):
+        super().__init__(f"{len(problems)} booking(s) could not be made; nothing was booked")
+        self.problems = problems  # [(position, request, message), ...], position from 1
+
+
+class BookingService:
+    """Booking core without any UI: rooms, bookings, availability and conflicts.
+
+    The Tk BookingSystem and the HTTP booking server both sit on top of this.
+    Rejected requests raise BookingError.
+    """
+
+    def __init__(self, app_data_dir=None, storage="json"):
+        self.app_data_dir = app_data_dir or default_app_data_dir()
+        os.makedirs(self.app_data_dir, exist_ok=True)
+        self.rooms_file = os.path.join(self.app_data_dir, "rooms.json")
+
+        # Bookings live behind a repository ('json' or 'sqlite' storage)
+        self.repo = create_repository(storage, self.app_data_dir)
+        self.load_rooms()
+
+        # Utilization rollups are built on first use, then kept up to date
+        self.rollups = None
+        self.late_cancellations = LateCancellations(os.path.join(self.app_data_dir, "late_cancellations.json"))
+
+    # ---------------------- Rooms ----------------------
+    def load_rooms(self):
+        if os.path.exists(self.rooms_file):
+            with open(self.rooms_file, 'r') as f:
+                self.rooms = json.load(f)
+        else:
+            self.rooms = [dict(room) for room in DEFAULT_ROOMS]
+            self.save_rooms()
+
+        # Capacity / equipment indexes used by the room filters and search
+        self.room_catalog = RoomCatalog(self.rooms)
+
+    def save_rooms(self):
+        with open(self.rooms_file, 'w') as f:
+            json.dump(self.rooms, f, indent=4)
+
+    def get_room(self, room_name):
+        return self.room_catalog.rooms.get(room_name)
+
+    # ---------------------- Validation ----------------------
+    def validate_booking_time(self, date, start_time, end_time, now=None):
+        now = now or datetime.now()
+        try:
+            selected_date = datetime.strptime(date, "%Y-%m-%d").date()
+            start = datetime.strptime(start_time, "%H:%M").time()
+            end = datetime.strptime(end_time, "%H:%M").time()
+        except (TypeError, ValueError):
+            raise BookingError("Invalid date or time format!")
+
+        # Check if date is in the past
+        if selected_date < now.date():
+            raise BookingError("Cannot book rooms for past dates!")
+
+        if start == end:
+            raise BookingError("Start time and end time cannot be the same!")
+
+        if end <= start:
+            raise BookingError("End time must be after start time!")
+
+        # Check maximum booking duration (2 hours)
+        duration = (datetime.combine(selected_date, end) - datetime.combine(selected_date, start)).total_seconds() / 3600
+        if duration > 2:
+            raise BookingError("Maximum booking duration is 2 hours!")
+
+        # If booking for today, check if time is in the future
+        if selected_date == now.date() and start < now.time():
+            raise BookingError("Cannot book rooms for past times!")
+
+    def check_date(self, date):
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
+        except (TypeError, ValueError):
+            raise BookingError("Invalid date format!")
+
+    def check_time_window(self, start_time, end_time):
+        """Raise BookingError unless start_time-end_time is a real window within opening hours"""
+        try:
+            start = datetime.strptime(start_time, "%H:%M")
+            end = datetime.strptime(end_time, "%H:%M")
+        except (TypeError, ValueError):
+            raise BookingError("Invalid date or time format!")
+        if end <= start:
+            raise BookingError("End time must be after start time!")
+        start_minute = start.hour * 60 + start.minute
+        end_minute = end.hour * 60 + end.minute
+        if start_minute < DAY_START or end_minute > DAY_END:
+            raise BookingError(f"Rooms can only be booked between {DAY_START // 60:02d}:00 and {DAY_END // 60:02d}:00")
+
+    def check_month(self, year, month):
+        if not 1 <= month <= 12 or not 1 <= year <= 9999:
+            raise BookingError(f"Invalid month: {year}-{month}")
+
+    # ---------------------- Queries ----------------------
+    def is_room_available(self, room_name, date, start_time, end_time):
+        return self.repo.is_available(room_name, date, start_time, end_time)
+
+    def get_booking(self, booking_id):
+        return self.repo.get(booking_id)
+
+    def list_bookings(self):
+        return self.repo.all_bookings()
+
+    def month_counts(self, year, month):
+        self.check_month(year, month)
+        return self.repo.month_counts(year, month)
+
+    def month_bookings(self, year, month):
+        """All bookings of a month, loading it from the archive if it is a past one"""
+        return self.repo.month_bookings(year, month)
+
+    def day_occupancy(self, room_name, date):
+        return DayOccupancy(self.repo.bookings_for(room_name, date))
+
+    def free_slots_all_rooms(self, date):
+        """Free 30-minute slots of every room on a date, as {room name: [(start, end), ...]}"""
+        return free_slots_by_room(self.repo, [room['name'] for room in self.rooms], date)
+
+    def search_rooms(self, first_date, days, start_time, end_time, participants, equipment=()):
+        """Rooms free from start_time to end_time on any of `days` days, best fit first"""
+        self.check_date(first_date)
+        self.check_time_window(start_time, end_time)
+        if not 1 <= days <= MAX_SEARCH_DAYS:
+            raise BookingError(f"Search between 1 and {MAX_SEARCH_DAYS} days")
+        return search_rooms(self.room_catalog, self.repo, date_range(first_date, days),
+                            start_time, end_time, participants, equipment)
+
+    # ---------------------- Changes ----------------------
+    def check_request(self, request):
+        """Raise BookingError if a booking request is incomplete or invalid"""
+        if not all(request.get(field) for field in
+                   ("room", "date", "start_time", "end_time", "purpose", "student_id")):
+            raise BookingError("Please fill all required fields including Student ID")
+        for field in ("room", "date", "start_time", "end_time"):
+            if not isinstance(request[field], str):
+                raise BookingError(f"Invalid {field.replace('_', ' ')}: {request[field]!r}")
+        if self.get_room(request["room"]) is None:
+            raise BookingError(f"Unknown room: {request['room']}")
+        if not isinstance(request.get("participants"), int):
+            raise BookingError(f"Invalid number of participants: {request.get('participants')}")
+        self.validate_booking_time(request["date"], request["start_time"], request["end_time"])
+
+    def _new_booking(self, booking_id, request, created_at):
+        return {
+            "id": booking_id,
+            "room": request["room"],
+            "date": request["date"],
+            "start_time": request["start_time"],
+            "end_time": request["end_time"],
+            "purpose": request["purpose"],
+            "participants": request["participants"],
+            "student_id": request["student_id"],
+            "created_at": created_at
+        }
+
+    def book(self, room_name, date, start_time, end_time, purpose, participants, student_id):
+        request = {"room": room_name, "date": date, "start_time": start_time, "end_time": end_time,
+                   "purpose": purpose, "participants": participants, "student_id": student_id}
+        self.check_request(request)
+
+        # Check and insert in one batch so no other process can take the
+        # slot in between
+        with self.repo.batch():
+            if not self.is_room_available(room_name, date, start_time, end_time):
+                raise BookingConflictError("The room is not available at the selected time")
+
+            booking = self._new_booking(self.repo.next_id(), request,
+                                        datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self.repo.add(booking)
+        if self.rollups is not None:
+            self.rollups.add(booking)
+        return booking
+
+    def book_many(self, requests):
+        """Book every request, or none of them.
+
+        Each request is a dict with the arguments of book(). All of them are
+        checked against the existing bookings and against each other first,
+        and every problem is reported together in a BulkBookingError. The
+        bookings are then written in a single batch.
+        """
+        problems = []
+        accepted = []
+        in_batch = BookingIndex()  # Requests accepted so far, to catch overlaps among them
+
+        with self.repo.batch():
+            for position, request in enumerate(requests, 1):
+                try:
+                    self.check_request(request)
+                    args = (request["room"], request["date"], request["start_time"], request["end_time"])
+                    if not self.is_room_available(*args):
+                        raise BookingConflictError("The room is not available at the selected time")
+                    if not in_batch.is_free(*args):
+                        raise BookingConflictError("Overlaps another booking in this batch")
+                except BookingError as e:
+                    problems.append((position, request, str(e)))
+                    continue
+                in_batch.add(dict(request, id=position))
+                accepted.append(request)
+
+            if problems:
+                raise BulkBookingError(problems)
+
+            created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            bookings = [self._new_booking(booking_id, request, created_at)
+                        for booking_id, request in zip(self.repo.next_ids(len(accepted)), accepted)]
+            for booking in bookings:
+                self.repo.add(booking)
+        if self.rollups is not None:
+            for booking in bookings:
+                self.rollups.add(booking)
+        return bookings
+
+    def book_recurring(self, room_name, first_date, weeks, start_time, end_time,
+                       purpose, participants, student_id, every=1):
+        """Book the same slot on first_date and every `every` weeks after, `weeks` times"""
+        if not isinstance(weeks, int) or not 1 <= weeks <= MAX_RECURRING_WEEKS:
+            raise BookingError(f"Number of weeks must be between 1 and {MAX_RECURRING_WEEKS}")
+        if not isinstance(every, int) or every < 1:
+            raise BookingError("Repeat interval must be at least 1 week")
+        try:
+            requests = recurring_requests(room_name, first_date, weeks, start_time, end_time,
+                                          purpose, participants, student_id, every)
+        except (TypeError, ValueError, OverflowError):
+            raise BookingError("Invalid date or time format!")
+        return self.book_many(requests)
+
+    def cancel(self, booking_id):
+        with self.repo.batch():
+            booking = self.repo.get(booking_id)
+            if booking is None:
+                raise BookingError(f"Booking {booking_id} does not exist")
+            self.repo.remove(booking)
+        if self.rollups is not None:
+            self.rollups.remove(booking)
+        self.late_cancellations.record(booking)
+        return booking
+
+    def refresh(self):
+        """Pick up bookings made or cancelled by other processes; True if any"""
+        if self.repo.refresh():
+            self.rollups = None  # Rebuilt on next use
+            return True
+        return False
+
+    # ---------------------- Analytics ----------------------
+    def utilization(self, first_month=None, last_month=None):
+        if self.rollups is None:
+            self.rollups = UtilizationRollups(self.repo.all_bookings())
+            self.rollup_archived = set()
+
+        # Archived months are folded in the first time a report covers them
+        for month_key in self.repo.archived_months():
+            if month_key in self.rollup_archived or not first_month:
+                continue
+            if first_month <= month_key <= last_month:
+                year, month = int(month_key[:4]), int(month_key[5:7])
+                for booking in self.repo.month_bookings(year, month):
+                    if self.repo.get(booking['id']) is None:  # Live ones are already in
+                        self.rollups.add(booking)
+                self.rollup_archived.add(month_key)
+        return self.rollups
+
+    def utilization_report(self, first_month, last_month, room_names=None):
+        """Occupancy per room / weekday / slot, heatmap and peaks for 'YYYY-MM'..'YYYY-MM'"""
+        try:
+            # Normalised, so '2030-5' compares correctly with '2030-10'
+            first_month = datetime.strptime(first_month, "%Y-%m").strftime("%Y-%m")
+            last_month = datetime.strptime(last_month, "%Y-%m").strftime("%Y-%m")
+        except (TypeError, ValueError):
+            raise BookingError("Months must be given as YYYY-MM")
+        if first_month > last_month:
+            raise BookingError("The first month must not be after the last month")
+        room_names = room_names or [room['name'] for room in self.rooms]
+        rollups = self.utilization(first_month, last_month)
+        return {
+            "first_month": first_month,
+            "last_month": last_month,
+            "by_room": rollups.occupancy_by_room(first_month, last_month, room_names),
+            "by_weekday": rollups.occupancy_by_weekday(first_month, last_month, room_names),
+            "by_slot": rollups.occupancy_by_slot(first_month, last_month, room_names),
+            "heatmap": rollups.heatmap(first_month, last_month, set(room_names)),
+            "peak_slots": rollups.peak_slots(first_month, last_month, set(room_names)),
+            "bookings": rollups.booking_counts(first_month, last_month)
+        }
+
+    def no_show_candidates(self, days=7, min_late=2):
+        """Bookings in the next `days` days by students who often cancel late"""
+        room_names = [room['name'] for room in self.rooms]
+        upcoming = []
+        for date in date_range(datetime.now().strftime("%Y-%m-%d"), days):
+            upcoming.extend(self.repo.bookings_on(date, room_names))
+        return self.late_cancellations.no_show_candidates(upcoming, min_late)
@@ -0,0 +1,186 @@
+from contextlib import contextmanager
+import json
+import os
+
+
+class JournaledBookingStore:
+    """Snapshot + append-only operation log for bookings.
+
+    The snapshot (bookings.json) keeps the original list format. Every add or
+    cancel is appended to the log as one JSON line, and the log is folded
+    back into the snapshot every `compact_every` operations.
+
+    Several processes may share the files. Each one remembers how far it has
+    read (snapshot stamp + log offset) and catches up with read_new_entries()
+    before it writes; the repository serializes writers with a file lock.
+    """
+
+    def __init__(self, snapshot_file, log_file, compact_every=200):
+        self.snapshot_file = snapshot_file
+        self.log_file = log_file
+        self.compact_every = compact_every
+        self.pending_ops = 0
+        self.buffer = None  # Lines held back while a batch is open
+
+        # Version stamp of what this process has read: which snapshot file,
+        # and how many bytes of the log after it
+        self.snapshot_stamp = None
+        self.log_offset = 0
+
+    # ---------------------- Loading ----------------------
+    def load(self):
+        # Stamp first: if the snapshot is replaced while we read, the next
+        # check sees a different stamp and loads again
+        self.snapshot_stamp = self._stamp()
+        bookings = []
+        if os.path.exists(self.snapshot_file):
+            with open(self.snapshot_file, 'r') as f:
+                bookings = json.load(f)
+
+        self.pending_ops = 0
+        self.log_offset = 0
+        if os.path.exists(self.log_file):
+            keys = {self._key(b) for b in bookings}
+            good_size = 0
+            with open(self.log_file, 'rb') as f:
+                for line in f:
+                    # A crash during append can leave a partial last line
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    self._apply(bookings, keys, entry)
+                    self.pending_ops += 1
+                    good_size += len(line)
+            # Drop any partial tail so later appends start on a clean line
+            if good_size < os.path.getsize(self.log_file):
+                with open(self.log_file, 'r+b') as f:
+                    f.truncate(good_size)
+            self.log_offset = good_size
+        return bookings
+
+    def _stamp(self):
+        # os.replace gives the new snapshot a new inode, so any compaction shows up
+        try:
+            st = os.stat(self.snapshot_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def changed_on_disk(self):
+        """Cheap stat-only check for writes by other processes since our last read"""
+        if self._stamp() != self.snapshot_stamp:
+            return True
+        size = os.path.getsize(self.log_file) if os.path.exists(self.log_file) else 0
+        return size != self.log_offset
+
+    def read_new_entries(self):
+        """Log entries other processes appended since our last read.
+
+        Returns None when the snapshot was rewritten or the log truncated
+        behind our back; the caller must then load() from scratch.
+        """
+        if self._stamp() != self.snapshot_stamp:
+            return None
+        size = os.path.getsize(self.log_file) if os.path.exists(self.log_file) else 0
+        if size < self.log_offset:
+            return None
+
+        entries = []
+        if size > self.log_offset:
+            with open(self.log_file, 'rb') as f:
+                f.seek(self.log_offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        break
+                    self.log_offset += len(line)
+                    self.pending_ops += 1
+        return entries
+
+    def _key(self, record):
+        return (record['id'], record['room'], record['date'], record['start_time'])
+
+    def _apply(self, bookings, keys, entry):
+        # Replay is idempotent, so a crash between writing the snapshot and
+        # truncating the log only replays operations that are already applied
+        if entry['op'] == 'add':
+            booking = entry['booking']
+            if self._key(booking) not in keys:
+                keys.add(self._key(booking))
+                bookings.append(booking)
+        elif entry['op'] == 'cancel':
+            key = self._key(entry)
+            if key in keys:
+                keys.discard(key)
+                for i, booking in enumerate(bookings):
+                    if self._key(booking) == key:
+                        del bookings[i]
+                        break
+
+    # ---------------------- Writing ----------------------
+    def _append(self, entry):
+        line = json.dumps(entry) + "\n"
+        if self.buffer is not None:
+            self.buffer.append(line)
+        else:
+            self._write_lines([line])
+        self.pending_ops += 1
+
+    def _write_lines(self, lines):
+        # Binary mode keeps log_offset a true byte offset on every platform
+        data = "".join(lines).encode('utf-8')
+        with open(self.log_file, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self.log_offset += len(data)
+
+    @contextmanager
+    def batch(self):
+        """Group every append made inside the block into one write and fsync"""
+        if self.buffer is not None:
+            yield  # Already inside a batch
+            return
+        self.buffer = []
+        try:
+            yield
+        finally:
+            lines, self.buffer = self.buffer, None
+            if lines:
+                self._write_lines(lines)
+
+    def append_add(self, booking):
+        self._append({"op": "add", "booking": booking})
+
+    def append_cancel(self, booking):
+        self._append({
+            "op": "cancel",
+            "id": booking['id'],
+            "room": booking['room'],
+            "date": booking['date'],
+            "start_time": booking['start_time']
+        })
+
+    def needs_compaction(self):
+        return self.pending_ops >= self.compact_every
+
+    def compact(self, bookings):
+        """Write a fresh snapshot atomically, then drop the replayed log"""
+        tmp_file = self.snapshot_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(bookings, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.snapshot_file)
+
+        # The snapshot now contains every logged operation
+        open(self.log_file, 'w').close()
+        self.pending_ops = 0
+        self.snapshot_stamp = self._stamp()
+        self.log_offset = 0
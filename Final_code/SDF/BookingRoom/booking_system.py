@@ -1,25 +1,31 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, filedialog
 from datetime import datetime, timedelta
-import json
 import os
+import sys
 import calendar
+from bisect import bisect_left
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from BookingRoom.booking_service import BookingService, BookingError, BulkBookingError, MAX_RECURRING_WEEKS
+from BookingRoom.bulk_booking import read_bookings_csv, CSV_COLUMNS
+from BookingRoom.booking_analytics import WEEKDAYS
+from BookingRoom.slot_bitmap import SLOT_LABELS
+from BookingRoom.calendar_view import MonthCalendar
+
+CHANGE_POLL_MS = 5000  # How often to look for bookings made by other processes
 
 class BookingSystem:
-    def __init__(self, root, current_user=None):
+    def __init__(self, root, current_user=None, storage="json"):
         self.root = root
         self.current_user = current_user
+        self.storage = storage
         self.root.title("Professional Discussion Room Booking System")
         self.root.geometry("1300x750")
         self.root.configure(bg='#f0f2f5')
 
-        # ---------------------- Data Files ----------------------
-        app_data_dir = os.path.join(os.environ['USERPROFILE'], 'BookingAppData')
-        os.makedirs(app_data_dir, exist_ok=True)
-        self.bookings_file = os.path.join(app_data_dir, "bookings.json")
-        self.rooms_file = os.path.join(app_data_dir, "rooms.json")
-        # --------------------------------------------------------
-
         # Load data
         self.load_data()
 
@@ -30,35 +36,22 @@ class BookingSystem:
         self.refresh_rooms_list()
         self.refresh_bookings_list()
 
+        # Show bookings made from other windows or processes
+        self.root.after(CHANGE_POLL_MS, self.poll_external_changes)
+
     # ---------------------- Data Management ----------------------
     def load_data(self):
-        if os.path.exists(self.bookings_file):
-            with open(self.bookings_file, 'r') as f:
-                self.bookings = json.load(f)
-        else:
-            self.bookings = []
+        # Rooms, bookings and availability live in the UI-free service
+        self.service = BookingService(storage=self.storage)
+        self.rooms = self.service.rooms
+        self.room_catalog = self.service.room_catalog
 
-        if os.path.exists(self.rooms_file):
-            with open(self.rooms_file, 'r') as f:
-                self.rooms = json.load(f)
-        else:
-            # Default rooms
-            self.rooms = [
-                {"id": 1, "name": "A mall Meeting Room", "capacity": 4, "equipment": ["Monitor", "Whiteboard"]},
-                {"id": 2, "name": "Medium Conference Room", "capacity": 8, "equipment": ["Projector", "Whiteboard", "TV"]},
-                {"id": 3, "name": "Large Conference Room", "capacity": 12, "equipment": ["Projector", "Video Conferencing", "Smart Board", "Sound System"]},
-                {"id": 4, "name": "Executive Boardroom", "capacity": 6, "equipment": [ "Premium Sound", "Video Conferencing", "Smart Table"]},
-                {"id": 5, "name": "Training Room", "capacity": 15, "equipment": ["Projector", "Whiteboard", "Sound System", "Multiple Monitors"]}
-            ]
-            self.save_rooms()
-
-    def save_bookings(self):
-        with open(self.bookings_file, 'w') as f:
-            json.dump(self.bookings, f, indent=4)
+        # Per-date booking counts of the month shown in the calendar
+        self.calendar_month = None
+        self.calendar_counts = {}
 
     def save_rooms(self):
-        with open(self.rooms_file, 'w') as f:
-            json.dump(self.rooms, f, indent=4)
+        self.service.save_rooms()
 
     # ---------------------- UI Setup ----------------------
     def setup_ui(self):
@@ -98,8 +91,7 @@ class BookingSystem:
         self.equipment_var = tk.StringVar(value="")
         equipment_frame = ttk.Frame(left_frame)
         equipment_frame.grid(row=1, column=1, sticky="ew", pady=5)
-        all_equipment = set(eq for room in self.rooms for eq in room['equipment'])
-        for i, eq in enumerate(sorted(all_equipment)):
+        for i, eq in enumerate(self.room_catalog.all_equipment()):
             rb = ttk.Radiobutton(equipment_frame, text=eq, value=eq, variable=self.equipment_var,
                                  command=self.filter_rooms_by_equipment)
             rb.grid(row=i // 2, column=i % 2, sticky="w", padx=(0, 10))
@@ -150,6 +142,10 @@ class BookingSystem:
         ttk.Button(button_frame, text="Check Availability", command=self.check_availability).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Book Room", command=self.book_room).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="View Available Slots", command=self.view_available_slots).pack(side=tk.LEFT, padx=5)
+        ttk.Button(left_frame, text="🔍 Find Any Room (next 7 days)", command=self.find_any_room).grid(
+            row=11, column=0, columnspan=2, pady=(0, 10))
+        ttk.Button(left_frame, text="🔁 Recurring / CSV Bulk Booking", command=self.open_bulk_booking).grid(
+            row=12, column=0, columnspan=2, pady=(0, 10))
 
         # -------------------- Middle Panel --------------------
         middle_frame = ttk.LabelFrame(main_frame, text="Calendar View", padding="5")
@@ -168,6 +164,7 @@ class BookingSystem:
 
         self.cal_frame = ttk.Frame(middle_frame)
         self.cal_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self.month_calendar = MonthCalendar(self.cal_frame)
 
         # -------------------- Right Panel --------------------
         right_frame = ttk.LabelFrame(main_frame, text="Current Bookings", padding="10")
@@ -189,7 +186,9 @@ class BookingSystem:
         actions_frame.grid(row=1, column=0, columnspan=2, pady=10)
         ttk.Button(actions_frame, text="View Details", command=self.view_booking_details).pack(side=tk.LEFT, padx=5)
         ttk.Button(actions_frame, text="Cancel Booking", command=self.cancel_booking).pack(side=tk.LEFT, padx=5)
-        ttk.Button(actions_frame, text="Refresh", command=self.refresh_bookings_list).pack(side=tk.LEFT, padx=5)
+        ttk.Button(actions_frame, text="Refresh", command=self.refresh_all).pack(side=tk.LEFT, padx=5)
+        ttk.Button(actions_frame, text="📊 Utilization", command=self.show_utilization).pack(side=tk.LEFT, padx=5)
+        ttk.Button(actions_frame, text="📜 Month History", command=self.show_month_history).pack(side=tk.LEFT, padx=5)
 
         # Initialize calendar & time slots
         self.current_date = datetime.now()
@@ -227,20 +226,15 @@ class BookingSystem:
     
     def filter_rooms_by_capacity(self):
         participants = self.participants_var.get()
-        filtered_rooms = [room for room in self.rooms if room['capacity'] >= participants]
-        self.update_room_combo(filtered_rooms)
+        self.update_room_combo(self.room_catalog.matching_rooms(participants))
     
     def filter_rooms_by_equipment(self):
         selected_equipment = self.equipment_var.get()
         participants = self.participants_var.get()
 
-        filtered_rooms = []
-        for room in self.rooms:
-            if room['capacity'] >= participants:
-                if selected_equipment == "" or selected_equipment in room['equipment']:
-                    filtered_rooms.append(room)
-
-        self.update_room_combo(filtered_rooms)
+        # One combined capacity + equipment bitset filter
+        equipment = [selected_equipment] if selected_equipment else []
+        self.update_room_combo(self.room_catalog.matching_rooms(participants, equipment))
 
     
     def update_room_combo(self, rooms):
@@ -380,47 +374,10 @@ class BookingSystem:
     
     def validate_booking_time(self):
         try:
-            selected_date = datetime.strptime(self.date_var.get(), "%Y-%m-%d").date()
-            today = datetime.now().date()
-            
-            # Check if date is in the past
-            if selected_date < today:
-                messagebox.showerror("Error", "Cannot book rooms for past dates!")
-                return False
-            
-            start_time = datetime.strptime(self.start_time_var.get(), "%H:%M").time()
-            end_time = datetime.strptime(self.end_time_var.get(), "%H:%M").time()
-            
-            # Check if start and end times are the same
-            if start_time == end_time:
-                messagebox.showerror("Error", "Start time and end time cannot be the same!")
-                return False
-            
-            # Check if end time is after start time
-            if end_time <= start_time:
-                messagebox.showerror("Error", "End time must be after start time!")
-                return False
-            
-            # Check maximum booking duration (2 hours)
-            start_dt = datetime.combine(selected_date, start_time)
-            end_dt = datetime.combine(selected_date, end_time)
-            duration = (end_dt - start_dt).total_seconds() / 3600  # hours
-            
-            if duration > 2:
-                messagebox.showerror("Error", "Maximum booking duration is 2 hours!")
-                return False
-            
-            # If booking for today, check if time is in the future
-            if selected_date == today:
-                current_time = datetime.now().time()
-                if start_time < current_time:
-                    messagebox.showerror("Error", "Cannot book rooms for past times!")
-                    return False
-            
+            self.service.validate_booking_time(self.date_var.get(), self.start_time_var.get(), self.end_time_var.get())
             return True
-            
-        except ValueError:
-            messagebox.showerror("Error", "Invalid date or time format!")
+        except BookingError as e:
+            messagebox.showerror("Error", str(e))
             return False
     
     def check_availability(self):
@@ -445,20 +402,8 @@ class BookingSystem:
             messagebox.showwarning("Availability", f"❌ {room_name} is not available on {date} from {start_time} to {end_time}")
     
     def is_room_available(self, room_name, date, start_time, end_time):
-        # Convert to datetime objects for comparison
-        start_dt = datetime.strptime(f"{date} {start_time}", "%Y-%m-%d %H:%M")
-        end_dt = datetime.strptime(f"{date} {end_time}", "%Y-%m-%d %H:%M")
-        
-        for booking in self.bookings:
-            if booking['room'] == room_name and booking['date'] == date:
-                # Check for time overlap
-                booking_start = datetime.strptime(f"{date} {booking['start_time']}", "%Y-%m-%d %H:%M")
-                booking_end = datetime.strptime(f"{date} {booking['end_time']}", "%Y-%m-%d %H:%M")
-                
-                if (start_dt < booking_end and end_dt > booking_start):
-                    return False
-        
-        return True
+        # Indexed overlap check in the repository
+        return self.service.is_room_available(room_name, date, start_time, end_time)
     
     def book_room(self):
         if not self.validate_booking_time():
@@ -471,32 +416,22 @@ class BookingSystem:
         purpose = self.purpose_entry.get()
         student_id = self.student_id_entry.get().strip()
         
-        if not all([room_name, date, start_time, end_time, purpose, student_id]):
-            messagebox.showerror("Error", "Please fill all required fields including Student ID")
-            return
-        
-        # Check availability
-        if not self.is_room_available(room_name, date, start_time, end_time):
-            messagebox.showerror("Error", "The room is not available at the selected time")
+        # Validate, check availability and create the booking
+        try:
+            booking = self.service.book(room_name, date, start_time, end_time, purpose,
+                                        self.participants_var.get(), student_id)
+        except BookingError as e:
+            # A conflict may come from a booking made elsewhere; show it
+            self.pick_up_external_changes()
+            messagebox.showerror("Error", str(e))
             return
+        booking_id = booking['id']
         
-        # Create booking
-        booking_id = len(self.bookings) + 1
-        booking = {
-            "id": booking_id,
-            "room": room_name,
-            "date": date,
-            "start_time": start_time,
-            "end_time": end_time,
-            "purpose": purpose,
-            "participants": self.participants_var.get(),
-            "student_id": student_id,
-            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
-        self.bookings.append(booking)
-        self.save_bookings()
-        self.refresh_bookings_list()  # This will now also refresh the calendar
+        # A full refresh already includes the new booking
+        if not self.pick_up_external_changes():
+            self.update_calendar_count(date, 1)
+            self.add_booking_row(booking)
+            self.update_calendar()
         
         messagebox.showinfo("Success", f"✅ Room booked successfully!\nBooking ID: {booking_id}\n{room_name} on {date} from {start_time} to {end_time}")
         
@@ -523,61 +458,12 @@ class BookingSystem:
             messagebox.showerror("Error", "Invalid date format. Please use YYYY-MM-DD format.")
             return
 
-        # Get all bookings for this room on this date
-        room_bookings = [b for b in self.bookings if b["room"] == room_name and b["date"] == date]
-        
-        # Define all possible time slots (08:00–20:00, 30-min intervals)
-        all_slots = []
-        start_time = datetime.strptime("08:00", "%H:%M")
-        end_time = datetime.strptime("20:00", "%H:%M")
-        
-        current = start_time
-        while current < end_time:
-            slot_end = current + timedelta(minutes=30)
-            all_slots.append((
-                current.strftime("%H:%M"),
-                slot_end.strftime("%H:%M")
-            ))
-            current = slot_end
+        # Slot bitmap for this room on this date (08:00–20:00, 30-min slots)
+        occupancy = self.service.day_occupancy(room_name, date)
 
-        # Convert booked times to 30-minute slots and store booking details
-        booked_slots = []
-        booking_info = {}  # Store booking information for each slot
-        
-        for booking in room_bookings:
-            try:
-                booking_start = datetime.strptime(booking["start_time"], "%H:%M")
-                booking_end = datetime.strptime(booking["end_time"], "%H:%M")
-                
-                # Break down the booking into 30-minute intervals
-                current_slot = booking_start
-                while current_slot < booking_end:
-                    slot_end = current_slot + timedelta(minutes=30)
-                    slot_key = (current_slot.strftime("%H:%M"), slot_end.strftime("%H:%M"))
-                    booked_slots.append(slot_key)
-                    
-                    # Store booking information
-                    booking_info[slot_key] = {
-                        'purpose': booking['purpose'],
-                        'participants': booking.get('participants', 'N/A')
-                    }
-                    current_slot = slot_end
-            except ValueError:
-                continue  # Skip invalid time formats
-
-        # Find available and booked slots
-        available_slots = []
-        booked_slots_detailed = []
-        
-        for slot in all_slots:
-            slot_str = f"{slot[0]} - {slot[1]}"
-            if slot in booked_slots:
-                # This slot is booked, get booking details
-                details = booking_info.get(slot, {})
-                purpose = details.get('purpose', 'Unknown purpose')
-                booked_slots_detailed.append(f"{slot_str} (Booked: {purpose})")
-            else:
-                available_slots.append(slot_str)
+        available_slots = [f"{start} - {end}" for start, end in occupancy.free_slots()]
+        booked_slots_detailed = [f"{start} - {end} (Booked: {booking.get('purpose', 'Unknown purpose')})"
+                                 for (start, end), booking in occupancy.booked_slots()]
 
         # Create a new window to display both available and booked slots
         slot_window = tk.Toplevel(self.root)
@@ -638,23 +524,258 @@ class BookingSystem:
         ttk.Button(button_frame, text="Close", 
                 command=slot_window.destroy).pack()
         
+    def free_slots_all_rooms(self, date):
+        return self.service.free_slots_all_rooms(date)
+
+    def search_rooms(self, first_date, days, start_time, end_time, participants, equipment=()):
+        return self.service.search_rooms(first_date, days, start_time, end_time, participants, equipment)
+
+    def find_any_room(self):
+        if not self.validate_booking_time():
+            return
+
+        date = self.date_var.get()
+        start_time = self.start_time_var.get()
+        end_time = self.end_time_var.get()
+        participants = self.participants_var.get()
+        selected_equipment = self.equipment_var.get()
+        equipment = [selected_equipment] if selected_equipment else []
+
+        try:
+            results = self.search_rooms(date, 7, start_time, end_time, participants, equipment)
+        except BookingError as e:
+            messagebox.showerror("Find Any Room", f"❌ {e}")
+            return
+        if not results:
+            messagebox.showwarning("Find Any Room", f"❌ No room is free from {start_time} to {end_time} in the next 7 days")
+            return
+
+        result_window = tk.Toplevel(self.root)
+        result_window.title("Find Any Room")
+        result_window.geometry("600x400")
+
+        ttk.Label(result_window, text=f"Free rooms for {participants} people, {start_time} - {end_time} (best fit first)",
+                  font=("Arial", 10, "bold")).pack(pady=10)
+
+        columns = ('room', 'date', 'capacity')
+        results_tree = ttk.Treeview(result_window, columns=columns, show='headings', height=12)
+        for col, width in zip(columns, [250, 120, 80]):
+            results_tree.heading(col, text=col.capitalize())
+            results_tree.column(col, width=width)
+        for result in results:
+            results_tree.insert('', tk.END, values=(result['room'], result['date'], result['capacity']))
+        results_tree.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        def use_selected(event=None):
+            selected = results_tree.selection()
+            if not selected:
+                return
+            room_name, result_date, capacity = results_tree.item(selected[0])['values']
+            self.room_var.set(room_name)
+            self.on_room_select()
+            self.date_var.set(result_date)
+            result_window.destroy()
+
+        results_tree.bind('<Double-1>', use_selected)
+        ttk.Button(result_window, text="Use Selected Room", command=use_selected).pack(pady=10)
+
+    def open_bulk_booking(self):
+        bulk_window = tk.Toplevel(self.root)
+        bulk_window.title("Recurring / Bulk Booking")
+        bulk_window.geometry("520x420")
+
+        # Weekly repeat of the slot filled in on the booking form
+        weekly_frame = ttk.LabelFrame(bulk_window, text="Repeat the booking form weekly", padding="10")
+        weekly_frame.pack(fill=tk.X, padx=10, pady=10)
+        ttk.Label(weekly_frame, text="Same weekday and time for").pack(side=tk.LEFT)
+        weeks_var = tk.IntVar(value=14)
+        ttk.Spinbox(weekly_frame, from_=1, to=MAX_RECURRING_WEEKS, textvariable=weeks_var, width=4).pack(side=tk.LEFT, padx=5)
+        ttk.Label(weekly_frame, text="weeks").pack(side=tk.LEFT)
+
+        # CSV import
+        csv_frame = ttk.LabelFrame(bulk_window, text="Import from CSV", padding="10")
+        csv_frame.pack(fill=tk.X, padx=10)
+        ttk.Label(csv_frame, text=f"Columns: {', '.join(CSV_COLUMNS)}", wraplength=460).pack(anchor="w")
+
+        report = scrolledtext.ScrolledText(bulk_window, height=10, state=tk.DISABLED)
+
+        def show_report(text):
+            report.config(state=tk.NORMAL)
+            report.delete(1.0, tk.END)
+            report.insert(tk.END, text)
+            report.config(state=tk.DISABLED)
+
+        def run(book):
+            try:
+                bookings = book()
+            except BulkBookingError as e:
+                lines = [f"❌ {e}"]
+                for position, request, message in e.problems:
+                    lines.append(f"#{position} {request.get('room')} {request.get('date')} "
+                                 f"{request.get('start_time')}-{request.get('end_time')}: {message}")
+                show_report("\n".join(lines))
+                return
+            except BookingError as e:
+                show_report(f"❌ {e}")
+                return
+            # One redraw for the whole batch
+            self.service.refresh()
+            self.refresh_all()
+            show_report(f"✅ {len(bookings)} booking(s) made")
+
+        def book_weekly():
+            if not self.validate_booking_time():
+                return
+            try:
+                weeks = weeks_var.get()
+            except tk.TclError:
+                show_report("❌ Number of weeks must be a whole number")
+                return
+            run(lambda: self.service.book_recurring(
+                self.room_var.get(), self.date_var.get(), weeks, self.start_time_var.get(),
+                self.end_time_var.get(), self.purpose_entry.get(), self.participants_var.get(),
+                self.student_id_entry.get().strip()))
+
+        def import_csv():
+            path = filedialog.askopenfilename(parent=bulk_window, title="Import bookings",
+                                              filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+            if not path:
+                return
+            try:
+                with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+                    requests = read_bookings_csv(f)
+            except (OSError, ValueError) as e:
+                show_report(f"❌ {e}")
+                return
+            run(lambda: self.service.book_many(requests))
+
+        ttk.Button(weekly_frame, text="Book Weekly", command=book_weekly).pack(side=tk.RIGHT)
+        ttk.Button(csv_frame, text="Choose CSV File...", command=import_csv).pack(anchor="e", pady=(5, 0))
+        report.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    def show_utilization(self):
+        # The three months up to the one shown in the calendar
+        last = self.current_date.replace(day=1)
+        first = last
+        for _ in range(2):
+            first = (first - timedelta(days=1)).replace(day=1)
+        first_month, last_month = first.strftime("%Y-%m"), last.strftime("%Y-%m")
+        report = self.service.utilization_report(first_month, last_month)
+
+        stats_window = tk.Toplevel(self.root)
+        stats_window.title("Room Utilization")
+        stats_window.geometry("900x650")
+        ttk.Label(stats_window, text=f"Room utilization {first.strftime('%B %Y')} - {last.strftime('%B %Y')}",
+                  font=("Arial", 12, "bold")).pack(pady=10)
+
+        top_frame = ttk.Frame(stats_window)
+        top_frame.pack(fill=tk.X, padx=10)
+
+        # Occupancy per room
+        columns = ('room', 'occupancy', 'bookings')
+        rooms_tree = ttk.Treeview(top_frame, columns=columns, show='headings', height=6)
+        for col, width in zip(columns, [220, 90, 80]):
+            rooms_tree.heading(col, text=col.capitalize())
+            rooms_tree.column(col, width=width)
+        for room_name, share in sorted(report['by_room'].items(), key=lambda item: -item[1]):
+            rooms_tree.insert('', tk.END, values=(room_name, f"{share:.0%}", report['bookings'].get(room_name, 0)))
+        rooms_tree.pack(side=tk.LEFT, padx=(0, 10))
+
+        # Busiest slots and likely no-shows
+        notes = scrolledtext.ScrolledText(top_frame, width=45, height=8)
+        notes.insert(tk.END, "🔥 Peak slots:\n")
+        for weekday, slot, count in report['peak_slots']:
+            notes.insert(tk.END, f"  {weekday} {slot}: {count} booking(s)\n")
+        notes.insert(tk.END, "\n⚠️ Possible no-shows (next 7 days):\n")
+        candidates = self.service.no_show_candidates()
+        for booking in candidates:
+            notes.insert(tk.END, f"  {booking['date']} {booking['start_time']} {booking['room']} - "
+                                 f"{booking['student_id']} ({booking['late_cancellations']} late cancellations)\n")
+        if not candidates:
+            notes.insert(tk.END, "  None\n")
+        notes.config(state=tk.DISABLED)
+        notes.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # Weekday x half-hour heatmap
+        heat_frame = ttk.LabelFrame(stats_window, text="Peak hours (all rooms)", padding="5")
+        heat_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        heatmap = report['heatmap']
+        hottest = max(max(row) for row in heatmap) or 1
+        for col, (start, end) in enumerate(SLOT_LABELS):
+            if col % 2 == 0:
+                ttk.Label(heat_frame, text=start, font=("Arial", 7)).grid(row=0, column=col + 1, columnspan=2)
+        for day, row in enumerate(heatmap):
+            ttk.Label(heat_frame, text=WEEKDAYS[day], font=("Arial", 8)).grid(row=day + 1, column=0, padx=(0, 5))
+            for col, count in enumerate(row):
+                # White (idle) to red (busiest)
+                shade = 255 - int(200 * count / hottest)
+                tk.Label(heat_frame, width=2, bg=f"#ff{shade:02x}{shade:02x}", relief=tk.FLAT).grid(
+                    row=day + 1, column=col + 1, sticky="nsew", padx=1, pady=1)
+
+        ttk.Button(stats_window, text="Close", command=stats_window.destroy).pack(pady=(0, 10))
+
+    def show_month_history(self):
+        """Every booking of the month shown in the calendar; past months come from the archive"""
+        year, month = self.current_date.year, self.current_date.month
+        bookings = self.service.month_bookings(year, month)
+
+        history_window = tk.Toplevel(self.root)
+        history_window.title("Booking History")
+        history_window.geometry("700x450")
+        ttk.Label(history_window, text=f"Bookings in {self.current_date.strftime('%B %Y')} ({len(bookings)})",
+                  font=("Arial", 12, "bold")).pack(pady=10)
+
+        columns = ('room', 'date', 'time', 'purpose', 'student_id')
+        history_tree = ttk.Treeview(history_window, columns=columns, show='headings', height=15)
+        for col, width in zip(columns, [180, 90, 100, 180, 100]):
+            history_tree.heading(col, text=col.capitalize())
+            history_tree.column(col, width=width)
+        scrollbar = ttk.Scrollbar(history_window, orient=tk.VERTICAL, command=history_tree.yview)
+        history_tree.configure(yscroll=scrollbar.set)
+        for booking in bookings:
+            history_tree.insert('', tk.END, values=(booking['room'], booking['date'],
+                                                    f"{booking['start_time']}-{booking['end_time']}",
+                                                    booking['purpose'], booking.get('student_id', 'N/A')))
+        history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=(0, 10))
+        scrollbar.pack(side=tk.LEFT, fill=tk.Y, pady=(0, 10), padx=(0, 10))
+
     def refresh_bookings_list(self):
+        """Full rebuild of the bookings list, used on (re)load"""
         # Clear current items
         for item in self.bookings_tree.get_children():
             self.bookings_tree.delete(item)
+        self.tree_keys = []  # Sorted (date, start_time, room, id) of every row
         
         # Add bookings to treeview
-        for booking in sorted(self.bookings, key=lambda x: (x['date'], x['start_time'])):
-            self.bookings_tree.insert('', tk.END, values=(
-                booking['room'],
-                booking['date'],
-                f"{booking['start_time']} - {booking['end_time']}",
-                booking['purpose'],
-                booking.get('student_id', 'N/A')
-            ))
+        for booking in self.service.list_bookings():
+            self.add_booking_row(booking)
         
         # Also refresh the calendar view to update booking counts
         self.update_calendar()
+
+    def booking_row_key(self, booking):
+        return (booking['date'], booking['start_time'], booking['room'], booking['id'])
+
+    def add_booking_row(self, booking):
+        # Insert at the sorted position instead of re-rendering every row
+        key = self.booking_row_key(booking)
+        pos = bisect_left(self.tree_keys, key)
+        self.tree_keys.insert(pos, key)
+        # The row's iid is the booking id, so selections map straight to records
+        self.bookings_tree.insert('', pos, iid=str(booking['id']), values=(
+            booking['room'],
+            booking['date'],
+            f"{booking['start_time']} - {booking['end_time']}",
+            booking['purpose'],
+            booking.get('student_id', 'N/A')
+        ))
+
+    def remove_booking_row(self, booking):
+        key = self.booking_row_key(booking)
+        pos = bisect_left(self.tree_keys, key)
+        if pos < len(self.tree_keys) and self.tree_keys[pos] == key:
+            del self.tree_keys[pos]
+            self.bookings_tree.delete(str(booking['id']))
     
     def view_booking_details(self):
         selected_item = self.bookings_tree.selection()
@@ -662,14 +783,8 @@ class BookingSystem:
             messagebox.showwarning("Warning", "Please select a booking to view details")
             return
         
-        item = self.bookings_tree.item(selected_item[0])
-        room, date, time, purpose, student_id = item['values']  # Added student_id
-        
-        # Find the complete booking details
-        booking = next((b for b in self.bookings if 
-                    b['room'] == room and 
-                    b['date'] == date and 
-                    f"{b['start_time']} - {b['end_time']}" == time), None)
+        # Row iids are booking ids
+        booking = self.service.get_booking(int(selected_item[0]))
         
         if booking:
             details = f"📋 Booking ID: {booking['id']}\n"
@@ -689,105 +804,67 @@ class BookingSystem:
             messagebox.showwarning("Warning", "Please select a booking to cancel")
             return
         
-        item = self.bookings_tree.item(selected_item[0])
-        room, date, time, purpose, student_id = item['values']
+        booking = self.service.get_booking(int(selected_item[0]))
+        if not booking:
+            return
+        time = f"{booking['start_time']} - {booking['end_time']}"
         
         # Confirm cancellation
         if messagebox.askyesno("Confirm Cancellation", 
-                            f"Are you sure you want to cancel the booking for {room} on {date} at {time}?"):
-            # Find and remove the booking
-            for i, booking in enumerate(self.bookings):
-                if (booking['room'] == room and 
-                    booking['date'] == date and 
-                    f"{booking['start_time']} - {booking['end_time']}" == time):
-                    del self.bookings[i]
-                    self.save_bookings()
-                    self.refresh_bookings_list()  # This will now also refresh the calendar
-                    messagebox.showinfo("Success", "✅ Booking cancelled successfully")
-                    return
+                            f"Are you sure you want to cancel the booking for {booking['room']} on {booking['date']} at {time}?"):
+            try:
+                self.service.cancel(booking['id'])
+            except BookingError as e:
+                # Already cancelled from another window or process
+                self.pick_up_external_changes()
+                messagebox.showerror("Error", str(e))
+                return
+            if not self.pick_up_external_changes():
+                self.update_calendar_count(booking['date'], -1)
+                self.remove_booking_row(booking)
+                self.update_calendar()
+            messagebox.showinfo("Success", "✅ Booking cancelled successfully")
                 
     def refresh_all(self):
         """Refresh both bookings list and calendar"""
+        self.calendar_month = None  # Re-read the month counts
         self.refresh_bookings_list()
-        self.update_calendar()
+
+    def pick_up_external_changes(self):
+        """Redraw everything if other processes changed bookings; True if they did"""
+        if self.service.refresh():
+            self.refresh_all()
+            return True
+        return False
+
+    def on_show(self):
+        # Re-shown from the launcher's window cache: only catch up, never reload
+        self.pick_up_external_changes()
+
+    def poll_external_changes(self):
+        if not self.root.winfo_exists():
+            return
+        self.pick_up_external_changes()
+        self.root.after(CHANGE_POLL_MS, self.poll_external_changes)
+
+    def update_calendar_count(self, date, delta):
+        """Keep the visible month's counts in step with a single booking change"""
+        if self.calendar_month == (int(date[:4]), int(date[5:7])):
+            self.calendar_counts[date] = self.calendar_counts.get(date, 0) + delta
     
     def update_calendar(self):
-        # Clear previous calendar
-        for widget in self.cal_frame.winfo_children():
-            widget.destroy()
-        
         # Set month and year label
         self.month_year_var.set(self.current_date.strftime("%B %Y"))
-        
-        # Get calendar for the current month
-        cal = calendar.monthcalendar(self.current_date.year, self.current_date.month)
-        
-        # Create day headers
-        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        for i, day in enumerate(days):
-            label = ttk.Label(self.cal_frame, text=day, font=("Arial", 7, "bold"), 
-                            foreground="black", anchor="center")
-            label.grid(row=0, column=i, sticky="nsew", padx=1, pady=1)
-        
-        # Create calendar days with smaller uniform size
-        today = datetime.now().date()
-        max_weeks = 6  # Maximum number of weeks to display for consistent size
-        
-        for week_idx in range(max_weeks):
-            for day_idx in range(7):
-                day_frame = ttk.Frame(self.cal_frame, relief=tk.RAISED, borderwidth=1)
-                day_frame.grid(row=week_idx+1, column=day_idx, sticky="nsew", padx=1, pady=1)
-                
-                # Configure smaller uniform cell size
-                day_frame.grid_propagate(False)  # Prevent frame from resizing to content
-                day_frame.config(width=30, height=15)  # Reduced from 80x60 to 60x45
-                
-                if week_idx < len(cal) and day_idx < len(cal[week_idx]):
-                    day = cal[week_idx][day_idx]
-                    if day != 0:
-                        date_str = f"{self.current_date.year}-{self.current_date.month:02d}-{day:02d}"
-                        day_date = datetime(self.current_date.year, self.current_date.month, day).date()
-                        
-                        # Check if there are bookings on this day
-                        booking_count = sum(1 for b in self.bookings if b['date'] == date_str)
-                        
-                        # Style based on date
-                        if day_date == today:
-                            day_label = ttk.Label(day_frame, text=str(day), 
-                                                font=("Arial", 8, "bold"),  # Smaller font
-                                                foreground="white", background="#27ae60",
-                                                anchor="center")
-                        elif day_date < today:
-                            day_label = ttk.Label(day_frame, text=str(day), 
-                                                font=("Arial", 8),  # Smaller font
-                                                foreground="#95a5a6", anchor="center")
-                        else:
-                            day_label = ttk.Label(day_frame, text=str(day), 
-                                                font=("Arial", 8),  # Smaller font
-                                                foreground="black", anchor="center")
-                        
-                        day_label.place(relx=0.5, rely=0.3, anchor="center")
-                        
-                        if booking_count > 0:
-                            color = "#e74c3c" if booking_count > 2 else "#f39c12" if booking_count > 1 else "#27ae60"
-                            booking_label = ttk.Label(day_frame, text=f"📅{booking_count}", 
-                                                    foreground=color, font=("Arial", 6),  # Smaller font
-                                                    anchor="center")
-                            booking_label.place(relx=0.5, rely=0.7, anchor="center")
-                    else:
-                        # Empty cell for days not in this month
-                        empty_label = ttk.Label(day_frame, text="", background="light gray")
-                        empty_label.pack(fill=tk.BOTH, expand=True)
-                else:
-                    # Empty cell for extra weeks
-                    empty_label = ttk.Label(day_frame, text="", background="light gray")
-                    empty_label.pack(fill=tk.BOTH, expand=True)
-        
-        # Configure grid weights for uniform cell sizing
-        for i in range(7):  # 7 columns
-            self.cal_frame.columnconfigure(i, weight=1, uniform="calendar_col")
-        for i in range(max_weeks + 1):  # +1 for header row
-            self.cal_frame.rowconfigure(i, weight=1, uniform="calendar_row")
+
+        # Booking counts for the whole month, fetched once per month shown
+        month_key = (self.current_date.year, self.current_date.month)
+        if self.calendar_month != month_key:
+            self.calendar_counts = self.service.month_counts(*month_key)
+            self.calendar_month = month_key
+
+        # Only cells whose day, style or count changed are reconfigured
+        self.month_calendar.render(self.current_date.year, self.current_date.month,
+                                   self.calendar_counts, datetime.now().date())
     
     def change_month(self, delta):
         # Calculate new month
@@ -801,7 +878,8 @@ class BookingSystem:
             month = 12
             year -= 1
         
-        self.current_date = self.current_date.replace(year=year, month=month)
+        # Day 1 exists in every month, unlike e.g. the 31st
+        self.current_date = self.current_date.replace(year=year, month=month, day=1)
         self.update_calendar()
 
 def main():
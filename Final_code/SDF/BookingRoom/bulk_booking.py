@@ -0,0 +1,46 @@
+import csv
+from datetime import datetime, timedelta
+
+# Columns of a bulk-import CSV; participants is optional and defaults to 2
+CSV_COLUMNS = ("room", "date", "start_time", "end_time", "purpose", "participants", "student_id")
+REQUIRED_COLUMNS = ("room", "date", "start_time", "end_time", "purpose", "student_id")
+
+
+def weekly_dates(first_date, weeks, every=1):
+    """'YYYY-MM-DD' of first_date and the same weekday for `weeks` occurrences"""
+    start = datetime.strptime(first_date, "%Y-%m-%d")
+    return [(start + timedelta(weeks=i * every)).strftime("%Y-%m-%d") for i in range(weeks)]
+
+
+def recurring_requests(room_name, first_date, weeks, start_time, end_time,
+                       purpose, participants, student_id, every=1):
+    """One booking request per week, e.g. every Tuesday 14:00-16:00 for 14 weeks"""
+    return [{
+        "room": room_name,
+        "date": date,
+        "start_time": start_time,
+        "end_time": end_time,
+        "purpose": purpose,
+        "participants": participants,
+        "student_id": student_id
+    } for date in weekly_dates(first_date, weeks, every)]
+
+
+def read_bookings_csv(f):
+    """Booking requests from an open CSV file with a header row of CSV_COLUMNS"""
+    reader = csv.DictReader(f)
+    header = [name.strip() for name in (reader.fieldnames or [])]
+    missing = [name for name in REQUIRED_COLUMNS if name not in header]
+    if missing:
+        raise ValueError(f"CSV is missing column(s): {', '.join(missing)}")
+    reader.fieldnames = header
+
+    requests = []
+    for row in reader:
+        request = {name: (row.get(name) or "").strip() for name in CSV_COLUMNS}
+        try:
+            request["participants"] = int(request["participants"] or 2)
+        except ValueError:
+            pass  # Reported with the other problems when the batch is checked
+        requests.append(request)
+    return requests
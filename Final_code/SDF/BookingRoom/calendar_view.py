@@ -0,0 +1,101 @@
+import tkinter as tk
+from tkinter import ttk
+from datetime import date
+import calendar
+
+MAX_WEEKS = 6  # Maximum number of weeks to display for consistent size
+EMPTY_BG = "light gray"
+UNDRAWN = object()  # Initial cell state, never equal to a real one
+
+
+class MonthCalendar:
+    """6x7 month grid built once and reconfigured in place.
+
+    Every cell keeps the state it was last drawn with, so a redraw only
+    touches the widgets of cells whose day, style or booking count changed.
+    """
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.cells = []
+
+        # Day headers
+        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+        for i, day in enumerate(days):
+            label = ttk.Label(parent, text=day, font=("Arial", 7, "bold"),
+                              foreground="black", anchor="center")
+            label.grid(row=0, column=i, sticky="nsew", padx=1, pady=1)
+
+        for week_idx in range(MAX_WEEKS):
+            for day_idx in range(7):
+                day_frame = ttk.Frame(parent, relief=tk.RAISED, borderwidth=1)
+                day_frame.grid(row=week_idx+1, column=day_idx, sticky="nsew", padx=1, pady=1)
+                day_frame.grid_propagate(False)  # Prevent frame from resizing to content
+                day_frame.config(width=30, height=15)
+
+                self.cells.append({
+                    "day_label": ttk.Label(day_frame, anchor="center"),
+                    "count_label": ttk.Label(day_frame, font=("Arial", 6), anchor="center"),
+                    "empty_label": ttk.Label(day_frame, text="", background=EMPTY_BG),
+                    "state": UNDRAWN
+                })
+
+        # Configure grid weights for uniform cell sizing
+        for i in range(7):
+            parent.columnconfigure(i, weight=1, uniform="calendar_col")
+        for i in range(MAX_WEEKS + 1):  # +1 for header row
+            parent.rowconfigure(i, weight=1, uniform="calendar_row")
+
+    def render(self, year, month, booking_counts, today=None):
+        today = today or date.today()
+        weeks = calendar.monthcalendar(year, month)
+
+        for week_idx in range(MAX_WEEKS):
+            for day_idx in range(7):
+                day = weeks[week_idx][day_idx] if week_idx < len(weeks) else 0
+                if day == 0:
+                    state = None
+                else:
+                    day_date = date(year, month, day)
+                    if day_date == today:
+                        style = "today"
+                    elif day_date < today:
+                        style = "past"
+                    else:
+                        style = "future"
+                    count = booking_counts.get(f"{year}-{month:02d}-{day:02d}", 0)
+                    state = (day, style, count)
+                self._draw_cell(self.cells[week_idx * 7 + day_idx], state)
+
+    def _draw_cell(self, cell, state):
+        if cell["state"] == state:
+            return
+        cell["state"] = state
+
+        if state is None:
+            # Empty cell for days not in this month
+            cell["day_label"].place_forget()
+            cell["count_label"].place_forget()
+            cell["empty_label"].place(relx=0, rely=0, relwidth=1, relheight=1)
+            return
+
+        day, style, count = state
+        cell["empty_label"].place_forget()
+
+        if style == "today":
+            cell["day_label"].configure(text=str(day), font=("Arial", 8, "bold"),
+                                        foreground="white", background="#27ae60")
+        elif style == "past":
+            cell["day_label"].configure(text=str(day), font=("Arial", 8),
+                                        foreground="#95a5a6", background="")
+        else:
+            cell["day_label"].configure(text=str(day), font=("Arial", 8),
+                                        foreground="black", background="")
+        cell["day_label"].place(relx=0.5, rely=0.3, anchor="center")
+
+        if count > 0:
+            color = "#e74c3c" if count > 2 else "#f39c12" if count > 1 else "#27ae60"
+            cell["count_label"].configure(text=f"📅{count}", foreground=color)
+            cell["count_label"].place(relx=0.5, rely=0.7, anchor="center")
+        else:
+            cell["count_label"].place_forget()
@@ -0,0 +1,46 @@
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Exclusive lock shared between app instances, held on a small lock file.
+
+    Uses fcntl.flock on POSIX and msvcrt.locking on Windows. The lock is
+    re-entrant within one object, so nested `with lock:` blocks are fine.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.handle = None
+        self.depth = 0
+
+    def __enter__(self):
+        if self.depth == 0:
+            self.handle = open(self.path, 'a+')
+            if fcntl:
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX)
+            else:
+                self.handle.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(self.handle.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue  # LK_LOCK gives up after ~10 seconds; keep waiting
+        self.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.depth -= 1
+        if self.depth == 0:
+            if fcntl:
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+            else:
+                self.handle.seek(0)
+                msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+            self.handle.close()
+            self.handle = None
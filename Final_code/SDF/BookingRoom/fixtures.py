@@ -0,0 +1,9 @@
+"""Shared test data for the BookingRoom tests"""
+
+
+def booking(booking_id, start="09:00", end="10:00", room="Room A", date="2030-01-07", **fields):
+    """A complete booking record; keyword fields override or add to the defaults"""
+    record = {"id": booking_id, "room": room, "date": date, "start_time": start, "end_time": end,
+              "purpose": "Study", "participants": 2, "student_id": "S1", "created_at": "2030-01-01 08:00:00"}
+    record.update(fields)
+    return record
@@ -0,0 +1,44 @@
+import json
+import os
+
+from BookingRoom.file_lock import FileLock
+
+
+class BookingIdSequence:
+    """Persistent, monotonic booking id counter stored next to the bookings.
+
+    Ids are never reused, even after cancellations, and the read-increment-
+    write cycle runs under a file lock so two app instances cannot hand out
+    the same id.
+    """
+
+    def __init__(self, seq_file, lock=None):
+        self.seq_file = seq_file
+        self.lock = lock or FileLock(seq_file + ".lock")
+
+    def _read(self):
+        if not os.path.exists(self.seq_file):
+            return 0
+        try:
+            with open(self.seq_file, 'r') as f:
+                return json.load(f)["last_id"]
+        except (ValueError, KeyError):
+            return 0
+
+    def _write(self, last_id):
+        tmp_file = self.seq_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump({"last_id": last_id}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.seq_file)
+
+    def next_id(self, floor=0, count=1):
+        """Allocate the next id, or the first of `count` consecutive ids.
+
+        `floor` is the highest id already in use.
+        """
+        with self.lock:
+            first_id = max(self._read(), floor) + 1
+            self._write(first_id + count - 1)
+            return first_id
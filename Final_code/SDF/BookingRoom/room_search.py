@@ -0,0 +1,99 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+from BookingRoom.booking_index import to_minutes
+from BookingRoom.slot_bitmap import interval_mask, occupancy_by_room
+
+
+class RoomCatalog:
+    """Precomputed capacity and equipment indexes over the room list.
+
+    Rooms are numbered in capacity order and every index is a bitset over
+    those numbers, so a capacity + equipment filter is a handful of ANDs.
+    """
+
+    def __init__(self, rooms):
+        self.rooms = {room['name']: room for room in rooms}
+
+        # Rooms sorted by capacity: "capacity >= n" is every bit from one bisect up
+        ordered = sorted(rooms, key=lambda r: (r['capacity'], r['name']))
+        self.capacities = [room['capacity'] for room in ordered]
+        self.names_by_capacity = [room['name'] for room in ordered]
+        self.all_rooms_mask = (1 << len(ordered)) - 1
+
+        # Equipment bit numbers, each room's equipment mask, and the inverted
+        # index equipment -> bitset of rooms that have it
+        self.equipment_bits = {}
+        self.equipment_masks = {}
+        self.rooms_with = {}
+        for position, room in enumerate(ordered):
+            mask = 0
+            for item in room['equipment']:
+                bit = self.equipment_bits.setdefault(item, 1 << len(self.equipment_bits))
+                mask |= bit
+                self.rooms_with[item] = self.rooms_with.get(item, 0) | (1 << position)
+            self.equipment_masks[room['name']] = mask
+
+    def all_equipment(self):
+        return sorted(self.equipment_bits)
+
+    def matching_mask(self, participants, equipment=()):
+        """Bitset of rooms seating `participants` that have all `equipment`"""
+        first = bisect_left(self.capacities, participants)
+        mask = self.all_rooms_mask & ~((1 << first) - 1)
+        for item in equipment:
+            mask &= self.rooms_with.get(item, 0)
+        return mask
+
+    def matching(self, participants, equipment=()):
+        """Names of rooms seating `participants` that have all `equipment`, smallest first"""
+        mask = self.matching_mask(participants, equipment)
+        names = []
+        while mask:
+            low_bit = mask & -mask
+            names.append(self.names_by_capacity[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return names
+
+    def matching_rooms(self, participants, equipment=()):
+        return [self.rooms[name] for name in self.matching(participants, equipment)]
+
+
+def search_rooms(catalog, repo, dates, start_time, end_time, participants, equipment=()):
+    """Every (room, date) free for the whole time window, best fit first.
+
+    Best fit means the fewest empty seats, then the least unrequested
+    equipment, then the earliest date.
+    """
+    candidates = catalog.matching(participants, equipment)
+    if not candidates:
+        return []
+    requested = 0
+    for item in equipment:
+        requested |= catalog.equipment_bits[item]  # matching() found rooms, so every item is known
+
+    wanted = interval_mask(to_minutes(start_time), to_minutes(end_time))
+    results = []
+    for date in dates:
+        for room_name, day in occupancy_by_room(repo, candidates, date).items():
+            if day.mask & wanted:
+                continue
+            room = catalog.rooms[room_name]
+            results.append({
+                "room": room_name,
+                "date": date,
+                "start_time": start_time,
+                "end_time": end_time,
+                "capacity": room['capacity'],
+                "spare_seats": room['capacity'] - participants,
+                "extra_equipment": bin(catalog.equipment_masks[room_name] & ~requested).count("1")
+            })
+
+    results.sort(key=lambda r: (r['spare_seats'], r['extra_equipment'], r['date'], r['room']))
+    return results
+
+
+def date_range(first_date, days):
+    """'YYYY-MM-DD' strings for `days` consecutive days starting at first_date"""
+    start = datetime.strptime(first_date, "%Y-%m-%d")
+    return [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
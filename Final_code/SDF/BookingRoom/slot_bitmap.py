@@ -0,0 +1,75 @@
+from BookingRoom.booking_index import to_minutes
+
+# Bookable day: 08:00-20:00 in 30-minute slots, one bit per slot
+DAY_START = 8 * 60
+DAY_END = 20 * 60
+SLOT_MINUTES = 30
+SLOT_COUNT = (DAY_END - DAY_START) // SLOT_MINUTES
+FULL_MASK = (1 << SLOT_COUNT) - 1
+
+
+def _format(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+# ('08:00', '08:30'), ('08:30', '09:00'), ... computed once
+SLOT_LABELS = [(_format(DAY_START + i * SLOT_MINUTES), _format(DAY_START + (i + 1) * SLOT_MINUTES))
+               for i in range(SLOT_COUNT)]
+
+
+def interval_mask(start_minute, end_minute):
+    """Bits of every slot that overlaps [start_minute, end_minute)"""
+    first = max(0, (start_minute - DAY_START) // SLOT_MINUTES)
+    last = min(SLOT_COUNT, -(-(end_minute - DAY_START) // SLOT_MINUTES))
+    if last <= first:
+        return 0
+    return ((1 << last) - 1) ^ ((1 << first) - 1)
+
+
+def slot_indexes(mask):
+    indexes = []
+    while mask:
+        low_bit = mask & -mask
+        indexes.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return indexes
+
+
+class DayOccupancy:
+    """Occupancy of one room on one date as a slot bitmap"""
+
+    def __init__(self, bookings=()):
+        self.mask = 0
+        self.owners = {}  # slot index -> booking occupying it
+        for booking in bookings:
+            self.add(booking)
+
+    def add(self, booking):
+        mask = interval_mask(to_minutes(booking['start_time']), to_minutes(booking['end_time']))
+        self.mask |= mask
+        for i in slot_indexes(mask):
+            self.owners[i] = booking
+
+    def is_free(self, start_time, end_time):
+        return not self.mask & interval_mask(to_minutes(start_time), to_minutes(end_time))
+
+    def free_slots(self):
+        return [SLOT_LABELS[i] for i in slot_indexes(FULL_MASK & ~self.mask)]
+
+    def booked_slots(self):
+        """(slot label, booking) for every occupied slot, in time order"""
+        return [(SLOT_LABELS[i], self.owners[i]) for i in slot_indexes(self.mask)]
+
+
+def occupancy_by_room(repo, room_names, date):
+    """DayOccupancy of every room on a date, from one repository call"""
+    occupancy = {room_name: DayOccupancy() for room_name in room_names}
+    for booking in repo.bookings_on(date, room_names):
+        occupancy[booking['room']].add(booking)
+    return occupancy
+
+
+def free_slots_by_room(repo, room_names, date):
+    """Free 30-minute slots of every room on a date"""
+    return {room_name: day.free_slots()
+            for room_name, day in occupancy_by_room(repo, room_names, date).items()}
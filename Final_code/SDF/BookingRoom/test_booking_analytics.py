@@ -0,0 +1,73 @@
+from datetime import datetime
+import os
+import sys
+import tempfile
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BookingRoom.booking_analytics import LateCancellations, UtilizationRollups, month_span
+from BookingRoom.fixtures import booking
+from BookingRoom.slot_bitmap import SLOT_COUNT
+
+
+class UtilizationRollupsTest(unittest.TestCase):
+    def test_month_span_crosses_years(self):
+        self.assertEqual(month_span("2029-11", "2030-02"), ["2029-11", "2029-12", "2030-01", "2030-02"])
+
+    def test_add_and_remove(self):
+        rollups = UtilizationRollups([booking(1), booking(2, "13:00", "14:00", room="Room B")])
+        heat = rollups.heatmap("2030-01", "2030-01")
+        self.assertEqual(sum(heat[0]), 4)  # 2030-01-07 is a Monday; two hours = four slots
+        rollups.remove(booking(1))
+        self.assertEqual(rollups.booking_counts("2030-01", "2030-01"), {"Room A": 0, "Room B": 1})
+        self.assertEqual(sum(rollups.heatmap("2030-01", "2030-01", {"Room A"})[0]), 0)
+
+    def test_occupancy_by_room(self):
+        rollups = UtilizationRollups([booking(1)])
+        occupancy = rollups.occupancy_by_room("2030-01", "2030-01", ["Room A", "Room B"])
+        self.assertAlmostEqual(occupancy["Room A"], 2 / (31 * SLOT_COUNT))
+        self.assertEqual(occupancy["Room B"], 0.0)
+
+    def test_empty_range_has_zero_occupancy(self):
+        rollups = UtilizationRollups([booking(1)])
+        self.assertEqual(rollups.occupancy_by_room("2030-02", "2030-01", ["Room A"]), {"Room A": 0.0})
+        self.assertEqual(set(rollups.occupancy_by_weekday("2030-02", "2030-01", ["Room A"]).values()), {0.0})
+        self.assertEqual(set(rollups.occupancy_by_slot("2030-02", "2030-01", ["Room A"]).values()), {0.0})
+
+
+class LateCancellationsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.counts_file = os.path.join(self.tmp.name, "late_cancellations.json")
+        self.now = datetime(2030, 1, 7, 8, 0)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_only_late_cancellations_count(self):
+        late = LateCancellations(self.counts_file)
+        late.record(booking(1), self.now)
+        late.record(booking(2, date="2030-01-20"), self.now)
+        late.record(booking(3, student_id=""), self.now)
+        self.assertEqual(LateCancellations(self.counts_file).counts, {"S1": 1})
+
+    def test_instances_do_not_lose_each_others_counts(self):
+        first = LateCancellations(self.counts_file)
+        second = LateCancellations(self.counts_file)
+        first.record(booking(1), self.now)
+        second.record(booking(2), self.now)
+        self.assertEqual(LateCancellations(self.counts_file).counts, {"S1": 2})
+
+    def test_no_show_candidates(self):
+        late = LateCancellations(self.counts_file)
+        for booking_id in range(2):
+            late.record(booking(booking_id), self.now)
+        late.record(booking(5, student_id="S2"), self.now)
+        upcoming = [booking(10, date="2030-02-01"), booking(11, date="2030-02-01", student_id="S2")]
+        self.assertEqual([b['id'] for b in late.no_show_candidates(upcoming)], [10])
+
+
+if __name__ == "__main__":
+    unittest.main()
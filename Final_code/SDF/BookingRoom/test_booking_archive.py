@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+import json
+import os
+import stat
+import sys
+import tempfile
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BookingRoom.booking_archive import BookingArchive
+from BookingRoom.booking_repository import create_repository
+from BookingRoom.fixtures import booking
+
+FUTURE = (datetime.now() + timedelta(days=40)).strftime("%Y-%m-%d")
+PAST_BOOKINGS = [booking(1, date="2020-03-02"), booking(2, "11:00", "12:00", date="2020-03-02"),
+                 booking(3, date="2020-04-15")]
+
+
+class ArchiveTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive_dir = os.path.join(self.tmp.name, "archive")
+        self.repos = []
+
+    def tearDown(self):
+        for repo in self.repos:
+            repo.close()
+        # Archive files are read-only; Windows will not delete them otherwise
+        for name in os.listdir(self.archive_dir) if os.path.isdir(self.archive_dir) else []:
+            os.chmod(os.path.join(self.archive_dir, name), stat.S_IREAD | stat.S_IWRITE)
+        self.tmp.cleanup()
+
+    def write_snapshot(self, bookings):
+        with open(os.path.join(self.tmp.name, "bookings.json"), 'w') as f:
+            json.dump(bookings, f)
+
+    def open(self, storage="json"):
+        repo = create_repository(storage, self.tmp.name)
+        self.repos.append(repo)
+        return repo
+
+    def test_past_months_move_to_the_archive(self):
+        self.write_snapshot(PAST_BOOKINGS + [booking(4, date=FUTURE)])
+        repo = self.open()
+
+        self.assertEqual(repo.archived_months(), ["2020-03", "2020-04"])
+        self.assertEqual([b['id'] for b in repo.all_bookings()], [4])
+        self.assertEqual([b['id'] for b in repo.month_bookings(2020, 3)], [1, 2])
+        self.assertEqual(repo.month_counts(2020, 3), {"2020-03-02": 2})
+        self.assertGreater(repo.next_id(), 4)
+
+        path = os.path.join(self.archive_dir, "bookings-2020-03.json.gz")
+        self.assertFalse(os.stat(path).st_mode & stat.S_IWRITE)
+        with open(os.path.join(self.tmp.name, "bookings.json")) as f:
+            self.assertEqual([b['id'] for b in json.load(f)], [4])
+
+        # A fresh instance answers from the index without loading the month
+        repo = self.open()
+        self.assertEqual(repo.month_counts(2020, 4), {"2020-04-15": 1})
+        self.assertEqual(repo.archive.cache, {})
+
+    def test_rerun_after_interrupted_compact(self):
+        # Crash after the archive was written but before the snapshot dropped the month
+        BookingArchive(self.archive_dir).add(PAST_BOOKINGS)
+        self.write_snapshot(PAST_BOOKINGS + [booking(4, date=FUTURE)])
+        repo = self.open()
+
+        self.assertEqual([b['id'] for b in repo.month_bookings(2020, 3)], [1, 2])
+        self.assertEqual(repo.month_counts(2020, 3), {"2020-03-02": 2})
+        self.assertEqual([b['id'] for b in repo.all_bookings()], [4])
+
+    def test_merge_replaces_by_id(self):
+        archive = BookingArchive(self.archive_dir)
+        archive.add(PAST_BOOKINGS)
+        archive.add([booking(2, "13:00", "14:00", date="2020-03-02")])
+        bookings = BookingArchive(self.archive_dir).load("2020-03")
+        self.assertEqual([(b['id'], b['start_time']) for b in bookings], [(1, "09:00"), (2, "13:00")])
+
+    def test_duplicate_ids_are_repaired(self):
+        self.write_snapshot([booking(7, date=FUTURE), booking(7, "11:00", "12:00", date=FUTURE)])
+        repo = self.open()
+        self.assertEqual(sorted(b['id'] for b in repo.all_bookings()), [7, 8])
+        self.assertEqual(repo.next_id(), 9)
+
+    def test_sqlite_imports_archived_months(self):
+        self.write_snapshot(PAST_BOOKINGS + [booking(4, date=FUTURE)])
+        self.open()  # archives the past months
+        repo = self.open("sqlite")
+
+        self.assertEqual(repo.count(), 4)
+        self.assertEqual([b['id'] for b in repo.month_bookings(2020, 3)], [1, 2])
+        self.assertEqual(repo.archived_months(), [])  # SQLite keeps every month in the table
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BookingRoom.booking_index import BookingIndex, to_minutes
+from BookingRoom.fixtures import booking
+
+
+class BookingIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = BookingIndex([booking(1, "09:00", "10:00"), booking(2, "13:00", "14:30")])
+
+    def test_to_minutes(self):
+        self.assertEqual(to_minutes("08:30"), 510)
+        self.assertEqual(to_minutes("00:00"), 0)
+
+    def test_overlaps_are_busy(self):
+        self.assertFalse(self.index.is_free("Room A", "2030-01-07", "09:30", "10:30"))
+        self.assertFalse(self.index.is_free("Room A", "2030-01-07", "08:00", "09:01"))
+        self.assertFalse(self.index.is_free("Room A", "2030-01-07", "12:00", "15:00"))
+        self.assertFalse(self.index.is_free("Room A", "2030-01-07", "13:30", "14:00"))
+
+    def test_touching_edges_are_free(self):
+        self.assertTrue(self.index.is_free("Room A", "2030-01-07", "08:00", "09:00"))
+        self.assertTrue(self.index.is_free("Room A", "2030-01-07", "10:00", "13:00"))
+        self.assertTrue(self.index.is_free("Room A", "2030-01-07", "14:30", "16:00"))
+
+    def test_other_room_and_date_are_independent(self):
+        self.assertTrue(self.index.is_free("Room B", "2030-01-07", "09:00", "10:00"))
+        self.assertTrue(self.index.is_free("Room A", "2030-01-08", "09:00", "10:00"))
+
+    def test_add_and_remove(self):
+        extra = booking(3, "10:00", "11:00")
+        self.index.add(extra)
+        self.assertFalse(self.index.is_free("Room A", "2030-01-07", "10:30", "11:30"))
+        self.index.remove(extra)
+        self.assertTrue(self.index.is_free("Room A", "2030-01-07", "10:30", "11:30"))
+        self.assertEqual([i[2] for i in self.index.get_intervals("Room A", "2030-01-07")], [1, 2])
+
+    def test_remove_last_booking_drops_the_key(self):
+        index = BookingIndex([booking(1, "09:00", "10:00")])
+        index.remove(booking(1, "09:00", "10:00"))
+        self.assertEqual(index.get_intervals("Room A", "2030-01-07"), [])
+
+    def test_overlapping_legacy_data(self):
+        # A long booking followed by a short one inside it: the short one
+        # alone would make 10:30-11:00 look free
+        index = BookingIndex([booking(1, "09:00", "12:00"), booking(2, "09:30", "10:00")])
+        self.assertFalse(index.is_free("Room A", "2030-01-07", "10:30", "11:00"))
+        self.assertTrue(index.is_free("Room A", "2030-01-07", "12:00", "13:00"))
+
+    def test_overlap_added_later_is_detected(self):
+        index = BookingIndex([booking(1, "09:30", "10:00")])
+        index.add(booking(2, "09:00", "12:00"))
+        self.assertFalse(index.is_free("Room A", "2030-01-07", "10:30", "11:00"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BookingRoom.booking_repository import BookingRepository, create_repository
+from BookingRoom.fixtures import booking
+
+
+class RepositoryContract:
+    """Behaviour every backend must share; subclasses set STORAGE"""
+
+    STORAGE = None
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = self.open()
+
+    def tearDown(self):
+        self.repo.close()
+        self.tmp.cleanup()
+
+    def open(self):
+        return create_repository(self.STORAGE, self.tmp.name)
+
+    def reopen(self):
+        self.repo.close()
+        self.repo = self.open()
+
+    def test_add_get_and_persist(self):
+        self.repo.add(booking(1))
+        self.reopen()
+        self.assertEqual(self.repo.get(1)['room'], "Room A")
+        self.assertEqual(self.repo.count(), 1)
+        self.assertIsNone(self.repo.get(2))
+
+    def test_availability_and_edges(self):
+        self.repo.add(booking(1, "09:00", "10:00"))
+        self.assertFalse(self.repo.is_available("Room A", "2030-01-07", "09:30", "10:30"))
+        self.assertTrue(self.repo.is_available("Room A", "2030-01-07", "10:00", "11:00"))
+        self.assertTrue(self.repo.is_available("Room A", "2030-01-07", "08:00", "09:00"))
+        self.assertTrue(self.repo.is_available("Room B", "2030-01-07", "09:00", "10:00"))
+
+    def test_lookups_are_sorted(self):
+        self.repo.add(booking(1, "13:00", "14:00"))
+        self.repo.add(booking(2, "09:00", "10:00"))
+        self.repo.add(booking(3, "11:00", "12:00", room="Room B"))
+        self.repo.add(booking(4, "09:00", "10:00", date="2030-01-09"))
+        self.assertEqual([b['id'] for b in self.repo.bookings_for("Room A", "2030-01-07")], [2, 1])
+        self.assertEqual(sorted(b['id'] for b in self.repo.bookings_on("2030-01-07", ["Room A", "Room B"])),
+                         [1, 2, 3])
+        self.assertEqual([b['id'] for b in self.repo.all_bookings()], [2, 3, 1, 4])
+        self.assertEqual(self.repo.month_counts(2030, 1), {"2030-01-07": 3, "2030-01-09": 1})
+        self.assertEqual([b['id'] for b in self.repo.month_bookings(2030, 1)], [2, 3, 1, 4])
+
+    def test_remove(self):
+        self.repo.add(booking(1))
+        self.repo.remove(self.repo.get(1))
+        self.reopen()
+        self.assertEqual(self.repo.count(), 0)
+        self.assertTrue(self.repo.is_available("Room A", "2030-01-07", "09:00", "10:00"))
+
+    def test_ids_are_never_reused(self):
+        first = self.repo.next_id()
+        self.repo.add(booking(first))
+        self.repo.remove(self.repo.get(first))
+        self.reopen()
+        ids = self.repo.next_ids(3)
+        self.assertEqual(len(set(ids)), 3)
+        self.assertGreater(min(ids), first)
+        self.assertEqual(ids, list(range(ids[0], ids[0] + 3)))
+
+
+class JsonRepositoryTest(RepositoryContract, unittest.TestCase):
+    STORAGE = "json"
+
+
+class SqliteRepositoryTest(RepositoryContract, unittest.TestCase):
+    STORAGE = "sqlite"
+
+    def test_batch_rolls_back_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.repo.batch():
+                self.repo.add(booking(1))
+                raise RuntimeError("boom")
+        self.assertEqual(self.repo.count(), 0)
+
+
+class RepositoryInterfaceTest(unittest.TestCase):
+    def test_incomplete_backend_fails_at_creation(self):
+        class Incomplete(BookingRepository):
+            def all_bookings(self):
+                return []
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_unknown_storage(self):
+        with self.assertRaises(ValueError):
+            create_repository("csv", tempfile.gettempdir())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import asyncio
+from datetime import datetime, timedelta
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BookingRoom.booking_server import BookingServer
+from BookingRoom.booking_service import BookingService
+
+ROOM = "Medium Conference Room"
+DATE = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+
+
+def booking_request(start="10:00", end="11:00", room=ROOM):
+    return {"room": room, "date": DATE, "start_time": start, "end_time": end,
+            "purpose": "Study", "participants": 3, "student_id": "S1"}
+
+
+class BookingServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.service = BookingService(self.tmp.name)
+        self.server = BookingServer(self.service, port=0)
+        await self.server.start()
+        self.port = self.server.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+        self.service.repo.close()
+        self.tmp.cleanup()
+
+    async def raw(self, data):
+        """Send raw bytes on a fresh connection; (status, payload) or None if it was dropped"""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(data)
+        await writer.drain()
+        status_line = await reader.readline()
+        if not status_line:
+            writer.close()
+            return None
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers["content-length"]))
+        writer.close()
+        return int(status_line.split()[1]), json.loads(body)
+
+    async def request(self, method, target, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        head = f"{method} {target} HTTP/1.1\r\nConnection: close\r\nContent-Length: {len(body)}\r\n\r\n"
+        return await self.raw(head.encode('latin-1') + body)
+
+    async def test_book_get_and_conflict(self):
+        status, booking = await self.request("POST", "/bookings", booking_request())
+        self.assertEqual(status, 201)
+        status, fetched = await self.request("GET", f"/bookings/{booking['id']}")
+        self.assertEqual((status, fetched['room']), (200, ROOM))
+        status, _ = await self.request("POST", "/bookings", booking_request("10:30", "11:30"))
+        self.assertEqual(status, 409)
+        status, _ = await self.request("POST", "/bookings", booking_request("11:00", "12:00"))
+        self.assertEqual(status, 201)  # touching the first booking is fine
+
+    async def test_concurrent_writes_share_batches(self):
+        results = await asyncio.gather(*(self.request("POST", "/bookings", booking_request(f"{hour:02d}:00", f"{hour:02d}:30"))
+                                         for hour in range(8, 20)))
+        self.assertEqual([status for status, _ in results], [201] * 12)
+        self.assertEqual(len({booking['id'] for _, booking in results}), 12)
+
+    async def test_malformed_write_fails_alone(self):
+        (bad_status, _), (good_status, booking) = await asyncio.gather(
+            self.request("POST", "/bookings", dict(booking_request(), room=["x"])),
+            self.request("POST", "/bookings", booking_request()))
+        self.assertEqual((bad_status, good_status), (400, 201))
+        status, fetched = await self.request("GET", f"/bookings/{booking['id']}")
+        self.assertEqual(status, 200)
+
+    async def test_unexpected_error_fails_only_its_request(self):
+        def broken():
+            raise RuntimeError("boom")
+
+        broken_result, booking = await asyncio.gather(
+            self.server.submit_write(broken),
+            self.server.submit_write(self.service.book, ROOM, DATE, "10:00", "11:00", "Study", 3, "S1"),
+            return_exceptions=True)
+        self.assertIsInstance(broken_result, RuntimeError)
+        self.assertEqual(self.service.get_booking(booking['id'])['start_time'], "10:00")
+
+    async def test_bad_content_length(self):
+        for value in ("abc", "-5"):
+            status, payload = await self.raw(f"POST /bookings HTTP/1.1\r\nContent-Length: {value}\r\n\r\n".encode())
+            self.assertEqual(status, 400)
+
+    async def test_invalid_queries(self):
+        cases = [
+            (f"/slots?date={DATE}&room=Nope", 404),
+            ("/slots?date=not-a-date", 400),
+            (f"/search?date={DATE}&start_time=07:00&end_time=08:00&participants=2", 400),
+            (f"/search?date={DATE}&start_time=11:00&end_time=10:00&participants=2", 400),
+            (f"/search?date={DATE}&start_time=10:00&end_time=11:00&participants=2&days=1000", 400),
+            (f"/availability?room=Nope&date={DATE}&start_time=10:00&end_time=11:00", 404),
+            ("/calendar?year=2030&month=13", 400),
+            ("/utilization?from=2030-05&to=2030-01", 400),
+        ]
+        for target, expected in cases:
+            status, _ = await self.request("GET", target)
+            self.assertEqual(status, expected, target)
+
+    async def test_recurring_weeks_are_capped(self):
+        for weeks in (10 ** 7, 0, 27):
+            status, _ = await self.request("POST", "/bookings/recurring", dict(booking_request(), weeks=weeks))
+            self.assertEqual(status, 400)
+        status, bookings = await self.request("POST", "/bookings/recurring", dict(booking_request(), weeks=3))
+        self.assertEqual((status, len(bookings)), (201, 3))
+
+    async def test_reads_see_other_processes(self):
+        status, payload = await self.request(
+            "GET", f"/availability?room={ROOM.replace(' ', '%20')}&date={DATE}&start_time=14:00&end_time=15:00")
+        self.assertTrue(payload["available"])
+
+        other = BookingService(self.tmp.name)  # e.g. the desktop app
+        other.book(ROOM, DATE, "14:00", "15:00", "Study", 3, "S2")
+        other.repo.close()
+
+        status, payload = await self.request(
+            "GET", f"/availability?room={ROOM.replace(' ', '%20')}&date={DATE}&start_time=14:00&end_time=15:00")
+        self.assertFalse(payload["available"])
+
+    async def test_stop_closes_idle_connections(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(b"GET /rooms HTTP/1.1\r\n\r\n")  # keep-alive
+        await writer.drain()
+        await reader.readline()
+        await asyncio.wait_for(self.server.stop(), 5)
+        self.assertEqual(self.server.clients, set())
+        writer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
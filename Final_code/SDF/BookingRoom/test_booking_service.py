@@ -0,0 +1,175 @@
+from datetime import datetime, timedelta
+import io
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BookingRoom.booking_service import BookingConflictError, BookingError, BookingService, BulkBookingError
+from BookingRoom.bulk_booking import read_bookings_csv, weekly_dates
+
+ROOM = "Medium Conference Room"
+DATE = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+
+
+def _book_slot(data_dir, student_id, queue):
+    service = BookingService(data_dir)
+    try:
+        service.book(ROOM, DATE, "10:00", "11:00", "Study", 3, student_id)
+        queue.put(student_id)
+    except BookingConflictError:
+        queue.put(None)
+    finally:
+        service.repo.close()
+
+
+def request(start, end, room=ROOM, date=DATE, **fields):
+    return dict({"room": room, "date": date, "start_time": start, "end_time": end,
+                 "purpose": "Study", "participants": 3, "student_id": "S1"}, **fields)
+
+
+class BulkBookingTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.service = BookingService(self.tmp.name)
+
+    def tearDown(self):
+        self.service.repo.close()
+        self.tmp.cleanup()
+
+    def test_books_all_with_consecutive_ids(self):
+        bookings = self.service.book_many([request("09:00", "10:00"), request("10:00", "11:00")])
+        self.assertEqual([b['id'] for b in bookings], [1, 2])
+        self.assertEqual(len(BookingService(self.tmp.name).list_bookings()), 2)
+
+    def test_reports_every_problem_and_books_nothing(self):
+        self.service.book(ROOM, DATE, "09:00", "10:00", "Study", 3, "S0")
+        requests = [
+            request("09:30", "10:30"),                 # clashes with the existing booking
+            request("12:00", "13:00"),                 # fine on its own
+            request("14:00", "15:00", room="Nope"),
+            request("16:00", "15:00"),
+            request("12:30", "13:30"),                 # overlaps the second request
+        ]
+        with self.assertRaises(BulkBookingError) as caught:
+            self.service.book_many(requests)
+        self.assertEqual([position for position, _, _ in caught.exception.problems], [1, 3, 4, 5])
+        self.assertIn("this batch", caught.exception.problems[-1][2])
+        self.assertEqual(len(BookingService(self.tmp.name).list_bookings()), 1)
+
+    def test_recurring_books_every_week(self):
+        bookings = self.service.book_recurring(ROOM, DATE, 3, "10:00", "11:00", "Study", 3, "S1", every=2)
+        self.assertEqual([b['date'] for b in bookings], weekly_dates(DATE, 3, 2))
+
+
+class ReadBookingsCsvTest(unittest.TestCase):
+    HEADER = "room,date,start_time,end_time,purpose,participants,student_id\n"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.service = BookingService(self.tmp.name)
+
+    def tearDown(self):
+        self.service.repo.close()
+        self.tmp.cleanup()
+
+    def test_reads_rows_and_defaults_participants(self):
+        rows = read_bookings_csv(io.StringIO(self.HEADER + f" {ROOM} ,{DATE},10:00,11:00,Study,,S1\n"))
+        self.assertEqual(rows, [request("10:00", "11:00", participants=2)])
+        self.assertEqual(len(self.service.book_many(rows)), 1)
+
+    def test_missing_column(self):
+        with self.assertRaises(ValueError):
+            read_bookings_csv(io.StringIO("room,date,start_time,end_time\n"))
+
+    def test_bad_rows_are_reported_together(self):
+        rows = read_bookings_csv(io.StringIO(self.HEADER +
+                                             f"{ROOM},{DATE},10:00,11:00,Study,three,S1\n"
+                                             f"{ROOM},{DATE},12:00,13:00,Study,3\n"
+                                             f"{ROOM},{DATE},14:00,15:00,Study,3,S3\n"))
+        with self.assertRaises(BulkBookingError) as caught:
+            self.service.book_many(rows)
+        self.assertEqual([position for position, _, _ in caught.exception.problems], [1, 2])
+        self.assertEqual(self.service.list_bookings(), [])
+
+
+class UtilizationReportTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.service = BookingService(self.tmp.name)
+
+    def tearDown(self):
+        self.service.repo.close()
+        self.tmp.cleanup()
+
+    def test_report_counts_bookings(self):
+        self.service.book(ROOM, DATE, "10:00", "11:00", "Study", 3, "S1")
+        report = self.service.utilization_report(DATE[:7], DATE[:7])
+        self.assertEqual(report["bookings"], {ROOM: 1})
+        self.assertGreater(report["by_room"][ROOM], 0)
+
+    def test_rejects_bad_ranges(self):
+        for first, last in (("2030-05", "2030-01"), ("2030-13", "2030-12"), ("May", "2030-06")):
+            with self.assertRaises(BookingError, msg=(first, last)):
+                self.service.utilization_report(first, last)
+
+    def test_short_month_numbers_are_normalised(self):
+        report = self.service.utilization_report("2030-5", "2030-10")
+        self.assertEqual((report["first_month"], report["last_month"]), ("2030-05", "2030-10"))
+
+
+class SharedFolderTest(unittest.TestCase):
+    """Two app instances (e.g. two desktop windows, or the app and the server) on one data folder"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.first = BookingService(self.tmp.name)
+        self.second = BookingService(self.tmp.name)
+
+    def tearDown(self):
+        self.first.repo.close()
+        self.second.repo.close()
+        self.tmp.cleanup()
+
+    def test_overlap_from_other_instance_is_rejected(self):
+        self.first.book(ROOM, DATE, "10:00", "11:00", "Study", 3, "S1")
+        with self.assertRaises(BookingConflictError):
+            self.second.book(ROOM, DATE, "10:30", "11:30", "Study", 3, "S2")
+        booking = self.second.book(ROOM, DATE, "11:00", "12:00", "Study", 3, "S2")
+        self.assertEqual(booking['id'], 2)  # ids come from the shared sequence
+
+    def test_double_cancel_is_rejected(self):
+        booking = self.first.book(ROOM, DATE, "10:00", "11:00", "Study", 3, "S1")
+        self.second.refresh()
+        self.second.cancel(booking['id'])
+        with self.assertRaises(BookingError):
+            self.first.cancel(booking['id'])
+        self.assertTrue(self.first.is_room_available(ROOM, DATE, "10:00", "11:00"))
+
+    def test_refresh_catches_up(self):
+        self.first.book(ROOM, DATE, "10:00", "11:00", "Study", 3, "S1")
+        self.assertTrue(self.second.refresh())
+        self.assertFalse(self.second.is_room_available(ROOM, DATE, "10:00", "11:00"))
+        self.assertFalse(self.second.refresh())
+
+    @unittest.skipIf(sys.platform == "win32", "fork-based check")
+    def test_racing_processes_book_a_slot_once(self):
+        queue = multiprocessing.Queue()
+        workers = [multiprocessing.Process(target=_book_slot, args=(self.tmp.name, f"S{i}", queue))
+                   for i in range(4)]
+        for worker in workers:
+            worker.start()
+        winners = [student_id for student_id in (queue.get(timeout=30) for _ in workers) if student_id]
+        for worker in workers:
+            worker.join()
+        self.assertEqual(len(winners), 1)
+        self.first.refresh()
+        self.assertEqual([b['student_id'] for b in self.first.list_bookings()], winners)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BookingRoom.booking_storage import JournaledBookingStore
+from BookingRoom.fixtures import booking
+
+
+class JournaledBookingStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.snapshot = os.path.join(self.tmp.name, "bookings.json")
+        self.log = os.path.join(self.tmp.name, "bookings.log")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def store(self, **kwargs):
+        return JournaledBookingStore(self.snapshot, self.log, **kwargs)
+
+    def test_replays_log_over_snapshot(self):
+        with open(self.snapshot, 'w') as f:
+            json.dump([booking(1), booking(2, "11:00", "12:00")], f)
+        store = self.store()
+        store.load()
+        store.append_add(booking(3, "13:00", "14:00"))
+        store.append_cancel(booking(1))
+
+        bookings = self.store().load()
+        self.assertEqual(sorted(b['id'] for b in bookings), [2, 3])
+
+    def test_replay_is_idempotent(self):
+        # A crash between writing the snapshot and emptying the log replays
+        # operations that are already in the snapshot
+        with open(self.snapshot, 'w') as f:
+            json.dump([booking(1)], f)
+        with open(self.log, 'w') as f:
+            f.write(json.dumps({"op": "add", "booking": booking(1)}) + "\n")
+        self.assertEqual([b['id'] for b in self.store().load()], [1])
+
+    def test_torn_tail_is_truncated(self):
+        store = self.store()
+        store.load()
+        store.append_add(booking(1))
+        with open(self.log, 'ab') as f:
+            f.write(b'{"op": "add", "booking": {"id": 2')  # crash mid-append
+
+        store = self.store()
+        self.assertEqual([b['id'] for b in store.load()], [1])
+        with open(self.log, 'rb') as f:
+            self.assertTrue(f.read().endswith(b"}\n"))
+
+        # Appends after the repair are not glued to the fragment
+        store.append_add(booking(3, "11:00", "12:00"))
+        self.assertEqual([b['id'] for b in self.store().load()], [1, 3])
+
+    def test_batch_writes_once(self):
+        store = self.store()
+        store.load()
+        with store.batch():
+            store.append_add(booking(1))
+            store.append_add(booking(2, "11:00", "12:00"))
+            self.assertFalse(os.path.exists(self.log))
+        self.assertEqual(len(self.store().load()), 2)
+
+    def test_compaction_empties_log(self):
+        store = self.store(compact_every=2)
+        bookings = store.load()
+        for b in (booking(1), booking(2, "11:00", "12:00")):
+            bookings.append(b)
+            store.append_add(b)
+        self.assertTrue(store.needs_compaction())
+        store.compact(bookings)
+        self.assertEqual(os.path.getsize(self.log), 0)
+        self.assertEqual(len(self.store().load()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BookingRoom.id_sequence import BookingIdSequence
+
+
+def _allocate(seq_file, count, queue):
+    sequence = BookingIdSequence(seq_file)
+    queue.put([sequence.next_id() for _ in range(count)])
+
+
+class BookingIdSequenceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.seq_file = os.path.join(self.tmp.name, "booking_id_seq.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_starts_at_one_and_persists(self):
+        self.assertEqual(BookingIdSequence(self.seq_file).next_id(), 1)
+        self.assertEqual(BookingIdSequence(self.seq_file).next_id(), 2)
+
+    def test_floor_skips_ids_in_use(self):
+        sequence = BookingIdSequence(self.seq_file)
+        self.assertEqual(sequence.next_id(floor=41), 42)
+        self.assertEqual(sequence.next_id(floor=10), 43)
+
+    def test_block_allocation(self):
+        sequence = BookingIdSequence(self.seq_file)
+        self.assertEqual(sequence.next_id(count=5), 1)
+        self.assertEqual(sequence.next_id(), 6)
+
+    def test_corrupt_file_restarts_from_floor(self):
+        with open(self.seq_file, 'w') as f:
+            f.write("not json")
+        self.assertEqual(BookingIdSequence(self.seq_file).next_id(floor=7), 8)
+
+    @unittest.skipIf(sys.platform == "win32", "fork-based check")
+    def test_processes_never_share_an_id(self):
+        queue = multiprocessing.Queue()
+        workers = [multiprocessing.Process(target=_allocate, args=(self.seq_file, 50, queue)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        ids = [i for _ in workers for i in queue.get(timeout=30)]
+        for worker in workers:
+            worker.join()
+        self.assertEqual(sorted(ids), list(range(1, 201)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BookingRoom.fixtures import booking
+from BookingRoom.room_search import RoomCatalog, date_range, search_rooms
+
+ROOMS = [
+    {"name": "Small", "capacity": 4, "equipment": ["Whiteboard"]},
+    {"name": "Medium", "capacity": 8, "equipment": ["Projector", "Whiteboard"]},
+    {"name": "Large", "capacity": 12, "equipment": ["Projector", "Whiteboard", "TV"]},
+]
+
+
+class ListRepository:
+    """Just enough of a repository for search_rooms"""
+
+    def __init__(self, bookings):
+        self.bookings = bookings
+
+    def bookings_on(self, date, room_names):
+        return [b for b in self.bookings if b['date'] == date and b['room'] in room_names]
+
+
+class RoomCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.catalog = RoomCatalog(ROOMS)
+
+    def test_capacity_filter(self):
+        self.assertEqual(self.catalog.matching(5), ["Medium", "Large"])
+        self.assertEqual(self.catalog.matching(8), ["Medium", "Large"])
+        self.assertEqual(self.catalog.matching(13), [])
+        self.assertEqual(self.catalog.matching(0), ["Small", "Medium", "Large"])
+
+    def test_capacity_and_equipment(self):
+        self.assertEqual(self.catalog.matching(1, ["Projector"]), ["Medium", "Large"])
+        self.assertEqual(self.catalog.matching(1, ["Projector", "TV"]), ["Large"])
+        self.assertEqual(self.catalog.matching(10, ["Whiteboard"]), ["Large"])
+        self.assertEqual(self.catalog.matching(1, ["Hologram"]), [])
+
+    def test_equipment_list(self):
+        self.assertEqual(self.catalog.all_equipment(), ["Projector", "TV", "Whiteboard"])
+
+
+class SearchRoomsTest(unittest.TestCase):
+    def setUp(self):
+        self.catalog = RoomCatalog(ROOMS)
+
+    def search(self, bookings, participants=2, equipment=(), start="10:00", end="11:00"):
+        return search_rooms(self.catalog, ListRepository(bookings), ["2030-01-07", "2030-01-08"],
+                            start, end, participants, equipment)
+
+    def test_best_fit_first(self):
+        results = self.search([])
+        self.assertEqual([(r['room'], r['date']) for r in results][:3],
+                         [("Small", "2030-01-07"), ("Small", "2030-01-08"), ("Medium", "2030-01-07")])
+        self.assertEqual(results[0]['spare_seats'], 2)
+
+    def test_busy_rooms_are_left_out(self):
+        results = self.search([booking(1, "10:30", "12:00", room="Small")])
+        self.assertNotIn(("Small", "2030-01-07"), [(r['room'], r['date']) for r in results])
+        self.assertIn(("Small", "2030-01-08"), [(r['room'], r['date']) for r in results])
+
+    def test_touching_booking_does_not_block(self):
+        results = self.search([booking(1, "09:00", "10:00", room="Small"),
+                               booking(1, "11:00", "12:00", room="Small")])
+        self.assertEqual((results[0]['room'], results[0]['date']), ("Small", "2030-01-07"))
+
+    def test_extra_equipment_counts_unrequested_items(self):
+        results = {r['room']: r['extra_equipment'] for r in self.search([], equipment=["Projector"])}
+        self.assertEqual(results, {"Medium": 1, "Large": 2})
+
+    def test_no_room_big_enough(self):
+        self.assertEqual(self.search([], participants=50), [])
+
+    def test_date_range(self):
+        self.assertEqual(date_range("2030-02-27", 3), ["2030-02-27", "2030-02-28", "2030-03-01"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import os
+import sys
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BookingRoom.fixtures import booking
+from BookingRoom.slot_bitmap import (DayOccupancy, FULL_MASK, SLOT_COUNT, SLOT_LABELS,
+                                     interval_mask, slot_indexes)
+
+
+class SlotBitmapTest(unittest.TestCase):
+    def test_labels_cover_the_day(self):
+        self.assertEqual(SLOT_COUNT, 24)
+        self.assertEqual(SLOT_LABELS[0], ("08:00", "08:30"))
+        self.assertEqual(SLOT_LABELS[-1], ("19:30", "20:00"))
+
+    def test_interval_mask(self):
+        self.assertEqual(interval_mask(8 * 60, 9 * 60), 0b11)
+        self.assertEqual(slot_indexes(interval_mask(9 * 60 + 15, 10 * 60)), [2, 3])  # partial slot counts
+        self.assertEqual(interval_mask(0, 24 * 60), FULL_MASK)
+        self.assertEqual(interval_mask(7 * 60, 8 * 60), 0)  # before opening
+        self.assertEqual(interval_mask(10 * 60, 10 * 60), 0)
+
+    def test_day_occupancy(self):
+        day = DayOccupancy([booking(1, "09:00", "10:00"), booking(2, "10:30", "11:00")])
+        self.assertFalse(day.is_free("09:30", "10:00"))
+        self.assertTrue(day.is_free("10:00", "10:30"))  # touches both edges
+        self.assertTrue(day.is_free("08:00", "09:00"))
+        self.assertEqual(len(day.free_slots()), SLOT_COUNT - 3)
+        self.assertEqual([(label, b['id']) for label, b in day.booked_slots()],
+                         [(("09:00", "09:30"), 1), (("09:30", "10:00"), 1), (("10:30", "11:00"), 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import importlib
+import threading
+import time
+
+# Feature name -> (module, class); nothing here is imported until first use
+FEATURE_MODULES = {
+    "gpa": ("Calculator.gpa_calculator_main", "GPACalculator"),
+    "reminder": ("Simple_Reminder_App.reminder", "ReminderApp"),
+    "booking": ("BookingRoom.booking_system", "BookingSystem"),
+}
+
+
+class FeatureLoader:
+    """Imports feature modules on first use instead of at launcher startup.
+
+    prefetch() warms the remaining modules on a background thread, so the
+    first click after login does not pay for the import either. Only
+    imports happen off the Tk thread; every widget is still built on it.
+    """
+
+    def __init__(self, modules=FEATURE_MODULES):
+        self.modules = modules
+        self.classes = {}
+        self.load_times = {}  # feature name -> import time in ms
+        self.lock = threading.Lock()
+
+    def get(self, name):
+        """The feature's app class, importing its module if needed"""
+        with self.lock:
+            if name not in self.classes:
+                module_name, class_name = self.modules[name]
+                started = time.perf_counter()
+                module = importlib.import_module(module_name)
+                self.load_times[name] = (time.perf_counter() - started) * 1000
+                self.classes[name] = getattr(module, class_name)
+            return self.classes[name]
+
+    def is_loaded(self, name):
+        return name in self.classes
+
+    def prefetch(self, names=None):
+        """Import the given features (default: all) on a daemon thread"""
+        pending = [name for name in (names or self.modules) if name not in self.classes]
+        if not pending:
+            return None
+
+        def run():
+            for name in pending:
+                try:
+                    self.get(name)
+                except Exception:
+                    pass  # Reported properly when the user opens the feature
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
@@ -1,3 +1,6 @@
+import time
+LAUNCHED = time.perf_counter()  # Taken before any other import, for the startup report
+
 import tkinter as tk
 from tkinter import messagebox, ttk
 import json
@@ -7,12 +10,16 @@ import os
 # Ensure the parent directory is in sys.path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from Simple_Reminder_App.reminder import ReminderApp
-from datetime import datetime
+# Feature modules (reminder, GPA, booking) are imported on first use, not here
+from Login.feature_loader import FeatureLoader
+from Login.startup_timing import StartupTimer, timing_enabled
+from Login.window_manager import FeatureWindows
 
 
 
 class LoginApp:
+    PREFETCH_AFTER_LOGIN = True  # Import feature modules in the background once logged in
+
     def __init__(self, root, user=None):
         self.root = root
         self.root.title("TAR UMT Student Assistant App")
@@ -36,6 +43,10 @@ class LoginApp:
         # Current user state
         self.logged_in = False
         self.current_user = None
+
+        # Lazily imported feature windows, built once and then only hidden/shown
+        self.features = FeatureLoader()
+        self.windows = FeatureWindows(self.root)
         
         # Load initial data
         self.create_main_interface()
@@ -205,6 +216,9 @@ class LoginApp:
             self.current_user = email
             self.login_btn.config(text="Logout", bg='#e74c3c', activebackground='#c0392b')
             window.destroy()
+            if self.PREFETCH_AFTER_LOGIN:
+                # Start once the login dialog is gone so it never delays a paint
+                self.root.after(300, self.features.prefetch)
             messagebox.showinfo("Success", "Logged in successfully!")
         else:
             messagebox.showerror("Error", "Invalid email or password")
@@ -215,6 +229,7 @@ class LoginApp:
     def logout(self):
         self.logged_in = False
         self.current_user = None
+        self.windows.discard_all()  # Cached windows belong to the previous user
         self.login_btn.config(text="Login", bg='#3498db', activebackground='#2980b9')
         messagebox.showinfo("Success", "Logged out successfully!")
     
@@ -227,22 +242,22 @@ class LoginApp:
     def open_gpa_calculator(self):
      if self.check_login():
         try:
-            import tkinter as tk
-            import tkinter.ttk as ttk
-            from Calculator.gpa_calculator_main import GPACalculator
+            GPACalculator = self.features.get("gpa")
+
+            def build(gpa_window):
+                gpa_window.title("GPA Module")
+                gpa_window.geometry("900x700")
 
-            gpa_window = tk.Toplevel(self.root)
-            gpa_window.title("GPA Module")
-            gpa_window.geometry("900x700")
+                # Notebook
+                notebook = ttk.Notebook(gpa_window)
+                notebook.pack(fill="both", expand=True)
 
-            # Notebook
-            notebook = ttk.Notebook(gpa_window)
-            notebook.pack(fill="both", expand=True)
+                # Calculator Tab
+                calc_frame = ttk.Frame(notebook)
+                notebook.add(calc_frame, text="Calculator")
+                return GPACalculator(calc_frame)
 
-            # Calculator Tab
-            calc_frame = ttk.Frame(notebook)
-            notebook.add(calc_frame, text="Calculator")
-            self.gpa_calculator = GPACalculator(calc_frame)
+            self.gpa_calculator = self.windows.show("gpa", build)
 
         except ImportError as e:
             messagebox.showerror("Error", f"Module not found:\n{e}")
@@ -253,13 +268,16 @@ class LoginApp:
         if not self.check_login():
             return
         try:
-            reminder_window = tk.Toplevel(self.root)
-            reminder_window.title("⏰ Simple Reminder App")
-            reminder_window.geometry("800x800")
-            reminder_window.configure(bg="#f5f7fa")
-            reminder_window.resizable(True, True)
-            from Simple_Reminder_App.reminder import ReminderApp
-            reminder_app = ReminderApp(reminder_window)
+            ReminderApp = self.features.get("reminder")
+
+            def build(reminder_window):
+                reminder_window.title("⏰ Simple Reminder App")
+                reminder_window.geometry("800x800")
+                reminder_window.configure(bg="#f5f7fa")
+                reminder_window.resizable(True, True)
+                return ReminderApp(reminder_window)
+
+            self.windows.show("reminder", build)
         except Exception as e:
             messagebox.showerror("Error", f"Cannot open Reminder App:\n{e}")
 
@@ -267,11 +285,14 @@ class LoginApp:
         if not self.check_login():
             return
         try:
-            from BookingRoom.booking_system import BookingSystem
-            booking_window = tk.Toplevel(self.root)
-            booking_window.title("Booking System")
-            booking_window.geometry("1300x750")
-            booking_app = BookingSystem(booking_window, self.current_user)
+            BookingSystem = self.features.get("booking")
+
+            def build(booking_window):
+                booking_window.title("Booking System")
+                booking_window.geometry("1300x750")
+                return BookingSystem(booking_window, self.current_user)
+
+            self.windows.show("booking", build)
         except ImportError:
             messagebox.showerror("Error", "Booking System module not found.")
         except Exception as e:
@@ -395,6 +416,12 @@ class LoginApp:
 
 
 if __name__ == "__main__":
+    timer = StartupTimer(LAUNCHED)
+    timer.mark("imports done")
     root = tk.Tk()
+    timer.mark("Tk root created")
     app = LoginApp(root)
+    timer.mark("main interface built")
+    if timing_enabled():
+        timer.watch_first_paint(root, lambda t: print(t.report(app.features)))
     root.mainloop()
\ No newline at end of file
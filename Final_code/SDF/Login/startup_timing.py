@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+
+STARTUP_BUDGET_MS = 200  # Launcher window should be painted within this
+
+
+def timing_enabled():
+    # python main_aoo.py --timing, or STUDENT_APP_TIMING=1
+    return "--timing" in sys.argv or os.environ.get("STUDENT_APP_TIMING") == "1"
+
+
+class StartupTimer:
+    """Wall-clock marks from launch to the first painted frame.
+
+    For a per-module import breakdown run the launcher with
+    `python -X importtime Login/main_aoo.py`; this report adds what that
+    cannot show: time to Tk, to the built interface and to first paint,
+    checked against STARTUP_BUDGET_MS.
+    """
+
+    def __init__(self, started=None, budget_ms=STARTUP_BUDGET_MS):
+        self.started = started or time.perf_counter()
+        self.budget_ms = budget_ms
+        self.marks = []  # (label, ms since start)
+
+    def mark(self, label):
+        self.marks.append((label, (time.perf_counter() - self.started) * 1000))
+
+    def elapsed_ms(self):
+        return self.marks[-1][1] if self.marks else 0.0
+
+    def watch_first_paint(self, root, on_paint=None):
+        """Mark 'first paint' once the root window is mapped and drawn"""
+        def on_map(event):
+            if event.widget is not root:
+                return
+            root.unbind("<Map>", binding)
+            # Idle callbacks run after Tk has drawn the mapped window
+            root.after_idle(painted)
+
+        def painted():
+            self.mark("first paint")
+            if on_paint:
+                on_paint(self)
+
+        binding = root.bind("<Map>", on_map, add="+")
+
+    def report(self, loader=None):
+        lines = ["Startup timing (ms since launch):"]
+        for label, ms in self.marks:
+            lines.append(f"  {ms:8.1f}  {label}")
+        total = self.elapsed_ms()
+        verdict = "within" if total <= self.budget_ms else "OVER"
+        lines.append(f"  {verdict} the {self.budget_ms} ms budget; {len(sys.modules)} modules imported")
+        if loader is not None:
+            for name in loader.modules:
+                if name in loader.load_times:
+                    lines.append(f"  feature '{name}' imported in {loader.load_times[name]:.1f} ms")
+                else:
+                    lines.append(f"  feature '{name}' not imported yet")
+        return "\n".join(lines)
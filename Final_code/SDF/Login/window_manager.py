@@ -0,0 +1,43 @@
+import tkinter as tk
+
+
+class FeatureWindows:
+    """Keeps one Toplevel per feature alive and hides it instead of closing it.
+
+    The first open builds the window and its app; closing only withdraws it,
+    so opening it again is a deiconify with every widget and all loaded data
+    still in place. Apps may define on_show() to catch up when re-shown.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.windows = {}  # feature name -> (Toplevel, app)
+
+    def show(self, name, build):
+        """Show the feature's window, calling build(window) -> app only the first time"""
+        entry = self.windows.get(name)
+        if entry and entry[0].winfo_exists():
+            window, app = entry
+            window.deiconify()
+            window.lift()
+            window.focus_force()
+            if hasattr(app, "on_show"):
+                app.on_show()
+            return app
+
+        window = tk.Toplevel(self.root)
+        try:
+            app = build(window)
+        except Exception:
+            window.destroy()
+            raise
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+        self.windows[name] = (window, app)
+        return app
+
+    def discard_all(self):
+        """Destroy every cached window, e.g. when the user logs out"""
+        for window, app in self.windows.values():
+            if window.winfo_exists():
+                window.destroy()
+        self.windows = {}
@@ -0,0 +1,170 @@
+from datetime import datetime, timedelta
+import gzip
+import json
+import os
+import shutil
+
+STAMP_FORMAT = "%Y-%m-%d %H:%M:%S"  # format of a record's "notified_at"
+
+
+def segment_key(name):
+    # history-YYYYMMDD-HHMMSS[-n].jsonl[.gz]; the -n suffix marks later rotations in the same second
+    parts = name.split(".")[0].split("-")
+    return parts[1], parts[2], int(parts[3]) if len(parts) > 3 else 0
+
+
+class HistoryLog:
+    """Reminder history as JSON lines, one record per line.
+
+    New records go to the active segment (history.jsonl). When it passes
+    `max_bytes`, or its first record is older than `max_age_days`, it is
+    moved to history/history-<timestamp>.jsonl, gzipped if `compress`.
+    recent() reads only the end of the newest segments, so startup cost
+    does not grow with years of history.
+    """
+
+    def __init__(self, active_file, max_bytes=256 * 1024, max_age_days=90, compress=True, legacy_file=None):
+        self.active_file = active_file
+        self.segment_dir = os.path.join(os.path.dirname(active_file), "history")
+        self.max_bytes = max_bytes
+        self.max_age = timedelta(days=max_age_days)
+        self.compress = compress
+        if legacy_file and os.path.exists(legacy_file):
+            self._migrate(legacy_file)
+        self._drop_torn_tail()
+        self.started_at = self._first_stamp()
+
+    def _migrate(self, legacy_file):
+        # history.json (one big list) becomes the oldest segment
+        with open(legacy_file, 'r') as f:
+            try:
+                records = json.load(f)
+            except ValueError:
+                records = []
+        if records:
+            os.makedirs(self.segment_dir, exist_ok=True)
+            segment = os.path.join(self.segment_dir, "history-00000000-000000.jsonl")
+            with open(segment, 'w') as f:
+                f.writelines(json.dumps(record) + "\n" for record in records)
+            if self.compress:
+                self._gzip(segment)
+        os.replace(legacy_file, legacy_file + ".bak")
+
+    def _drop_torn_tail(self):
+        # A crash during append can leave a partial last line; cut it off so
+        # recent() can parse the file and the next record starts on a clean line
+        if not os.path.exists(self.active_file):
+            return
+        size = os.path.getsize(self.active_file)
+        chunk = 8192
+        with open(self.active_file, 'r+b') as f:
+            while True:
+                start = max(0, size - chunk)
+                f.seek(start)
+                data = f.read()
+                cut = data.rfind(b"\n", 0, len(data) - 1)  # end of the line before the last
+                if cut >= 0 or start == 0:
+                    break
+                chunk *= 4
+            last = data[cut + 1:]
+            if last.endswith(b"\n"):
+                try:
+                    json.loads(last)
+                    return
+                except ValueError:
+                    pass
+            f.truncate(start + cut + 1)
+
+    def _first_stamp(self):
+        if not os.path.exists(self.active_file):
+            return None
+        with open(self.active_file, 'r') as f:
+            try:
+                return datetime.strptime(json.loads(f.readline())["notified_at"], STAMP_FORMAT)
+            except (ValueError, KeyError):
+                return None
+
+    # ---------------- Writing ----------------
+    def append(self, record):
+        if self._needs_rotation():
+            self.rotate()
+        with open(self.active_file, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+        if self.started_at is None:
+            self.started_at = datetime.now()
+
+    def _needs_rotation(self):
+        if not os.path.exists(self.active_file):
+            return False
+        if os.path.getsize(self.active_file) >= self.max_bytes:
+            return True
+        return self.started_at is not None and datetime.now() - self.started_at >= self.max_age
+
+    def rotate(self):
+        """Move the active segment aside (and compress it); the next record starts a new one"""
+        if not os.path.exists(self.active_file):
+            return
+        os.makedirs(self.segment_dir, exist_ok=True)
+        name = datetime.now().strftime("history-%Y%m%d-%H%M%S")
+        segment = os.path.join(self.segment_dir, name + ".jsonl")
+        suffix = 1
+        while os.path.exists(segment) or os.path.exists(segment + ".gz"):  # two rotations in one second
+            segment = os.path.join(self.segment_dir, f"{name}-{suffix}.jsonl")
+            suffix += 1
+        os.replace(self.active_file, segment)
+        if self.compress:
+            self._gzip(segment)
+        self.started_at = None
+
+    def _gzip(self, segment):
+        with open(segment, 'rb') as src, gzip.open(segment + ".gz.tmp", 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(segment + ".gz.tmp", segment + ".gz")
+        os.remove(segment)
+
+    # ---------------- Reading ----------------
+    def segments(self):
+        """Rotated segment files, oldest first (names sort by rotation time)"""
+        if not os.path.isdir(self.segment_dir):
+            return []
+        names = sorted((name for name in os.listdir(self.segment_dir)
+                        if name.endswith(".jsonl") or name.endswith(".jsonl.gz")), key=segment_key)
+        return [os.path.join(self.segment_dir, name) for name in names]
+
+    def _read_segment(self, path):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, 'rt') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _tail(self, path, count):
+        # Read backwards in growing chunks until `count` whole lines are in hand
+        size = os.path.getsize(path)
+        chunk = 8192
+        with open(path, 'rb') as f:
+            while True:
+                start = max(0, size - chunk)
+                f.seek(start)
+                lines = f.read().splitlines()
+                if start > 0:
+                    lines = lines[1:]  # first line may be cut
+                if len(lines) >= count or start == 0:
+                    return [json.loads(line) for line in lines[-count:] if line.strip()]
+                chunk *= 4
+
+    def recent(self, count):
+        """The last `count` records, oldest first"""
+        if count <= 0:
+            return []
+        records = self._tail(self.active_file, count) if os.path.exists(self.active_file) else []
+        for segment in reversed(self.segments()):
+            if len(records) >= count:
+                break
+            records = self._read_segment(segment)[-(count - len(records)):] + records
+        return records
+
+    def all_records(self):
+        """Every record, oldest first, one segment in memory at a time"""
+        for segment in self.segments():
+            yield from self._read_segment(segment)
+        if os.path.exists(self.active_file):
+            yield from self._read_segment(self.active_file)
@@ -3,8 +3,17 @@ from tkinter import ttk, messagebox, filedialog # for GUI
 from datetime import datetime, timedelta # for date/time handling
 import json
 import os
+import sys
 import threading
-import winsound
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Simple_Reminder_App.reminder_scheduler import create_scheduler
+from Simple_Reminder_App.reminder_store import ReminderStore, from_record, iter_json_array, to_record
+from Simple_Reminder_App.history_log import HistoryLog
+from Simple_Reminder_App.reminder_list import ReminderList
+from Simple_Reminder_App.reminder_recurrence import PRESETS, advance, choice_for, rule_from_choice, upcoming
 
 class ReminderApp:
     BG_COLOR = "#f5f7fa"
@@ -18,6 +27,12 @@ class ReminderApp:
     FONT_TITLE = ("Segoe UI", 10, "bold")
     FONT_NORMAL = ("Segoe UI", 9)
     FONT_SMALL = ("Segoe UI", 8)
+    SCHEDULER_ENGINE = "heap"  # or "wheel" (timing wheel), or "auto": wheel for very large lists
+    UPCOMING_DAYS = 30  # window of the Upcoming view
+    UPCOMING_LIMIT = 500  # occurrences listed at most; the stream is only read this far
+    HISTORY_TAIL = 200  # history records kept in memory; older ones stay on disk
+    SAVE_DELAY_MS = 1000  # changes within this window are written together
+    MAX_TIMER_MS = 60000  # longest single wait, so clock changes or sleep are noticed within a minute
 
     def __init__(self, root):
         self.root = root
@@ -28,78 +43,97 @@ class ReminderApp:
         # use absolute path for data files
         base_dir = os.path.dirname(os.path.abspath(__file__)) # directory of the script
         self.data_file = os.path.join(base_dir, "reminders.json") # file to store reminders
-        self.history_file = os.path.join(base_dir, "history.json") # file to store history
+        self.history_file = os.path.join(base_dir, "history.jsonl") # active history segment, one record per line
 
         self.reminders = [] # list of reminders
         self.history = []
         self.alarm_thread = None # thread for alarm sound
         self.alarm_active = False 
+        self.scheduler = None # pending reminders ordered by due time, built after loading
+        self.timer_id = None # the single pending root.after timer
+        self.store = ReminderStore(self.data_file) # snapshot + log of changed reminders
+        self.save_timer = None # pending debounced save
+        self.next_id = 1 # id for the next new reminder
+        self.root.bind("<Destroy>", self.on_destroy, add="+") # write pending changes on close
 
         self.setup_ui()
         self.load_reminders()
         self.load_history()
         self.update_reminder_list()
+        self.scheduler = create_scheduler(self.SCHEDULER_ENGINE, self.reminders)
         self.check_reminders()
     # ================= Data Handling =================
     def load_reminders(self):
-     if os.path.exists(self.data_file):
-        try:
-            with open(self.data_file, 'r') as file:
-                data = json.load(file)
-        except:
-            data = []
-     else:
+     try:
+        data = self.store.load() # snapshot with logged changes applied
+     except (OSError, ValueError):
         data = []
 
      self.reminders = [] # reset reminders list
      for r in data:
-        # ensure time is a datetime object
-        if isinstance(r["time"], str):
-            r["time"] = datetime.strptime(r["time"], "%Y-%m-%d %H:%M") # convert string to datetime
-        # snooze_until may not exist
-        if "snooze_until" in r and isinstance(r["snooze_until"], str):
-            try:
-                r["snooze_until"] = datetime.strptime(r["snooze_until"], "%Y-%m-%d %H:%M:%S") 
-            except:
-                r.pop("snooze_until", None)
-        r.setdefault("repeat", False) # default to no repeat
-        r.setdefault("done", False)
-        r.setdefault("snooze_delay", 5) 
-        self.reminders.append(r) # add to reminders list
-
-
-    def save_reminders(self):
-    # Create the file if it doesn't exist
-     if not os.path.exists(self.data_file): # create empty file
-        with open(self.data_file, "w") as f:                # create file
-            f.write("[]")  # initialize with empty list
-
-     with open(self.data_file, "w") as f:       # save reminders to file
-        json.dump([                                   
-            {
-                **r,                                            # unpack all fields
-                "time": r["time"].strftime("%Y-%m-%d %H:%M"),
-                **({"snooze_until": r["snooze_until"].strftime("%Y-%m-%d %H:%M:%S")}  # only if exists and is datetime
-                   if isinstance(r.get("snooze_until"), datetime) else {})        # unpack if exists
-            } for r in self.reminders
-        ], f, indent=2)  # pretty print with indent
-
-
-    def load_history(self):             # load history from file
-        if os.path.exists(self.history_file):  # file exists
-            with open(self.history_file, "r") as f:   # read file
-                self.history = json.load(f)               # load JSON data
-        else:
-            self.history = []   # no history file, start fresh
-
-
-    def save_history(self, record):   # save a new history record
+        self.reminders.append(from_record(r)) # datetimes parsed, defaults filled in
+
+     # older files have no ids; number them once and fold any log into the snapshot
+     self.next_id = max((r["id"] for r in self.reminders if isinstance(r.get("id"), int)), default=0) + 1
+     missing_ids = False
+     for r in self.reminders:
+        if not isinstance(r.get("id"), int):
+            r["id"] = self.new_id()
+            missing_ids = True
+     if missing_ids or self.store.logged:
+        self.save_reminders()
+
+    def new_id(self):
+        self.next_id += 1
+        return self.next_id - 1
+
+    def save_reminders(self):           # rewrite the whole file (used after bulk changes)
+     self.cancel_pending_save()
+     self.store.compact(self.reminders)
+
+    def save_reminder(self, reminder):  # one reminder changed; written with the next batch
+        self.store.mark_dirty(reminder)
+        self.schedule_save()
+
+    def save_deleted(self, reminder):   # one reminder removed; written with the next batch
+        self.store.mark_deleted(reminder)
+        self.schedule_save()
+
+    def schedule_save(self):            # debounce: bursts of changes share one write
+        if self.save_timer is None:
+            self.save_timer = self.root.after(self.SAVE_DELAY_MS, self.flush_saves)
+
+    def cancel_pending_save(self):
+        if self.save_timer is not None:
+            self.root.after_cancel(self.save_timer)
+            self.save_timer = None
+
+    def flush_saves(self):
+        self.save_timer = None
+        self.store.flush(self.reminders)
+
+    def on_destroy(self, event):
+        if event.widget is self.root:   # the window itself, not one of its children
+            self.flush_saves()
+
+
+    def load_history(self):             # load recent history; old segments stay rotated on disk
+        self.history_log = HistoryLog(self.history_file,
+                                      legacy_file=os.path.join(os.path.dirname(self.history_file), "history.json"))
+        self.history = self.history_log.recent(self.HISTORY_TAIL)
+
+
+    def save_history(self, record):   # append one record to the history log
         self.history.append(record) 
-        with open(self.history_file, "w") as f:  # write updated history
-            json.dump(self.history, f, indent=2) 
+        del self.history[:-self.HISTORY_TAIL]  # keep only the recent tail in memory
+        self.history_log.append(record)
 
     # ================= Alarm =================
     def play_alarm_sound(self): 
+        try:
+            import winsound              # Windows only; loaded on the first alarm, not at startup
+        except ImportError:
+            return                       # no beeper on this platform
         while self.alarm_active:          # loop while alarm is active
             try:
                 winsound.Beep(1000, 500) # frequency, duration 
@@ -108,19 +142,31 @@ class ReminderApp:
 
     # ================= Check Reminders =================
     def check_reminders(self):               
-        now = datetime.now()              # current time
-        for reminder in self.reminders:      # check each reminder
-             # skip if already done or notifying
-            if reminder.get("done", False) or reminder.get("_notifying", False):
-                continue
-            snooze_until = reminder.get("snooze_until")  # get snooze time if any
-            if snooze_until and now >= snooze_until:
-                reminder["_notifying"] = True  
-                self.notify_user(reminder)                      
-            elif not snooze_until and now >= reminder["time"]: 
-                reminder["_notifying"] = True 
-                self.notify_user(reminder) 
-        self.root.after(3000, self.check_reminders) # check every 3 seconds // 3000=3s
+        self.timer_id = None
+        if not self.root.winfo_exists():     # window was destroyed
+            return
+        if not self.alarm_active:            # one popup at a time; the rest wait for it to close
+            reminder = self.scheduler.pop_due(datetime.now())  # earliest reminder that is due, if any
+            if reminder is not None and not reminder.get("_notifying", False):
+                reminder["_notifying"] = True
+                self.notify_user(reminder)
+        self.arm_timer()
+
+    def arm_timer(self):                     # one timer for exactly the next deadline
+        if self.timer_id is not None:
+            self.root.after_cancel(self.timer_id)
+            self.timer_id = None
+        if self.alarm_active:                # closing the popup re-arms
+            return
+        next_due = self.scheduler.next_due()
+        if next_due is None:                 # nothing pending: no wakeups at all
+            return
+        delay_ms = int((next_due - datetime.now()).total_seconds() * 1000)
+        self.timer_id = self.root.after(min(max(delay_ms, 0), self.MAX_TIMER_MS), self.check_reminders)
+
+    def reschedule(self, reminder):          # call after a reminder's time, snooze or done flag changes
+        self.scheduler.schedule(reminder)
+        self.arm_timer()
 
     # ================= Notify (popup) =================
     def notify_user(self, reminder):     # show popup and play sound
@@ -136,7 +182,8 @@ class ReminderApp:
         win.geometry("420x220")
         win.resizable(False, False)
         try:
-            win.transient(self.root)
+            if self.root.winfo_viewable():     # the app window may be hidden, not closed
+                win.transient(self.root)
             win.grab_set()
             win.focus_force()
             win.attributes("-topmost", True)
@@ -158,10 +205,9 @@ class ReminderApp:
             self.alarm_active = False
             reminder["_notifying"] = False
             reminder.pop("snooze_until", None)
-            if reminder.get("repeat", False):
-                reminder["time"] += timedelta(days=1)
+            if advance(reminder, datetime.now()):  # repeating: jump to the next occurrence
                 reminder["done"] = False
-                status = "repeat-next-day"
+                status = "repeat-next"
             else:
                 reminder["done"] = True
                 status = "done"
@@ -171,9 +217,10 @@ class ReminderApp:
                 "notified_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "status": status
             })
-            self.save_reminders()
-            self.update_reminder_list()
+            self.save_reminder(reminder)
+            self.update_reminder_card(reminder)
             win.destroy()
+            self.reschedule(reminder)
             messagebox.showinfo("Good job!", "You completed a task!")
 
         def remind_later():
@@ -184,9 +231,10 @@ class ReminderApp:
                 reminder["snooze_until"] = datetime.now() + timedelta(minutes=delay_minutes)
                 reminder["snooze_delay"] = delay_minutes
                 reminder["done"] = False
-                self.save_reminders()
-                self.update_reminder_list()
+                self.save_reminder(reminder)
+                self.update_reminder_card(reminder)
                 win.destroy()
+                self.reschedule(reminder)
                 messagebox.showinfo("Snoozed", f"Reminder snoozed for {delay_minutes} minutes")
             except ValueError:
                 messagebox.showerror("Error", "Please enter a valid number of minutes")
@@ -203,41 +251,50 @@ class ReminderApp:
         month = self.month_var.get()
         day = self.day_var.get()
         time_str = self.time_entry.get().strip()
-        repeat = self.repeat_var.get()
         category = self.category_entry.get().strip()
         snooze_delay = self.snooze_delay_var.get()
 
         if not title or not time_str:
             messagebox.showwarning("Input Error", "Please enter both title and time")
             return
+        try:
+            repeat = rule_from_choice(self.repeat_var.get()) or False
+        except ValueError as e:
+            messagebox.showerror("Repeat Error", f"Invalid repeat rule:\n{e}")
+            return
         try:
             remind_time = datetime.strptime(f"{year}-{month}-{day} {time_str}", "%Y-%m-%d %H:%M")
             if remind_time < datetime.now():
                 remind_time += timedelta(days=1)
 
-            self.reminders.append({
+            reminder = {
+                "id": self.new_id(),
                 "title": title,
                 "time": remind_time,
                 "repeat": repeat,
                 "category": category,
                 "snooze_delay": snooze_delay,
                 "done": False
-            })
-            self.save_reminders()
+            }
+            self.reminders.append(reminder)
+            self.save_reminder(reminder)
             self.update_reminder_list()
+            self.reschedule(reminder)
             self.title_entry.delete(0, tk.END)
             self.time_entry.delete(0, tk.END)
             self.category_entry.delete(0, tk.END)
-            self.repeat_var.set(False)
+            self.repeat_var.set("No repeat")
             self.snooze_delay_var.set(5)
         except ValueError:
             messagebox.showerror("Time Format Error", "Please enter time in HH:MM format")
 
     def delete_reminder(self, index):
         if 0 <= index < len(self.reminders):
-            self.reminders.pop(index)
-            self.save_reminders()
+            reminder = self.reminders.pop(index)
+            self.scheduler.cancel(reminder)
+            self.save_deleted(reminder)
             self.update_reminder_list()
+            self.arm_timer()
 
     def edit_reminder(self, index):
         if index < 0 or index >= len(self.reminders):
@@ -246,7 +303,7 @@ class ReminderApp:
 
         win = tk.Toplevel(self.root)
         win.title("✏️ Edit Reminder")
-        win.geometry("350x350")
+        win.geometry("350x400")
 
         tk.Label(win, text="Title:").pack(pady=2)
         title_e = ttk.Entry(win)
@@ -273,24 +330,32 @@ class ReminderApp:
         snooze_delay_e.pack(pady=2)
         snooze_delay_e.set(str(r.get("snooze_delay", 5)))
 
-        repeat_var_local = tk.BooleanVar(value=r.get("repeat", False))
-        tk.Checkbutton(win, text="Repeat daily", variable=repeat_var_local).pack(pady=5)
+        tk.Label(win, text="Repeat (choose, or type a rule like FREQ=WEEKLY;BYDAY=MO,TH):").pack(pady=2)
+        repeat_e = ttk.Combobox(win, values=list(PRESETS), width=32)
+        repeat_e.pack(pady=2)
+        repeat_e.set(choice_for(r))
 
         def save_changes():
             try:
                 new_time = datetime.strptime(date_e.get() + " " + time_e.get(), "%Y-%m-%d %H:%M")
+                repeat = rule_from_choice(repeat_e.get()) or False
                 r["title"] = title_e.get()
                 r["time"] = new_time
                 r["category"] = cat_e.get()
-                r["repeat"] = repeat_var_local.get()
+                r["repeat"] = repeat
                 r["snooze_delay"] = int(snooze_delay_e.get())
                 r.pop("snooze_until", None)
-                r["done"] = new_time <= datetime.now()
-                self.save_reminders()
-                self.update_reminder_list()
+                r["done"] = False
+                if new_time <= datetime.now():
+                    # A past time: a repeating reminder moves to its next occurrence, others are done
+                    moved = advance(r, datetime.now(), fired=False)
+                    r["done"] = not moved
+                self.save_reminder(r)
+                self.update_reminder_card(r)
+                self.reschedule(r)
                 win.destroy()
             except ValueError:
-                messagebox.showerror("Error", "Invalid date or time format!")
+                messagebox.showerror("Error", "Invalid date, time or repeat rule!")
 
         ttk.Button(win, text="✅ Done", command=save_changes).pack(pady=10)
 
@@ -313,42 +378,63 @@ class ReminderApp:
             label = tk.Label(frame, text=f"{r['title']} (🕒 {time_str})\nSnoozed until: {snooze_str}\nDefault delay: {delay_minutes} min", anchor="w", justify="left", font=self.FONT_NORMAL)
             label.pack(fill="x", pady=5, anchor="w")
 
+    def show_upcoming(self):
+        # Read the lazy occurrence stream only as far as the list shows
+        stream = upcoming(self.reminders, datetime.now(), self.UPCOMING_DAYS)
+        win = tk.Toplevel(self.root)
+        win.title(f"📅 Upcoming (next {self.UPCOMING_DAYS} days)")
+        win.geometry("450x400")
+        frame = ttk.Frame(win, padding=10)
+        frame.pack(fill="both", expand=True)
+        scrollbar = ttk.Scrollbar(frame, orient="vertical")
+        listbox = tk.Listbox(frame, font=self.FONT_NORMAL, yscrollcommand=scrollbar.set)
+        scrollbar.configure(command=listbox.yview)
+        scrollbar.pack(side="right", fill="y")
+        listbox.pack(side="left", fill="both", expand=True)
+        shown = 0
+        for moment, r in stream:
+            if shown == self.UPCOMING_LIMIT:
+                listbox.insert(tk.END, f"… showing the first {self.UPCOMING_LIMIT} only")
+                break
+            listbox.insert(tk.END, f"{moment.strftime('%a %Y-%m-%d %H:%M')}  {r['title']}")
+            shown += 1
+        if shown == 0:
+            listbox.insert(tk.END, "Nothing scheduled.")
+
     def import_reminders(self):
         file_path = filedialog.askopenfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
         if file_path:
+            before = len(self.reminders)
+            skipped = 0
             try:
+                seen = {(r["title"], r["time"]) for r in self.reminders}  # dedup index: O(1) per imported reminder
                 with open(file_path, "r") as f:
-                    imported = json.load(f)
-                    for r in imported:
-                        if isinstance(r.get("time"), str):
-                            r["time"] = datetime.strptime(r["time"], "%Y-%m-%d %H:%M")
-                        if "snooze_until" in r and isinstance(r["snooze_until"], str):
-                            try:
-                                r["snooze_until"] = datetime.strptime(r["snooze_until"], "%Y-%m-%d %H:%M:%S")
-                            except:
-                                r.pop("snooze_until", None)
-                        r.setdefault("repeat", False)
-                        r.setdefault("done", False)
-                        r.setdefault("snooze_delay", 5)
-                        if not any(existing["title"] == r["title"] and existing["time"] == r["time"] for existing in self.reminders):
-                            self.reminders.append(r)
-                self.save_reminders()
-                self.update_reminder_list()
-                messagebox.showinfo("Import Successful", f"Reminders imported from {file_path}")
+                    for r in iter_json_array(f):  # one reminder decoded at a time
+                        r = from_record(r)
+                        key = (r["title"], r["time"])
+                        if key in seen:
+                            skipped += 1
+                            continue
+                        seen.add(key)
+                        r["id"] = self.new_id() # ids from another file may clash with ours
+                        self.reminders.append(r)
             except Exception as e:
+                del self.reminders[before:] # all or nothing
                 messagebox.showerror("Import Error", f"Failed to import reminders:\n{e}")
+                return
+            # one save, one list refresh and one scheduler build for the whole file
+            self.save_reminders()
+            self.update_reminder_list()
+            self.scheduler = create_scheduler(self.SCHEDULER_ENGINE, self.reminders)  # size may call for the other engine
+            self.arm_timer()
+            messagebox.showinfo("Import Successful", f"Imported {len(self.reminders) - before} reminders from {file_path}"
+                                + (f" ({skipped} duplicates skipped)" if skipped else ""))
 
     def export_reminders(self):
         file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
         if file_path:
             with open(file_path, "w") as f:
-                json.dump([
-                    {
-                        **r,
-                        "time": r["time"].strftime("%Y-%m-%d %H:%M"),
-                        **({"snooze_until": r["snooze_until"].strftime("%Y-%m-%d %H:%M:%S")} if r.get("snooze_until") else {})
-                    } for r in self.reminders
-                ], f, indent=2)
+                json.dump([to_record(r) for r in self.reminders], f, indent=2)
             messagebox.showinfo("Export Successful", f"Reminders exported to {file_path}")
 
     # ================= UI =================
@@ -400,8 +486,11 @@ class ReminderApp:
         snooze_delay_combo.grid(row=4, column=1, sticky="w", pady=2, padx=(5, 0))
         ttk.Label(add_frame, text="Default delay when snoozing").grid(row=4, column=2, sticky="w", pady=2, padx=(5, 0))
 
-        self.repeat_var = tk.BooleanVar()
-        ttk.Checkbutton(add_frame, text="Repeat daily", variable=self.repeat_var).grid(row=5, column=1, sticky="w", pady=2, padx=(5, 0))
+        ttk.Label(add_frame, text="Repeat:").grid(row=5, column=0, sticky="w", pady=2)
+        self.repeat_var = tk.StringVar(value="No repeat")
+        repeat_combo = ttk.Combobox(add_frame, textvariable=self.repeat_var, values=list(PRESETS), width=20)
+        repeat_combo.grid(row=5, column=1, sticky="w", pady=2, padx=(5, 0))
+        ttk.Label(add_frame, text="or a rule, e.g. FREQ=WEEKLY;BYDAY=MO,TH;COUNT=5").grid(row=5, column=2, columnspan=2, sticky="w", pady=2, padx=(5, 0))
 
         add_btn = ttk.Button(add_frame, text="➕ Add Reminder", command=self.add_reminder, style="Accent.TButton")
         add_btn.grid(row=6, column=1, sticky="e", pady=(5, 0))
@@ -413,57 +502,23 @@ class ReminderApp:
         ttk.Button(io_frame, text="📂 Import Reminders", command=self.import_reminders).pack(side="left", padx=(0,5))
         ttk.Button(io_frame, text="💾 Export Reminders", command=self.export_reminders).pack(side="left")
         ttk.Button(io_frame, text="⏱️ View Snoozed", command=self.show_snoozed_reminders).pack(side="left", padx=(5,0))
+        ttk.Button(io_frame, text="📅 Upcoming", command=self.show_upcoming).pack(side="left", padx=(5,0))
 
         # Reminder List
         list_frame = ttk.LabelFrame(main_container, text="Your Reminders", padding=5)
         list_frame.pack(fill="both", expand=True)
         self.canvas = tk.Canvas(list_frame, borderwidth=0, highlightthickness=0, bg=self.BG_COLOR)
         self.scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.canvas.yview)
-        self.reminder_frame = ttk.Frame(self.canvas, style="TFrame")
-        self.reminder_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.create_window((0, 0), window=self.reminder_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.reminder_list = ReminderList(self.canvas, self.scrollbar, self) # cards for visible rows only
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
     # ================= Update Reminder List =================
-    def update_reminder_list(self):
-        for widget in self.reminder_frame.winfo_children():
-            widget.destroy()
-
-        for idx, reminder in enumerate(self.reminders):
-            bg = self.CARD_BG
-            if reminder.get("done", False):
-                bg = self.DONE_BG
-            elif reminder.get("snooze_until"):
-                bg = self.SNOOZED_BG
-
-            frame = tk.Frame(self.reminder_frame, bg=bg, bd=1, relief="raised", padx=5, pady=5)
-            frame.pack(fill="x", pady=5, padx=5)
-
-            def on_enter(e, f=frame):
-                f.configure(bg=self.CARD_HOVER)
-            def on_leave(e, f=frame, b=bg):
-                f.configure(bg=b)
-            frame.bind("<Enter>", on_enter)
-            frame.bind("<Leave>", on_leave)
-
-            time_str = reminder["time"].strftime("%Y-%m-%d %H:%M")
-            status_text = ""
-            if reminder.get("snooze_until"):
-                snooze_time = reminder["snooze_until"].strftime("%H:%M:%S")
-                status_text = f"⏰ Snoozed until {snooze_time}"
-
-            tk.Label(frame, text=reminder["title"], font=self.FONT_TITLE, bg=bg).pack(anchor="w")
-            tk.Label(frame, text=f"🕒 {time_str}  |  📂 {reminder.get('category','None')}", font=self.FONT_SMALL, fg="#555", bg=bg).pack(anchor="w")
-            tk.Label(frame, text=f"⏱️ Default snooze: {reminder.get('snooze_delay', 5)} minutes", font=self.FONT_SMALL, fg="#666", bg=bg).pack(anchor="w")
-            if status_text:
-                tk.Label(frame, text=status_text, font=self.FONT_SMALL, fg="#888", bg=bg).pack(anchor="w")
-
-            btn_frame = tk.Frame(frame, bg=bg)
-            btn_frame.pack(anchor="e", pady=2)
-            ttk.Button(btn_frame, text="✏️ Edit", command=lambda i=idx: self.edit_reminder(i)).pack(side="left", padx=2)
-            ttk.Button(btn_frame, text="🗑️ Delete", command=lambda i=idx: self.delete_reminder(i)).pack(side="left", padx=2)
+    def update_reminder_list(self):      # list changed size or order; only on-screen cards are redrawn
+        self.reminder_list.refresh(self.reminders)
+
+    def update_reminder_card(self, reminder):  # one reminder changed in place
+        self.reminder_list.patch(reminder)
 
 
 if __name__ == "__main__":
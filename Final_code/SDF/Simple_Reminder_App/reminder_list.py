@@ -0,0 +1,192 @@
+from datetime import datetime
+import tkinter as tk
+from tkinter import ttk
+
+
+class ReminderCard:
+    """One reusable card: a frame, its labels and Edit/Delete buttons.
+
+    show() points the card at a reminder and only reconfigures the widgets
+    whose text or colour actually changed.
+    """
+
+    def __init__(self, reminder_list):
+        self.list = reminder_list
+        app = reminder_list.app
+        self.reminder = None
+        self.index = None
+        self.state = None  # (bg, title, info, snooze, status) last shown
+        self.bg = app.CARD_BG
+
+        self.frame = tk.Frame(reminder_list.canvas, bd=1, relief="raised", padx=5, pady=5)
+        self.title_label = tk.Label(self.frame, font=app.FONT_TITLE)
+        self.title_label.pack(anchor="w")
+        self.info_label = tk.Label(self.frame, font=app.FONT_SMALL, fg="#555")
+        self.info_label.pack(anchor="w")
+        self.snooze_label = tk.Label(self.frame, font=app.FONT_SMALL, fg="#666")
+        self.snooze_label.pack(anchor="w")
+        self.status_label = tk.Label(self.frame, font=app.FONT_SMALL, fg="#888")
+
+        self.btn_frame = tk.Frame(self.frame)
+        self.btn_frame.pack(anchor="e", pady=2)
+        ttk.Button(self.btn_frame, text="✏️ Edit", command=lambda: app.edit_reminder(self.index)).pack(side="left", padx=2)
+        ttk.Button(self.btn_frame, text="🗑️ Delete", command=lambda: app.delete_reminder(self.index)).pack(side="left", padx=2)
+
+        self.frame.bind("<Enter>", lambda e: self.frame.configure(bg=app.CARD_HOVER))
+        self.frame.bind("<Leave>", lambda e: self.frame.configure(bg=self.bg))
+
+        self.item = reminder_list.canvas.create_window(0, 0, window=self.frame, anchor="nw", state="hidden")
+
+    def card_state(self, reminder):
+        app = self.list.app
+        bg = app.CARD_BG
+        if reminder.get("done", False):
+            bg = app.DONE_BG
+        elif reminder.get("snooze_until"):
+            bg = app.SNOOZED_BG
+        time_str = reminder["time"].strftime("%Y-%m-%d %H:%M")
+        status_text = ""
+        if reminder.get("snooze_until"):
+            status_text = f"⏰ Snoozed until {reminder['snooze_until'].strftime('%H:%M:%S')}"
+        return (bg,
+                reminder["title"],
+                f"🕒 {time_str}  |  📂 {reminder.get('category','None')}",
+                f"⏱️ Default snooze: {reminder.get('snooze_delay', 5)} minutes",
+                status_text)
+
+    def show(self, reminder, index):
+        self.reminder = reminder
+        self.index = index
+        state = self.card_state(reminder)
+        if state == self.state:
+            return
+        old = self.state or (None,) * 5
+        bg, title, info, snooze, status = state
+        if bg != old[0]:
+            self.bg = bg
+            for widget in (self.frame, self.title_label, self.info_label, self.snooze_label,
+                           self.status_label, self.btn_frame):
+                widget.configure(bg=bg)
+        if title != old[1]:
+            self.title_label.configure(text=title)
+        if info != old[2]:
+            self.info_label.configure(text=info)
+        if snooze != old[3]:
+            self.snooze_label.configure(text=snooze)
+        if status != old[4]:
+            self.status_label.configure(text=status)
+            if status and not old[4]:
+                self.status_label.pack(anchor="w", before=self.btn_frame)
+            elif not status:
+                self.status_label.pack_forget()
+        self.state = state
+
+    def place(self, y):
+        self.list.canvas.coords(self.item, self.list.PADX, y)
+        self.list.canvas.itemconfigure(self.item, state="normal")
+
+    def hide(self):
+        self.list.canvas.itemconfigure(self.item, state="hidden")
+        self.reminder = None
+        self.index = None
+
+
+class ReminderList:
+    """Virtualized reminder list drawn on a Canvas.
+
+    Every card has the same height, so the cards in view follow directly
+    from the scroll position. Only those are materialized; cards that
+    scroll out are hidden and reused for the rows scrolling in. Building
+    the list, or changing one reminder, touches at most a screenful of
+    widgets however many reminders there are.
+    """
+
+    GAP = 10  # vertical space between cards
+    PADX = 5
+
+    def __init__(self, canvas, scrollbar, app):
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.app = app
+        self.reminders = []
+        self.cards = {}   # row index -> card currently showing it
+        self.spare = []   # hidden cards ready for reuse
+        self.card_height = None
+        self.width = 1
+        canvas.configure(yscrollcommand=self.on_view_change)
+        canvas.bind("<Configure>", self.on_resize)
+
+    @property
+    def row_height(self):
+        return self.card_height + self.GAP
+
+    def measure(self):
+        # Height of the tallest card layout (with the snoozed line); every row gets it
+        card = ReminderCard(self)
+        now = datetime.now()
+        card.show({"title": "Ag", "time": now, "snooze_until": now}, None)
+        card.frame.update_idletasks()
+        self.card_height = card.frame.winfo_reqheight()
+        card.hide()
+        self.canvas.itemconfigure(card.item, width=self.width, height=self.card_height)
+        self.spare.append(card)
+
+    def new_card(self):
+        card = ReminderCard(self)
+        self.canvas.itemconfigure(card.item, width=self.width, height=self.card_height)
+        return card
+
+    # ---------------- Updating ----------------
+    def refresh(self, reminders):
+        """Reminders were added, removed or reordered: re-point the visible cards"""
+        self.reminders = reminders
+        if self.card_height is None:
+            self.measure()
+        self.canvas.configure(scrollregion=(0, 0, self.width, len(reminders) * self.row_height))
+        self.render(rebind=True)
+
+    def patch(self, reminder):
+        """One reminder changed in place: update its card if it is on screen"""
+        for index, card in self.cards.items():
+            if card.reminder is reminder:
+                card.show(reminder, index)
+                return
+
+    def render(self, rebind=False):
+        if self.card_height is None:
+            return
+        row_height = self.row_height
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(0, int(top // row_height))
+        last = min(len(self.reminders), int(bottom // row_height) + 1)
+
+        for index in [i for i in self.cards if not first <= i < last]:
+            card = self.cards.pop(index)
+            card.hide()
+            self.spare.append(card)
+
+        for index in range(first, last):
+            card = self.cards.get(index)
+            if card is None:
+                card = self.spare.pop() if self.spare else self.new_card()
+                card.place(index * row_height + self.GAP // 2)
+                self.cards[index] = card
+            elif not rebind:
+                continue
+            card.show(self.reminders[index], index)
+
+    # ---------------- Canvas events ----------------
+    def on_view_change(self, first, last):
+        self.scrollbar.set(first, last)
+        self.render()
+
+    def on_resize(self, event):
+        width = max(1, event.width - 2 * self.PADX)
+        if width != self.width:
+            self.width = width
+            for card in list(self.cards.values()) + self.spare:
+                self.canvas.itemconfigure(card.item, width=width)
+            if self.card_height is not None:
+                self.canvas.configure(scrollregion=(0, 0, width, len(self.reminders) * self.row_height))
+        self.render()
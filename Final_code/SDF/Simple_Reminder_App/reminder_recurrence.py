@@ -0,0 +1,249 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
+import heapq
+
+from Simple_Reminder_App.reminder_scheduler import due_time
+
+FREQUENCIES = ("HOURLY", "DAILY", "WEEKLY", "MONTHLY")
+DAY_NAMES = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+UNTIL_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%d", "%Y%m%dT%H%M%S", "%Y%m%d")
+MAX_MONTH_SKIPS = 400  # e.g. day 31 every 2 months, or a date that never exists (Feb 30)
+
+# Choices offered in the Repeat box; anything else typed there is read as a rule
+PRESETS = {
+    "No repeat": None,
+    "Daily": "FREQ=DAILY",
+    "Weekdays": "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR",
+    "Weekly": "FREQ=WEEKLY",
+    "Monthly": "FREQ=MONTHLY",
+    "Every hour": "FREQ=HOURLY",
+}
+
+
+class Recurrence:
+    """A parsed RRULE-style rule, e.g. "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;COUNT=5".
+
+    FREQ is HOURLY, DAILY, WEEKLY or MONTHLY; INTERVAL repeats every N of
+    them; BYDAY picks weekdays for WEEKLY (default: the reminder's own);
+    UNTIL ends the series; COUNT is how many more times it fires.
+    Occurrences keep the time of day (and for MONTHLY the day of month)
+    of the reminder's time; months without that day are skipped.
+    """
+
+    def __init__(self, freq, interval=1, days=None, until=None, count=None):
+        self.freq = freq
+        self.interval = interval
+        self.days = days    # sorted weekday numbers, Monday = 0, or None
+        self.until = until
+        self.count = count
+
+    @property
+    def text(self):
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.days is not None:
+            parts.append("BYDAY=" + ",".join(DAY_NAMES[d] for d in self.days))
+        if self.until is not None:
+            parts.append("UNTIL=" + self.until.strftime("%Y-%m-%d %H:%M"))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        return ";".join(parts)
+
+    def with_count(self, count):
+        return Recurrence(self.freq, self.interval, self.days, self.until, count)
+
+    # ---------------- Next occurrence ----------------
+    def next_after(self, anchor, after):
+        """First occurrence later than `after` in the series starting at `anchor`, or None.
+
+        Works out how many periods to jump instead of stepping through them,
+        so a reminder that missed months of occurrences costs the same as one
+        that missed none.
+        """
+        if self.freq == "WEEKLY":
+            moment = self._next_weekly(anchor, after)
+        elif self.freq == "MONTHLY":
+            moment = self._next_monthly(anchor, after)
+        else:
+            step = timedelta(hours=self.interval) if self.freq == "HOURLY" else timedelta(days=self.interval)
+            moment = anchor if after < anchor else anchor + ((after - anchor) // step + 1) * step
+        if moment is None or (self.until is not None and moment > self.until):
+            return None
+        return moment
+
+    def _next_weekly(self, anchor, after):
+        days = self.days if self.days is not None else (anchor.weekday(),)
+        first_monday = anchor.date() - timedelta(days=anchor.weekday())
+        week = max(0, (after.date() - first_monday).days // 7)
+        week = -(-week // self.interval) * self.interval  # round up to a week the rule fires in
+        for _ in range(2):  # this week, else the next firing week always has one
+            monday = datetime.combine(first_monday + timedelta(weeks=week), anchor.time())
+            for day in days:
+                moment = monday + timedelta(days=day)
+                if moment > after and moment >= anchor:
+                    return moment
+            week += self.interval
+        return None
+
+    def _next_monthly(self, anchor, after):
+        first = anchor.year * 12 + anchor.month - 1
+        step = max(0, -(-(after.year * 12 + after.month - 1 - first) // self.interval))
+        for _ in range(MAX_MONTH_SKIPS):
+            year, month = divmod(first + step * self.interval, 12)
+            try:
+                moment = anchor.replace(year=year, month=month + 1)
+            except ValueError:  # no such day this month
+                moment = None
+            if moment is not None and moment > after and moment >= anchor:
+                return moment
+            step += 1
+        return None
+
+
+@lru_cache(maxsize=256)
+def parse_rule(text):
+    """Recurrence for a rule string; raises ValueError if it is not one"""
+    fields = {}
+    for part in text.strip().strip(";").split(";"):
+        key, sep, value = part.partition("=")
+        if not sep:
+            raise ValueError(f"Expected KEY=VALUE, got {part!r}")
+        fields[key.strip().upper()] = value.strip()
+
+    freq = fields.pop("FREQ", "").upper()
+    if freq not in FREQUENCIES:
+        raise ValueError(f"FREQ must be one of {', '.join(FREQUENCIES)}")
+    interval = int(fields.pop("INTERVAL", "1"))
+    if interval < 1:
+        raise ValueError("INTERVAL must be at least 1")
+
+    days = None
+    if "BYDAY" in fields:
+        if freq != "WEEKLY":
+            raise ValueError("BYDAY only applies to FREQ=WEEKLY")
+        names = [name.strip().upper() for name in fields.pop("BYDAY").split(",") if name.strip()]
+        if not names or any(name not in DAY_NAMES for name in names):
+            raise ValueError(f"BYDAY takes {','.join(DAY_NAMES)}")
+        days = tuple(sorted({DAY_NAMES.index(name) for name in names}))
+
+    until = None
+    if "UNTIL" in fields:
+        value = fields.pop("UNTIL")
+        for fmt in UNTIL_FORMATS:
+            try:
+                until = datetime.strptime(value, fmt)
+                break
+            except ValueError:
+                pass
+        else:
+            raise ValueError("UNTIL must look like YYYY-MM-DD HH:MM")
+        if len(value) in (8, 10):  # a date alone includes that whole day
+            until += timedelta(days=1, microseconds=-1)
+
+    count = None
+    if "COUNT" in fields:
+        count = int(fields.pop("COUNT"))
+        if count < 1:
+            raise ValueError("COUNT must be at least 1")
+
+    if fields:
+        raise ValueError(f"Unknown rule part(s): {', '.join(fields)}")
+    return Recurrence(freq, interval, days, until, count)
+
+
+def rule_for(reminder):
+    """The reminder's Recurrence, or None; repeat=True in older files means daily"""
+    repeat = reminder.get("repeat")
+    if not isinstance(repeat, str):
+        return parse_rule("FREQ=DAILY") if repeat else None
+    if not repeat:
+        return None
+    try:
+        return parse_rule(repeat)
+    except ValueError:
+        return None
+
+
+def rule_from_choice(choice):
+    """Rule text (or None) for what was picked or typed in the Repeat box"""
+    choice = choice.strip()
+    if choice in PRESETS:
+        return PRESETS[choice]
+    if not choice:
+        return None
+    return parse_rule(choice).text  # ValueError for nonsense
+
+
+def choice_for(reminder):
+    """What the Repeat box should show for a reminder"""
+    rule = rule_for(reminder)
+    if rule is None:
+        return "No repeat"
+    for label, text in PRESETS.items():
+        if text == rule.text:
+            return label
+    return rule.text
+
+
+def advance(reminder, now, fired=True):
+    """Move a repeating reminder to its next occurrence after `now`.
+
+    Returns False, leaving the reminder alone, when it does not repeat or
+    its series has ended. `fired` counts the current occurrence against
+    COUNT; pass False when just skipping past times (e.g. after an edit).
+    """
+    rule = rule_for(reminder)
+    if rule is None or (fired and rule.count is not None and rule.count <= 1):
+        return False
+    moment = rule.next_after(reminder["time"], max(now, reminder["time"]))
+    if moment is None:
+        return False
+    if fired and rule.count is not None:
+        reminder["repeat"] = rule.with_count(rule.count - 1).text
+    reminder["time"] = moment
+    return True
+
+
+# ---------------- Upcoming occurrences ----------------
+def occurrences(reminder, start, end):
+    """Lazily yield the reminder's fire times from `start` (now) up to `end`.
+
+    COUNT counts fires from the reminder's current occurrence, as advance()
+    does: an overdue occurrence still fires once and uses up one, while the
+    occurrences it missed before `start` are skipped without using any.
+    """
+    if reminder.get("done", False):
+        return
+    rule = rule_for(reminder)
+    moment = due_time(reminder)
+    left = rule.count if rule is not None and rule.count is not None else None
+    if moment < start:
+        if rule is None or left == 1:
+            return
+        if left is not None:
+            left -= 1  # the overdue occurrence, fired as soon as the app sees it
+        moment = rule.next_after(reminder["time"], start - timedelta(microseconds=1))
+    while moment is not None and moment <= end:
+        yield moment
+        if rule is None or left == 1:
+            return
+        if left is not None:
+            left -= 1
+        moment = rule.next_after(reminder["time"], moment)
+
+
+def upcoming(reminders, start, days=30):
+    """(time, reminder) pairs for every occurrence in the next `days`, in time order.
+
+    A lazy merge of one generator per reminder: only as many occurrences
+    are computed as the caller actually reads.
+    """
+    end = start + timedelta(days=days)
+    streams = [_tagged(reminder, start, end) for reminder in reminders]
+    return heapq.merge(*streams, key=lambda item: item[0])
+
+
+def _tagged(reminder, start, end):
+    for moment in occurrences(reminder, start, end):
+        yield moment, reminder
@@ -0,0 +1,206 @@
+from datetime import datetime
+import heapq
+import itertools
+
+
+def due_time(reminder):
+    """When a reminder should fire: its snooze time if snoozed, else its time"""
+    return reminder.get("snooze_until") or reminder["time"]
+
+
+def to_tick(moment):
+    # Whole seconds on a local-time scale; cheaper than datetime.timestamp()
+    return moment.toordinal() * 86400 + moment.hour * 3600 + moment.minute * 60 + moment.second
+
+
+class HeapScheduler:
+    """Pending reminders in a min-heap keyed on due time.
+
+    Rescheduling or cancelling marks the old heap entry dead instead of
+    searching for it; dead entries are skipped when they reach the top, and
+    the heap is rebuilt once they outnumber the live ones.
+    """
+
+    def __init__(self, reminders=()):
+        self.rebuild(reminders)
+
+    def rebuild(self, reminders):
+        self.heap = []
+        self.entries = {}  # id(reminder) -> live heap entry
+        self.counter = itertools.count()  # Tie-breaker: dicts do not compare
+        for reminder in reminders:
+            self.schedule(reminder)
+
+    def schedule(self, reminder):
+        """(Re)schedule a reminder at its current due time; done ones are dropped"""
+        self.cancel(reminder)
+        if reminder.get("done", False):
+            return
+        entry = [due_time(reminder), next(self.counter), reminder, True]
+        self.entries[id(reminder)] = entry
+        heapq.heappush(self.heap, entry)
+
+    def cancel(self, reminder):
+        entry = self.entries.pop(id(reminder), None)
+        if entry is not None:
+            entry[3] = False
+            if len(self.heap) > 2 * len(self.entries) + 64:
+                self._compact()
+
+    def _compact(self):
+        self.heap = [entry for entry in self.heap if entry[3]]
+        heapq.heapify(self.heap)
+
+    def _drop_dead(self):
+        while self.heap and not self.heap[0][3]:
+            heapq.heappop(self.heap)
+
+    def next_due(self):
+        """Due time of the earliest pending reminder, or None"""
+        self._drop_dead()
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now):
+        """Remove and return the earliest reminder due at `now`, or None"""
+        self._drop_dead()
+        if not self.heap or self.heap[0][0] > now:
+            return None
+        entry = heapq.heappop(self.heap)
+        del self.entries[id(entry[2])]
+        return entry[2]
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class TimerWheelScheduler:
+    """Hierarchical timing wheel with the same interface as HeapScheduler.
+
+    Due times are bucketed by whole second. Level 0 has one slot per second
+    of the current 64-second block, level 1 one slot per 64 seconds of the
+    current 4096-second block, and so on; anything beyond the top level
+    waits in an overflow bucket. Slots are dicts, so schedule, cancel and
+    snooze are O(1). As time advances, buckets cascade down a level until
+    they reach the `ready` heap, which holds only reminders due this second
+    or earlier.
+    """
+
+    BITS = 6
+    SLOTS = 1 << BITS
+    LEVELS = 4  # 64 ** 4 seconds, about 194 days, before overflow
+
+    def __init__(self, reminders=(), now=None):
+        self.now = now
+        self.rebuild(reminders)
+
+    def rebuild(self, reminders):
+        self.current = to_tick(self.now or datetime.now())
+        self.wheels = [[{} for _ in range(self.SLOTS)] for _ in range(self.LEVELS)]
+        self.overflow = {}
+        self.ready = []  # heap of entries due at or before the current second
+        self.entries = {}  # id(reminder) -> entry
+        self.counter = itertools.count()
+        for reminder in reminders:
+            self.schedule(reminder)
+
+    # entry = [due, seq, reminder, alive, bucket]; bucket is None while in `ready`
+    def _place(self, entry):
+        tick = to_tick(entry[0])
+        if tick <= self.current:
+            entry[4] = None
+            heapq.heappush(self.ready, entry)
+            return
+        for level in range(self.LEVELS):
+            shift = self.BITS * (level + 1)
+            if tick >> shift == self.current >> shift:
+                bucket = self.wheels[level][(tick >> (self.BITS * level)) & (self.SLOTS - 1)]
+                break
+        else:
+            bucket = self.overflow
+        entry[4] = bucket
+        bucket[id(entry[2])] = entry
+
+    def schedule(self, reminder):
+        self.cancel(reminder)
+        if reminder.get("done", False):
+            return
+        entry = [due_time(reminder), next(self.counter), reminder, True, None]
+        self.entries[id(reminder)] = entry
+        self._place(entry)
+
+    def cancel(self, reminder):
+        entry = self.entries.pop(id(reminder), None)
+        if entry is None:
+            return
+        entry[3] = False
+        if entry[4] is not None:
+            del entry[4][id(reminder)]
+
+    def _replace_bucket(self, bucket):
+        entries = list(bucket.values())
+        bucket.clear()
+        for entry in entries:
+            self._place(entry)
+
+    def _advance(self, tick):
+        """Move the wheel to `tick`, cascading every bucket the move passes"""
+        if tick <= self.current:
+            return
+        old, self.current = self.current, tick
+        for level in range(self.LEVELS):
+            shift = self.BITS * level
+            if old >> (shift + self.BITS) != tick >> (shift + self.BITS):
+                # Left this level's block entirely: every bucket cascades
+                for bucket in self.wheels[level]:
+                    if bucket:
+                        self._replace_bucket(bucket)
+            else:
+                # Still in the same block: only the buckets passed over
+                for slot in range((old >> shift) & (self.SLOTS - 1), ((tick >> shift) & (self.SLOTS - 1)) + 1):
+                    if self.wheels[level][slot]:
+                        self._replace_bucket(self.wheels[level][slot])
+                return
+        if self.overflow:
+            self._replace_bucket(self.overflow)
+
+    def _drop_dead(self):
+        while self.ready and not self.ready[0][3]:
+            heapq.heappop(self.ready)
+
+    def next_due(self):
+        self._drop_dead()
+        if self.ready:
+            return self.ready[0][0]
+        # Levels hold ever later times, so the first non-empty bucket wins
+        for level in range(self.LEVELS):
+            start = (self.current >> (self.BITS * level)) & (self.SLOTS - 1)
+            for slot in range(start, self.SLOTS):
+                bucket = self.wheels[level][slot]
+                if bucket:
+                    return min(entry[0] for entry in bucket.values())
+        if self.overflow:
+            return min(entry[0] for entry in self.overflow.values())
+        return None
+
+    def pop_due(self, now):
+        self._advance(to_tick(now))
+        self._drop_dead()
+        if not self.ready or self.ready[0][0] > now:
+            return None
+        entry = heapq.heappop(self.ready)
+        del self.entries[id(entry[2])]
+        return entry[2]
+
+    def __len__(self):
+        return len(self.entries)
+
+
+SCHEDULERS = {"heap": HeapScheduler, "wheel": TimerWheelScheduler}
+WHEEL_THRESHOLD = 20000  # "auto" switches to the timing wheel from this many reminders
+
+
+def create_scheduler(engine, reminders):
+    """Scheduler for `reminders` by engine name: 'heap', 'wheel' or 'auto'"""
+    if engine == "auto":
+        engine = "wheel" if len(reminders) >= WHEEL_THRESHOLD else "heap"
+    return SCHEDULERS[engine](reminders)
@@ -0,0 +1,194 @@
+from datetime import datetime
+import json
+import os
+
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+SNOOZE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def from_record(record):
+    """Reminder from a JSON record: times parsed, missing fields defaulted"""
+    if isinstance(record.get("time"), str):
+        record["time"] = datetime.strptime(record["time"], TIME_FORMAT)
+    if "snooze_until" in record and isinstance(record["snooze_until"], str):
+        try:
+            record["snooze_until"] = datetime.strptime(record["snooze_until"], SNOOZE_FORMAT)
+        except ValueError:
+            record.pop("snooze_until", None)
+    record.setdefault("repeat", False)
+    record.setdefault("done", False)
+    record.setdefault("snooze_delay", 5)
+    record.pop("_notifying", None) # runtime-only flag, older files saved it
+    return record
+
+
+def iter_json_array(file, chunk_size=1 << 16):
+    """Yield the items of a top-level JSON list one at a time.
+
+    Reads `file` in chunks and decodes each item as soon as it is complete,
+    so only one chunk plus the current item is ever held in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        chunk = file.read(chunk_size)
+        if not chunk:
+            eof = True
+        buffer = buffer[pos:] + chunk  # drop what is already decoded
+        pos = 0
+
+    def next_char():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer) or eof:
+                return buffer[pos] if pos < len(buffer) else ""
+            fill()
+
+    if next_char() != "[":
+        raise ValueError("Expected a JSON list of reminders")
+    pos += 1
+    if next_char() == "]":
+        return
+    while True:
+        next_char()
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            fill()  # item runs past the chunk
+            continue
+        if not eof and not isinstance(item, (dict, list, str)):
+            # a number cut by the chunk ("1." of "1.5") decodes early; wait for its delimiter
+            after = end
+            while after < len(buffer) and buffer[after].isspace():
+                after += 1
+            if after == len(buffer) or buffer[after] not in ",]":
+                fill()
+                continue
+        pos = end
+        yield item
+        separator = next_char()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' in the reminder list, got {separator!r}")
+        pos += 1
+
+
+def to_record(reminder):
+    """JSON-ready copy of a reminder; keys starting with '_' are runtime-only"""
+    record = {key: value for key, value in reminder.items() if not key.startswith("_")}
+    record["time"] = reminder["time"].strftime(TIME_FORMAT)
+    if isinstance(reminder.get("snooze_until"), datetime):
+        record["snooze_until"] = reminder["snooze_until"].strftime(SNOOZE_FORMAT)
+    return record
+
+
+class ReminderStore:
+    """reminders.json snapshot plus a write-ahead log of single-reminder changes.
+
+    The app marks reminders dirty (or deleted) as they change; flush()
+    appends one line per dirty reminder, so a burst of edits to the same
+    reminder costs one line. Every `compact_every` lines the log is folded
+    into a fresh snapshot, written to a temp file and swapped in atomically.
+    Reminders are matched by their "id" field.
+    """
+
+    def __init__(self, data_file, compact_every=200):
+        self.data_file = data_file
+        self.log_file = data_file + ".log"
+        self.compact_every = compact_every
+        self.logged = 0      # lines in the log since the last compaction
+        self.dirty = {}      # id -> reminder changed since the last flush
+        self.deleted = set() # ids deleted since the last flush
+
+    # ---------------- Loading ----------------
+    def load(self):
+        """Snapshot records with the log replayed on top, in list order"""
+        records = []
+        if os.path.exists(self.data_file):
+            try:
+                with open(self.data_file, 'r') as file:
+                    records = json.load(file)
+            except ValueError:
+                records = []
+
+        self.logged = 0
+        if os.path.exists(self.log_file):
+            by_id = {record.get("id"): i for i, record in enumerate(records)}
+            good_size = 0
+            with open(self.log_file, 'rb') as log:
+                for line in log:
+                    if not line.endswith(b"\n"):      # torn last write
+                        break
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    self.logged += 1
+                    good_size += len(line)
+                    if entry["op"] == "put":
+                        record = entry["reminder"]
+                        if record["id"] in by_id:
+                            records[by_id[record["id"]]] = record
+                        else:
+                            by_id[record["id"]] = len(records)
+                            records.append(record)
+                    elif entry["op"] == "delete" and entry["id"] in by_id:
+                        records[by_id.pop(entry["id"])] = None
+            # Drop any partial tail so the next flush starts on a clean line
+            if good_size < os.path.getsize(self.log_file):
+                with open(self.log_file, 'r+b') as log:
+                    log.truncate(good_size)
+            records = [record for record in records if record is not None]
+        return records
+
+    # ---------------- Changes ----------------
+    def mark_dirty(self, reminder):
+        self.deleted.discard(reminder["id"])
+        self.dirty[reminder["id"]] = reminder
+
+    def mark_deleted(self, reminder):
+        self.dirty.pop(reminder["id"], None)
+        self.deleted.add(reminder["id"])
+
+    def has_changes(self):
+        return bool(self.dirty or self.deleted)
+
+    def flush(self, reminders):
+        """Append pending changes to the log; compact when it has grown long"""
+        if not self.has_changes():
+            return
+        lines = [json.dumps({"op": "put", "reminder": to_record(r)}) + "\n" for r in self.dirty.values()]
+        lines += [json.dumps({"op": "delete", "id": reminder_id}) + "\n" for reminder_id in self.deleted]
+        self.dirty = {}
+        self.deleted = set()
+
+        with open(self.log_file, 'a') as log:
+            log.write("".join(lines))
+            log.flush()
+            os.fsync(log.fileno())
+        self.logged += len(lines)
+        if self.logged >= self.compact_every:
+            self.compact(reminders)
+
+    def compact(self, reminders):
+        """Write every reminder to a fresh snapshot atomically, then empty the log"""
+        self.dirty = {}
+        self.deleted = set()
+        tmp_file = self.data_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump([to_record(r) for r in reminders], f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.data_file)
+        if os.path.exists(self.log_file):
+            open(self.log_file, 'w').close()
+        self.logged = 0
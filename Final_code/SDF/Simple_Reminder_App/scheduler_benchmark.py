@@ -0,0 +1,90 @@
+"""Compare the reminder scheduling engines against the old linear scan.
+
+Run: python Simple_Reminder_App/scheduler_benchmark.py [sizes...]
+"""
+from datetime import datetime, timedelta
+import os
+import random
+import sys
+import time
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Simple_Reminder_App.reminder_scheduler import HeapScheduler, TimerWheelScheduler
+
+OPERATIONS = 1000  # snoozes / cancels timed per engine
+
+
+def make_reminders(count, now):
+    # Spread over a year, a few already due
+    return [{"title": f"Reminder {i}", "time": now + timedelta(seconds=random.randint(-60, 365 * 86400)),
+             "done": False} for i in range(count)]
+
+
+def linear_check(reminders, now):
+    """The work the old check_reminders did on every 3-second wakeup"""
+    due = []
+    for reminder in reminders:
+        if reminder.get("done", False) or reminder.get("_notifying", False):
+            continue
+        snooze_until = reminder.get("snooze_until")
+        if (snooze_until and now >= snooze_until) or (not snooze_until and now >= reminder["time"]):
+            due.append(reminder)
+    return due
+
+
+def timed(func):
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000
+
+
+def bench(count):
+    random.seed(count)
+    now = datetime.now()
+    reminders = make_reminders(count, now)
+    sample = random.sample(reminders, min(OPERATIONS, count))
+    rows = []
+
+    # Linear scan: no structure to build, snooze/cancel are free, every check is O(n)
+    rows.append(("linear scan", 0.0, timed(lambda: linear_check(reminders, now)), 0.0, 0.0))
+
+    for name, engine in (("heap", HeapScheduler), ("timing wheel", TimerWheelScheduler)):
+        scheduler = None
+
+        def build():
+            nonlocal scheduler
+            scheduler = engine(reminders)
+
+        def check():
+            while scheduler.pop_due(now) is not None:
+                pass
+            scheduler.next_due()
+
+        def snooze():
+            for reminder in sample:
+                reminder["snooze_until"] = now + timedelta(minutes=random.randint(1, 60))
+                scheduler.schedule(reminder)
+
+        def cancel():
+            for reminder in sample:
+                scheduler.cancel(reminder)
+
+        rows.append((name, timed(build), timed(check), timed(snooze), timed(cancel)))
+        for reminder in sample:
+            reminder.pop("snooze_until", None)
+    return rows
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]
+    print(f"{'reminders':>9}  {'engine':<13}{'build ms':>10}{'check ms':>10}"
+          f"{f'{OPERATIONS} snoozes':>15}{f'{OPERATIONS} cancels':>15}")
+    for count in sizes:
+        for name, build_ms, check_ms, snooze_ms, cancel_ms in bench(count):
+            print(f"{count:>9}  {name:<13}{build_ms:>10.2f}{check_ms:>10.3f}{snooze_ms:>15.2f}{cancel_ms:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
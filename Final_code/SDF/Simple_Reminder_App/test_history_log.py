@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Simple_Reminder_App.history_log import HistoryLog
+
+
+def record(i):
+    return {"title": f"Reminder {i}", "notified_at": "2030-01-07 09:00:00"}
+
+
+class HistoryLogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.active_file = os.path.join(self.tmp.name, "history.jsonl")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def log(self, **kwargs):
+        return HistoryLog(self.active_file, **kwargs)
+
+    def titles(self, records):
+        return [int(r["title"].split()[1]) for r in records]
+
+    def test_migrates_legacy_list(self):
+        legacy_file = os.path.join(self.tmp.name, "history.json")
+        with open(legacy_file, 'w') as f:
+            json.dump([record(0), record(1)], f)
+        log = self.log(legacy_file=legacy_file)
+        log.append(record(2))
+        self.assertFalse(os.path.exists(legacy_file))
+        self.assertTrue(os.path.exists(legacy_file + ".bak"))
+        self.assertEqual(self.titles(log.all_records()), [0, 1, 2])
+        self.assertTrue(log.segments()[0].endswith(".jsonl.gz"))
+
+    def test_rotates_by_size(self):
+        log = self.log(max_bytes=200)
+        for i in range(20):
+            log.append(record(i))
+        self.assertGreater(len(log.segments()), 1)
+        self.assertTrue(all(path.endswith(".gz") for path in log.segments()))
+        self.assertEqual(self.titles(log.all_records()), list(range(20)))
+
+    def test_rotates_by_age(self):
+        log = self.log()
+        log.append(record(0))
+        log.started_at = datetime.now() - timedelta(days=91)
+        log.append(record(1))
+        self.assertEqual(len(log.segments()), 1)
+        self.assertEqual(self.titles(log.recent(5)), [0, 1])
+
+    def test_recent_spans_segments(self):
+        log = self.log(max_bytes=200, compress=False)
+        for i in range(30):
+            log.append(record(i))
+        self.assertEqual(self.titles(log.recent(12)), list(range(18, 30)))
+        self.assertEqual(self.titles(log.recent(100)), list(range(30)))
+        self.assertEqual(log.recent(0), [])
+
+    def test_recent_reads_long_active_segment(self):
+        log = self.log(max_bytes=1 << 20)
+        for i in range(500):  # well past the first 8 KB tail chunk
+            log.append(record(i))
+        self.assertEqual(self.titles(log.recent(300)), list(range(200, 500)))
+
+    def test_torn_tail_then_append_then_reload(self):
+        log = self.log()
+        log.append(record(0))
+        log.append(record(1))
+        with open(self.active_file, 'ab') as f:
+            f.write(b'{"title": "Remin')  # crash mid-append
+
+        log = self.log()
+        self.assertEqual(self.titles(log.recent(5)), [0, 1])
+        log.append(record(2))
+        self.assertEqual(self.titles(self.log().recent(5)), [0, 1, 2])
+
+    def test_undecodable_last_line_is_dropped(self):
+        with open(self.active_file, 'w') as f:
+            f.write(json.dumps(record(0)) + "\n" + '{"title": \n')
+        self.assertEqual(self.titles(self.log().recent(5)), [0])
+
+    def test_only_line_torn(self):
+        with open(self.active_file, 'w') as f:
+            f.write('{"title": "Rem')
+        log = self.log()
+        self.assertEqual(log.recent(5), [])
+        self.assertIsNone(log.started_at)
+        log.append(record(0))
+        self.assertEqual(self.titles(self.log().all_records()), [0])
+
+    def test_started_at_survives_reopen(self):
+        with open(self.active_file, 'w') as f:
+            f.write(json.dumps(record(0)) + "\n")
+        self.assertEqual(self.log().started_at, datetime(2030, 1, 7, 9, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+from itertools import islice
+import os
+import sys
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Simple_Reminder_App.reminder_recurrence import (advance, choice_for, occurrences, parse_rule,
+                                                     rule_from_choice, upcoming)
+
+START = datetime(2030, 1, 7, 9, 0)  # a Monday
+
+
+def reminder(repeat, time=START, **fields):
+    return dict({"title": "Standup", "time": time, "repeat": repeat, "done": False}, **fields)
+
+
+def fire_times(r, start=START, days=120):
+    return list(occurrences(r, start, start + timedelta(days=days)))
+
+
+class ParseRuleTest(unittest.TestCase):
+    def test_round_trip(self):
+        text = "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;UNTIL=2030-03-01 09:00;COUNT=5"
+        self.assertEqual(parse_rule(text).text, text)
+        self.assertEqual(parse_rule("freq=weekly;byday=th,mo").text, "FREQ=WEEKLY;BYDAY=MO,TH")
+
+    def test_until_date_includes_the_whole_day(self):
+        self.assertEqual(parse_rule("FREQ=DAILY;UNTIL=2030-01-09").until, datetime(2030, 1, 9, 23, 59, 59, 999999))
+
+    def test_rejects_nonsense(self):
+        for text in ("FREQ=YEARLY", "FREQ=DAILY;INTERVAL=0", "FREQ=DAILY;BYDAY=MO", "FREQ=WEEKLY;BYDAY=XX",
+                     "FREQ=DAILY;COUNT=0", "FREQ=DAILY;UNTIL=soon", "FREQ=DAILY;COLOR=red", "DAILY"):
+            with self.assertRaises(ValueError, msg=text):
+                parse_rule(text)
+
+    def test_presets_and_choices(self):
+        self.assertEqual(rule_from_choice("Weekdays"), "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR")
+        self.assertIsNone(rule_from_choice("No repeat"))
+        self.assertEqual(choice_for(reminder("FREQ=DAILY")), "Daily")
+        self.assertEqual(choice_for(reminder(True)), "Daily")  # older files
+        self.assertEqual(choice_for(reminder("FREQ=DAILY;INTERVAL=3")), "FREQ=DAILY;INTERVAL=3")
+
+
+class OccurrencesTest(unittest.TestCase):
+    def test_one_off(self):
+        self.assertEqual(fire_times(reminder(False)), [START])
+        self.assertEqual(fire_times(reminder(False), START + timedelta(minutes=1)), [])
+        self.assertEqual(fire_times(reminder("FREQ=DAILY", done=True)), [])
+
+    def test_count_and_until(self):
+        self.assertEqual(fire_times(reminder("FREQ=DAILY;COUNT=3")),
+                         [START, START + timedelta(days=1), START + timedelta(days=2)])
+        self.assertEqual(fire_times(reminder("FREQ=HOURLY;UNTIL=2030-01-07 11:30")),
+                         [START, START + timedelta(hours=1), START + timedelta(hours=2)])
+
+    def test_overdue_occurrence_uses_up_one_count(self):
+        # Missed for a week: it fires once on catching up, then twice more
+        r = reminder("FREQ=DAILY;COUNT=3")
+        later = START + timedelta(days=7, hours=1)
+        self.assertEqual(fire_times(r, later), [START + timedelta(days=8), START + timedelta(days=9)])
+        self.assertEqual(fire_times(reminder("FREQ=DAILY;COUNT=1"), later), [])
+
+    def test_weekly_byday_and_interval(self):
+        r = reminder("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;COUNT=5")
+        self.assertEqual([t.day for t in fire_times(r)], [7, 10, 21, 24, 4])
+
+    def test_monthly_skips_short_months(self):
+        r = reminder("FREQ=MONTHLY;COUNT=4", time=datetime(2030, 1, 31, 9, 0))
+        self.assertEqual([t.month for t in fire_times(r, days=400)], [1, 3, 5, 7])
+
+    def test_snoozed_occurrence_comes_first(self):
+        r = reminder("FREQ=DAILY", snooze_until=START + timedelta(minutes=10))
+        self.assertEqual(fire_times(r, days=1), [START + timedelta(minutes=10), START + timedelta(days=1)])
+
+    def test_upcoming_merges_in_time_order(self):
+        a = reminder("FREQ=DAILY")
+        b = reminder("FREQ=HOURLY", time=START + timedelta(minutes=30), title="Water")
+        merged = list(islice(upcoming([a, b], START), 4))
+        self.assertEqual([t for t, _ in merged], [START + timedelta(minutes=m) for m in (0, 30, 90, 150)])
+        self.assertEqual([r["title"] for _, r in merged], ["Standup", "Water", "Water", "Water"])
+
+
+class AdvanceTest(unittest.TestCase):
+    def test_fired_occurrence_uses_up_count(self):
+        r = reminder("FREQ=DAILY;COUNT=2")
+        self.assertTrue(advance(r, START))
+        self.assertEqual((r["time"], r["repeat"]), (START + timedelta(days=1), "FREQ=DAILY;COUNT=1"))
+        self.assertFalse(advance(r, r["time"]))
+
+    def test_skipping_ahead_keeps_count(self):
+        r = reminder("FREQ=WEEKLY;COUNT=2")
+        self.assertTrue(advance(r, START + timedelta(days=20), fired=False))
+        self.assertEqual((r["time"], r["repeat"]), (START + timedelta(weeks=3), "FREQ=WEEKLY;COUNT=2"))
+
+    def test_series_end(self):
+        self.assertFalse(advance(reminder(False), START))
+        r = reminder("FREQ=DAILY;UNTIL=2030-01-07")
+        self.assertFalse(advance(r, START))
+        self.assertEqual(r["time"], START)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta
+import os
+import random
+import sys
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Simple_Reminder_App.reminder_scheduler import HeapScheduler, TimerWheelScheduler, create_scheduler
+
+START = datetime(2030, 1, 7, 9, 0)
+
+
+def reminder(title, minutes, **fields):
+    return dict({"title": title, "time": START + timedelta(minutes=minutes), "done": False}, **fields)
+
+
+def drain(scheduler, now):
+    """Titles of every reminder due at `now`, in firing order"""
+    fired = []
+    while True:
+        due = scheduler.pop_due(now)
+        if due is None:
+            return fired
+        fired.append(due["title"])
+
+
+class SchedulerContract:
+    """Behaviour every scheduler engine must share; subclasses implement make()"""
+
+    def make(self, reminders):
+        raise NotImplementedError
+
+    def test_fires_in_due_order(self):
+        scheduler = self.make([reminder("c", 30), reminder("a", 10), reminder("b", 20)])
+        self.assertEqual(scheduler.next_due(), START + timedelta(minutes=10))
+        self.assertEqual(drain(scheduler, START + timedelta(minutes=5)), [])
+        self.assertEqual(drain(scheduler, START + timedelta(minutes=20)), ["a", "b"])
+        self.assertEqual(len(scheduler), 1)
+        self.assertEqual(drain(scheduler, START + timedelta(hours=1)), ["c"])
+        self.assertIsNone(scheduler.next_due())
+
+    def test_ties_fire_in_schedule_order(self):
+        scheduler = self.make([reminder(title, 10) for title in "xyz"])
+        self.assertEqual(drain(scheduler, START + timedelta(minutes=10)), ["x", "y", "z"])
+
+    def test_done_reminders_are_not_scheduled(self):
+        scheduler = self.make([reminder("a", 10, done=True), reminder("b", 20)])
+        self.assertEqual(len(scheduler), 1)
+        self.assertEqual(drain(scheduler, START + timedelta(hours=1)), ["b"])
+
+    def test_snooze_reschedules(self):
+        a, b = reminder("a", 10), reminder("b", 20)
+        scheduler = self.make([a, b])
+        a["snooze_until"] = START + timedelta(minutes=30)
+        scheduler.schedule(a)
+        self.assertEqual(len(scheduler), 2)
+        self.assertEqual(drain(scheduler, START + timedelta(minutes=25)), ["b"])
+        self.assertEqual(drain(scheduler, START + timedelta(minutes=30)), ["a"])
+
+    def test_cancel(self):
+        a, b = reminder("a", 10), reminder("b", 20)
+        scheduler = self.make([a, b])
+        scheduler.cancel(a)
+        scheduler.cancel(a)  # cancelling twice is harmless
+        self.assertEqual(scheduler.next_due(), b["time"])
+        self.assertEqual(drain(scheduler, START + timedelta(hours=1)), ["b"])
+
+
+class HeapSchedulerTest(SchedulerContract, unittest.TestCase):
+    def make(self, reminders):
+        return HeapScheduler(reminders)
+
+    def test_dead_entries_are_compacted(self):
+        reminders = [reminder(str(i), i) for i in range(10)]
+        scheduler = self.make(reminders)
+        for _ in range(20):
+            for r in reminders:
+                scheduler.schedule(r)
+        self.assertLessEqual(len(scheduler.heap), 2 * len(reminders) + 64)
+        self.assertEqual(drain(scheduler, START + timedelta(hours=1)), [str(i) for i in range(10)])
+
+    def test_auto_engine_picks_heap_for_small_lists(self):
+        self.assertIsInstance(create_scheduler("auto", [reminder("a", 1)]), HeapScheduler)
+
+
+class TimerWheelSchedulerTest(SchedulerContract, unittest.TestCase):
+    def make(self, reminders):
+        return TimerWheelScheduler(reminders, now=START)
+
+    def test_far_future_reminders_cascade_down(self):
+        # One per wheel level, plus one in the overflow bucket
+        offsets = [timedelta(seconds=30), timedelta(minutes=30), timedelta(days=2), timedelta(days=100),
+                   timedelta(days=400)]
+        reminders = [dict(reminder(str(i), 0), time=START + offset) for i, offset in enumerate(offsets)]
+        scheduler = self.make(reminders)
+        for i, offset in enumerate(offsets):
+            self.assertEqual(scheduler.next_due(), START + offset)
+            self.assertEqual(drain(scheduler, START + offset - timedelta(seconds=1)), [])
+            self.assertEqual(drain(scheduler, START + offset), [str(i)])
+
+    def test_overdue_reminders_fire_at_once(self):
+        scheduler = self.make([reminder("late", -60)])
+        self.assertEqual(drain(scheduler, START), ["late"])
+
+    def test_matches_heap_order(self):
+        rng = random.Random(7)
+        reminders = [reminder(str(i), 0) for i in range(500)]
+        for r in reminders:
+            r["time"] = START + timedelta(seconds=rng.randrange(0, 90 * 86400, 15))
+        heap, wheel = HeapScheduler(reminders), self.make(reminders)
+
+        now, heap_fired, wheel_fired = START, [], []
+        while len(heap):
+            now += timedelta(seconds=rng.choice([1, 59, 3600, 86400, 10 * 86400]))
+            # Snooze or cancel a few pending reminders between ticks
+            for r in rng.sample(reminders, 3):
+                if rng.random() < 0.2:
+                    heap.cancel(r)
+                    wheel.cancel(r)
+                else:
+                    r["snooze_until"] = now + timedelta(seconds=rng.randrange(1, 7 * 86400))
+                    heap.schedule(r)
+                    wheel.schedule(r)
+            heap_fired += drain(heap, now)
+            wheel_fired += drain(wheel, now)
+            self.assertEqual(wheel_fired, heap_fired)
+            self.assertEqual(wheel.next_due(), heap.next_due())
+        self.assertEqual(len(wheel), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+from datetime import datetime
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Ensure the parent directory is in sys.path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Simple_Reminder_App.reminder_store import ReminderStore, from_record, iter_json_array, to_record
+
+
+def reminder(reminder_id, title="Call", minute=0):
+    return {"id": reminder_id, "title": title, "time": datetime(2030, 1, 7, 9, minute),
+            "repeat": False, "done": False, "snooze_delay": 5}
+
+
+class ReminderStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self.tmp.name, "reminders.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def store(self, **kwargs):
+        store = ReminderStore(self.data_file, **kwargs)
+        return store, [from_record(record) for record in store.load()]
+
+    def test_round_trip_record(self):
+        r = dict(reminder(1), snooze_until=datetime(2030, 1, 7, 9, 5, 30), _notifying=True)
+        record = to_record(r)
+        self.assertNotIn("_notifying", record)
+        self.assertEqual(record["time"], "2030-01-07 09:00")
+        del r["_notifying"]
+        self.assertEqual(from_record(json.loads(json.dumps(record))), r)
+
+    def test_log_replays_puts_and_deletes(self):
+        store, reminders = self.store()
+        a, b = reminder(1), reminder(2, "Email")
+        reminders += [a, b]
+        for r in reminders:
+            store.mark_dirty(r)
+        store.flush(reminders)
+        a["title"] = "Call back"
+        store.mark_dirty(a)
+        store.mark_deleted(b)
+        reminders.remove(b)
+        store.flush(reminders)
+
+        store, loaded = self.store()
+        self.assertEqual([(r["id"], r["title"]) for r in loaded], [(1, "Call back")])
+        self.assertEqual(store.logged, 4)
+
+    def test_flush_without_changes_writes_nothing(self):
+        store, reminders = self.store()
+        store.flush(reminders)
+        self.assertFalse(os.path.exists(store.log_file))
+
+    def test_torn_tail_then_flush_then_reload(self):
+        store, reminders = self.store()
+        reminders.append(reminder(1))
+        store.mark_dirty(reminders[0])
+        store.flush(reminders)
+        with open(store.log_file, 'ab') as log:
+            log.write(b'{"op": "put", "reminder": {"id": 2')  # crash mid-append
+
+        store, reminders = self.store()
+        self.assertEqual([r["id"] for r in reminders], [1])
+        reminders.append(reminder(3, "Email"))
+        store.mark_dirty(reminders[-1])
+        store.flush(reminders)
+
+        store, reminders = self.store()
+        self.assertEqual([r["id"] for r in reminders], [1, 3])
+        self.assertEqual(store.logged, 2)
+
+    def test_compaction_folds_log_into_snapshot(self):
+        store, reminders = self.store(compact_every=3)
+        for i in range(3):
+            reminders.append(reminder(i, minute=i))
+            store.mark_dirty(reminders[-1])
+            store.flush(reminders)
+        self.assertEqual(os.path.getsize(store.log_file), 0)
+        with open(self.data_file) as f:
+            self.assertEqual([record["id"] for record in json.load(f)], [0, 1, 2])
+        self.assertEqual([r["id"] for r in self.store()[1]], [0, 1, 2])
+
+
+class IterJsonArrayTest(unittest.TestCase):
+    def items(self, text, chunk_size=4):
+        return list(iter_json_array(io.StringIO(text), chunk_size))
+
+    def test_matches_json_load_for_every_chunk_size(self):
+        data = [{"title": "Call", "tags": ["a", "b"]}, 1.5, -20, "x, y]", [], None, True, 12345e-2]
+        text = json.dumps(data, indent=1)
+        for chunk_size in range(1, len(text) + 2):
+            self.assertEqual(self.items(text, chunk_size), data, chunk_size)
+
+    def test_number_split_across_chunks(self):
+        self.assertEqual(self.items("[1.5, 10]", chunk_size=2), [1.5, 10])
+        self.assertEqual(self.items("[123456]", chunk_size=3), [123456])
+
+    def test_empty_lists(self):
+        self.assertEqual(self.items("[]"), [])
+        self.assertEqual(self.items("  [ \n ] "), [])
+
+    def test_malformed_input(self):
+        for text in ("", "{}", '[{"a": 1} {"b": 2}]', '[{"a": 1},', '[{"a": '):
+            with self.assertRaises(ValueError, msg=text):
+                self.items(text)
+
+    def test_from_record_defaults(self):
+        r = from_record({"title": "Old", "time": "2030-01-07 09:00", "snooze_until": "garbage", "_notifying": True})
+        self.assertEqual(r, {"title": "Old", "time": datetime(2030, 1, 7, 9, 0), "repeat": False,
+                             "done": False, "snooze_delay": 5})
+
+
+if __name__ == "__main__":
+    unittest.main()